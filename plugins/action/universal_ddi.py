@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Infoblox, Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import contextlib
+import importlib
+import inspect
+import io
+import json
+import os
+import traceback
+
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible.plugins.action import ActionBase
+from ansible.utils.display import Display
+from ansible.utils.vars import merge_hash
+from ansible.vars.clean import remove_internal_keys
+
+try:
+    from ansible.module_utils.common.json import Direction, get_module_encoder
+except ImportError:
+    # ansible-core < 2.19 has no serialization profiles
+    get_module_encoder = None
+
+display = Display()
+
+_COLLECTION = "infoblox.universal_ddi"
+_MODULES_PACKAGE = "ansible_collections.infoblox.universal_ddi.plugins.modules"
+_PROFILE = "legacy"
+
+
+class ActionModule(ActionBase):
+    """
+    Runs the modules of the collection in the controller process when they target the controller itself, if enabled
+    with the variable C(infoblox_in_process) or the environment variable E(INFOBLOX_IN_PROCESS).
+
+    Modules of the collection only call the Universal DDI API, so running them with the local connection does not need
+    a separate Python process per task or loop item. Running them in process saves importing the API client for every
+    loop item and lets all the items of a loop share the connection pool of the API client.
+
+    A module run in process uses the Python interpreter and the API client of the controller, not
+    C(ansible_python_interpreter). The module is run as usual if in process execution is not enabled, if the connection
+    is not local, with become or async, or if the API client cannot be imported on the controller.
+    """
+
+    _supports_check_mode = True
+    _supports_async = True
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp  # tmp no longer has any effect
+
+        wrap_async = self._task.async_val and not self._connection.has_native_async
+
+        module = None
+        if not wrap_async and self._can_run_in_process(task_vars):
+            module = self._import_module()
+
+        if module is not None:
+            result = merge_hash(result, self._run_in_process(module, task_vars))
+        else:
+            result = merge_hash(result, self._execute_module(task_vars=task_vars, wrap_async=wrap_async))
+
+        if not wrap_async:
+            # remove a temporary path we created
+            self._remove_tmp_path(self._connection._shell.tmpdir)
+
+        return result
+
+    @property
+    def _module_name(self):
+        # The resolved action is this action plugin, the module has the name the task was written with
+        return self._task.action.rsplit(".", 1)[-1]
+
+    def _can_run_in_process(self, task_vars):
+        enabled = (task_vars or {}).get("infoblox_in_process", os.environ.get("INFOBLOX_IN_PROCESS", False))
+        if not boolean(enabled, strict=False):
+            return False
+        if self._connection.transport not in ("local", "ansible.builtin.local"):
+            return False
+        return not self._play_context.become
+
+    def _import_module(self):
+        """
+        Import the module on the controller.
+
+        :return: The Python module, or None if it or the API client cannot be imported
+        """
+        try:
+            module = importlib.import_module(f"{_MODULES_PACKAGE}.{self._module_name}")
+            modules_utils = importlib.import_module(
+                "ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules"
+            )
+        except Exception:
+            display.vvv(f"{_COLLECTION}: cannot import {self._module_name} on the controller: {traceback.format_exc()}")
+            return None
+        if not modules_utils.HAS_UNIVERSAL_DDI_CLIENT:
+            display.vvv(f"{_COLLECTION}: universal_ddi_client is not installed on the controller")
+            return None
+        return module
+
+    def _run_in_process(self, module, task_vars):
+        """
+        Run a module in the controller process, as it would be run on a target.
+
+        :return: The result of the module
+        """
+        from ansible.module_utils import basic
+        from ansible.module_utils.common import warnings
+
+        module_args = self._task.args.copy()
+        self._update_module_args(self._module_name, module_args, task_vars)
+
+        environment = {}
+        self._compute_environment_string(environment)
+
+        encoder = get_module_encoder(_PROFILE, Direction.CONTROLLER_TO_MODULE) if get_module_encoder else None
+        args = json.dumps({"ANSIBLE_MODULE_ARGS": module_args}, cls=encoder).encode()
+
+        display.vvv(f"{_COLLECTION}: running {self._module_name} in the controller process")
+
+        saved = (basic._ANSIBLE_ARGS, getattr(basic, "_ANSIBLE_PROFILE", None), os.environ.copy())
+        stdout = io.StringIO()
+        rc = 0
+        try:
+            basic._ANSIBLE_ARGS = args
+            basic._ANSIBLE_PROFILE = _PROFILE
+            os.environ.update({k: str(v) for k, v in environment.items()})
+            # Warnings and deprecations are collected globally until the module exits
+            for messages in (
+                getattr(warnings, "_global_warnings", None),
+                getattr(warnings, "_global_deprecations", None),
+            ):
+                if messages is not None:
+                    messages.clear()
+
+            with contextlib.redirect_stdout(stdout):
+                try:
+                    module.main()
+                except SystemExit as e:
+                    rc = e.code or 0
+        except Exception as e:
+            return dict(failed=True, msg=f"Module failed: {e}", exception=traceback.format_exc())
+        finally:
+            basic._ANSIBLE_ARGS, basic._ANSIBLE_PROFILE, environ = saved
+            os.environ.clear()
+            os.environ.update(environ)
+
+        res = dict(rc=rc, stdout=stdout.getvalue(), stderr="")
+        if "profile" in inspect.signature(self._parse_returned_data).parameters:
+            data = self._parse_returned_data(res, _PROFILE)
+        else:
+            data = self._parse_returned_data(res)
+        remove_internal_keys(data)
+        return data
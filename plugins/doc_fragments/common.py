@@ -19,4 +19,36 @@ options:
         type: str
         aliases: [ infoblox_portal_url, csp_url ]
         default: 'https://csp.infoblox.com'
+
+    pool_size:
+        description:
+          - The maximum number of keep-alive connections kept open to the portal.
+          - Connections are shared by all API calls made from the same process, so concurrent requests do not have to set up a new TLS session each time.
+          - If not set, the environment variable E(INFOBLOX_POOL_SIZE) will be used.
+        type: int
+        default: 10
+
+    trace:
+        description:
+          - Record a compact trace of every API request made by the module and return it as C(api_trace).
+          - Each record contains the HTTP method, the request path, the response status, the response size in bytes and the latency in milliseconds. Request and response bodies are never recorded.
+          - If not set, the environment variable E(INFOBLOX_TRACE) will be used.
+        type: bool
+        default: false
+
+    max_retries:
+        description:
+          - The maximum number of times an API request is retried when the portal rate limits it (HTTP 429), is temporarily unavailable (HTTP 500, 502, 503 or 504) or cannot be reached.
+          - Retries wait for the delay given by the C(Retry-After) header of the response if any, otherwise for an exponentially growing random delay.
+          - Requests creating objects are only retried when they were rate limited or could not be sent, so that objects are never created twice.
+          - If not set, the environment variable E(INFOBLOX_MAX_RETRIES) will be used.
+        type: int
+        default: 5
+
+    rate_limit:
+        description:
+          - The maximum average number of API requests per second made by the module, including retries. Requests are delayed to stay under the limit instead of being rejected by the portal.
+          - The limit applies to each module run. When running a play with several forks, divide the rate allowed by the portal by the number of forks.
+          - If not set, the environment variable E(INFOBLOX_RATE_LIMIT) will be used. There is no limit if neither is set.
+        type: float
 """
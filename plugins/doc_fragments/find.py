@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Infoblox
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+class ModuleDocFragment:
+    DOCUMENTATION = r"""
+options:
+    assume_absent:
+        description:
+          - Create the object without looking it up first, as it is known not to exist, e.g. when many new objects are created in a loop.
+          - The module fails if the object exists. Only used if O(state=present).
+        type: bool
+        default: false
+"""
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Infoblox
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+class ModuleDocFragment:
+    DOCUMENTATION = r"""
+options:
+    dest:
+        description:
+          - Path of a file on the target to write the objects to, instead of returning them in RV(ignore:objects).
+          - Objects are written in JSON Lines format, one object per line, as the result pages are fetched, so memory usage does not grow with the number of objects.
+          - The file is gzip compressed if the path ends with C(.gz).
+          - The module returns the absolute path of the file in RV(ignore:dest) and the number of objects written in RV(ignore:count).
+        type: path
+    fields:
+        description:
+          - The names of the fields to return for each object. If not set, all fields are returned.
+          - Only the requested fields are downloaded from the API. The objects are returned as they are received, without default values for missing fields.
+          - Does not apply when an object is looked up by its O(id).
+        type: list
+        elements: str
+    max_concurrency:
+        description:
+          - The maximum number of result pages fetched at the same time.
+          - The first page is always fetched on its own, further pages are only requested if it is full.
+          - Set to V(1) to fetch pages one after the other.
+        type: int
+        default: 4
+"""
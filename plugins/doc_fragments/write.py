@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Infoblox
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+class ModuleDocFragment:
+    DOCUMENTATION = r"""
+options:
+    return_object:
+        description:
+          - The object returned in RV(ignore:object) after it was created or updated.
+          - With V(full), the object is returned with the values it inherits. It is read again after the write if the response of the API does not hold it.
+          - With V(minimal), the object is returned as the API responded to the write, without inherited values, and is never read again. This saves API calls when the returned object is not used, e.g. in loops over many objects.
+        type: str
+        choices:
+          - minimal
+          - full
+        default: full
+"""
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Infoblox, Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+name: infra_hosts
+author: Infoblox Inc. (@infobloxopen)
+short_description: Universal DDI Infrastructure Hosts inventory source
+version_added: 1.3.0
+description:
+  - Gets the Infrastructure Hosts of Universal DDI, e.g. NIOS-X servers, as inventory hosts.
+  - Hosts are grouped by their tags, by the types of the services running on them and by their location.
+  - The fields of the hosts are set as host variables, with the services running on them in C(services). Fields whose name is reserved by Ansible are prefixed with C(host_), e.g. C(host_tags).
+  - The hosts and the services are read at the same time, each with several result pages fetched at the same time.
+  - The inventory can be cached with an inventory cache plugin, e.g. C(ansible.builtin.jsonfile), for the time set by O(cache_timeout).
+  - Uses a YAML configuration file whose name ends with C(infra_hosts.yml) or C(infra_hosts.yaml).
+requirements:
+  - universal_ddi_client
+options:
+  plugin:
+    description:
+      - The name of this plugin, it should always be set to V(infoblox.universal_ddi.infra_hosts) for this plugin to recognize it as its own.
+    type: str
+    required: true
+    choices:
+      - infoblox.universal_ddi.infra_hosts
+  portal_url:
+    description:
+      - The Infoblox Cloud Services Portal (CSP) URL.
+    type: str
+    default: https://csp.infoblox.com
+    env:
+      - name: INFOBLOX_PORTAL_URL
+  portal_key:
+    description:
+      - The API token for authentication against Infoblox BloxOne API.
+    type: str
+    required: true
+    env:
+      - name: INFOBLOX_PORTAL_KEY
+  max_retries:
+    description:
+      - The maximum number of times an API request is retried when the portal rate limits it or is temporarily unavailable.
+    type: int
+    default: 5
+    env:
+      - name: INFOBLOX_MAX_RETRIES
+  filters:
+    description:
+      - Filter dict to filter the hosts.
+      - Mutually exclusive with O(filter_query).
+    type: dict
+  filter_query:
+    description:
+      - Filter query to filter the hosts.
+    type: str
+  tag_filters:
+    description:
+      - Filter dict to filter the hosts by tags.
+      - Mutually exclusive with O(tag_filter_query).
+    type: dict
+  tag_filter_query:
+    description:
+      - Filter query to filter the hosts by tags.
+    type: str
+  hostnames:
+    description:
+      - The fields of the hosts used as inventory host name, in order of preference. The first field with a value is used.
+    type: list
+    elements: str
+    default: [display_name, ip_address, id]
+  group_by:
+    description:
+      - The groups the hosts are added to.
+      - V(tags) adds the hosts to a C(tag_<key>_<value>) group for each of their tags.
+      - V(services) adds the hosts to a C(service_<type>) group for each type of service running on them, e.g. C(service_dns).
+      - V(location) adds the hosts to a C(location_<id>) group for their location.
+    type: list
+    elements: str
+    choices:
+      - tags
+      - services
+      - location
+    default: [tags, services, location]
+  max_concurrency:
+    description:
+      - The maximum number of result pages fetched at the same time, for the hosts and for the services.
+    type: int
+    default: 4
+extends_documentation_fragment:
+  - constructed
+  - inventory_cache
+"""  # noqa: E501
+
+EXAMPLES = r"""
+# universal_ddi.infra_hosts.yml
+plugin: infoblox.universal_ddi.infra_hosts
+portal_url: https://csp.infoblox.com
+# The API key is read from the INFOBLOX_PORTAL_KEY environment variable
+
+# Only the hosts of a site, cached for an hour
+plugin: infoblox.universal_ddi.infra_hosts
+tag_filters:
+  location: site-1
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: /tmp/universal_ddi_inventory
+cache_timeout: 3600
+
+# Use the NAT address to reach the hosts, and group them by their type
+plugin: infoblox.universal_ddi.infra_hosts
+compose:
+  ansible_host: nat_ip | default(ip_address)
+keyed_groups:
+  - key: host_type | string
+    prefix: type
+"""  # noqa: E501
+
+from ansible.errors import AnsibleError
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
+from ansible.vars.reserved import is_reserved_name
+from ansible_collections.infoblox.universal_ddi.plugins.plugin_utils.inventory import (
+    filter_query,
+    inventory_client,
+    list_concurrently,
+)
+
+try:
+    from infra_mgmt import HostsApi, ServicesApi
+except ImportError:
+    pass  # Handled by inventory_client
+
+# Fields read for the services, to find the hosts they run on
+_SERVICE_FIELDS = ["id", "name", "service_type", "configs"]
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
+    NAME = "infoblox.universal_ddi.infra_hosts"
+
+    def verify_file(self, path):
+        if super(InventoryModule, self).verify_file(path):
+            return path.endswith(("infra_hosts.yml", "infra_hosts.yaml"))
+        return False
+
+    def fetch(self):
+        """
+        Read the hosts and the services running on them.
+
+        :return: Dictionary with the list of hosts and the list of services, as returned by the API
+        """
+        for exclusive in (("filters", "filter_query"), ("tag_filters", "tag_filter_query")):
+            if all(self.get_option(o) for o in exclusive):
+                raise AnsibleError(f"{exclusive[0]} and {exclusive[1]} are mutually exclusive")
+
+        client = inventory_client(self)
+        host_filters = dict(
+            raw=True,
+            filter=filter_query(self.get_option("filters"), self.get_option("filter_query")),
+            tfilter=filter_query(self.get_option("tag_filters"), self.get_option("tag_filter_query")),
+        )
+        return list_concurrently(
+            dict(
+                hosts=(HostsApi(client).list, host_filters),
+                services=(ServicesApi(client).list, dict(fields=_SERVICE_FIELDS)),
+            ),
+            self.get_option("max_concurrency"),
+        )
+
+    def hostname_of(self, host):
+        for field in self.get_option("hostnames"):
+            if host.get(field):
+                return str(host[field])
+        return None
+
+    def add_group(self, name, hostname):
+        group = self.inventory.add_group(self._sanitize_group_name(name))
+        self.inventory.add_child(group, hostname)
+
+    def populate(self, data):
+        services_of = {}
+        for service in data["services"]:
+            for config in service.get("configs") or []:
+                if config.get("host_id"):
+                    services_of.setdefault(config["host_id"], []).append(
+                        dict(id=service.get("id"), name=service.get("name"), service_type=service.get("service_type"))
+                    )
+
+        group_by = self.get_option("group_by")
+        strict = self.get_option("strict")
+        for host in data["hosts"]:
+            hostname = self.hostname_of(host)
+            if hostname is None:
+                continue
+            self.inventory.add_host(hostname)
+
+            host_vars = dict(host, services=services_of.get(host.get("id"), []))
+            for key, value in host_vars.items():
+                # e.g. tags is a playbook keyword
+                self.inventory.set_variable(hostname, f"host_{key}" if is_reserved_name(key) else key, value)
+            if host.get("ip_address"):
+                self.inventory.set_variable(hostname, "ansible_host", host["ip_address"])
+
+            if "tags" in group_by:
+                for key, value in (host.get("tags") or {}).items():
+                    self.add_group(f"tag_{key}_{value}", hostname)
+            if "services" in group_by:
+                for service_type in sorted(set(s["service_type"] for s in host_vars["services"] if s["service_type"])):
+                    self.add_group(f"service_{service_type}", hostname)
+            if "location" in group_by and host.get("location_id"):
+                self.add_group(f"location_{host['location_id'].rsplit('/', 1)[-1]}", hostname)
+
+            self._set_composite_vars(self.get_option("compose"), host_vars, hostname, strict=strict)
+            self._add_host_to_composed_groups(self.get_option("groups"), host_vars, hostname, strict=strict)
+            self._add_host_to_keyed_groups(self.get_option("keyed_groups"), host_vars, hostname, strict=strict)
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(InventoryModule, self).parse(inventory, loader, path, cache)
+        self._read_config_data(path)
+
+        cache_key = self.get_cache_key(path)
+        # cache is False when the inventory is refreshed, e.g. by meta: refresh_inventory
+        use_cache = self.get_option("cache") and cache
+        update_cache = self.get_option("cache") and not cache
+
+        data = None
+        if use_cache:
+            try:
+                data = self._cache[cache_key]
+            except KeyError:
+                update_cache = True
+        if data is None:
+            data = self.fetch()
+        if update_cache:
+            self._cache[cache_key] = data
+
+        self.populate(data)
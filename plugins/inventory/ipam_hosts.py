@@ -0,0 +1,394 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Infoblox, Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+name: ipam_hosts
+author: Infoblox Inc. (@infobloxopen)
+short_description: Universal DDI IPAM Hosts inventory source
+version_added: 1.3.0
+description:
+  - Gets the IPAM Hosts of Universal DDI as inventory hosts, with their addresses.
+  - The hosts can be enriched with the fixed addresses reserved for their addresses and with the names of the DNS A and AAAA records of their addresses.
+  - Hosts are grouped by the IP spaces and subnets of their addresses and by their tags.
+  - The hosts, fixed addresses, DNS records and subnets are read at the same time, each with several result pages fetched at the same time, and are joined locally.
+  - The fields of the hosts are set as host variables, along with C(fixed_addresses), C(dns_names) and C(subnets). Fields whose name is reserved by Ansible are prefixed with C(host_), e.g. C(host_tags).
+  - The inventory can be cached with an inventory cache plugin, e.g. C(ansible.builtin.jsonfile). With O(incremental), the cached inventory is brought up to date by reading only the objects changed since it was read.
+  - Uses a YAML configuration file whose name ends with C(ipam_hosts.yml) or C(ipam_hosts.yaml).
+requirements:
+  - universal_ddi_client
+options:
+  plugin:
+    description:
+      - The name of this plugin, it should always be set to V(infoblox.universal_ddi.ipam_hosts) for this plugin to recognize it as its own.
+    type: str
+    required: true
+    choices:
+      - infoblox.universal_ddi.ipam_hosts
+  portal_url:
+    description:
+      - The Infoblox Cloud Services Portal (CSP) URL.
+    type: str
+    default: https://csp.infoblox.com
+    env:
+      - name: INFOBLOX_PORTAL_URL
+  portal_key:
+    description:
+      - The API token for authentication against Infoblox BloxOne API.
+    type: str
+    required: true
+    env:
+      - name: INFOBLOX_PORTAL_KEY
+  max_retries:
+    description:
+      - The maximum number of times an API request is retried when the portal rate limits it or is temporarily unavailable.
+    type: int
+    default: 5
+    env:
+      - name: INFOBLOX_MAX_RETRIES
+  filters:
+    description:
+      - Filter dict to filter the hosts.
+      - Mutually exclusive with O(filter_query).
+    type: dict
+  filter_query:
+    description:
+      - Filter query to filter the hosts.
+    type: str
+  tag_filters:
+    description:
+      - Filter dict to filter the hosts by tags.
+      - Mutually exclusive with O(tag_filter_query).
+    type: dict
+  tag_filter_query:
+    description:
+      - Filter query to filter the hosts by tags.
+    type: str
+  hostnames:
+    description:
+      - The fields of the hosts used as inventory host name, in order of preference. The first field with a value is used.
+      - V(address) is the first address of the host.
+    type: list
+    elements: str
+    default: [name, address]
+  fixed_addresses:
+    description:
+      - Add the fixed addresses of the addresses of the hosts to the host variable C(fixed_addresses).
+    type: bool
+    default: true
+  dns_names:
+    description:
+      - Add the names of the DNS A and AAAA records of the addresses of the hosts to the host variable C(dns_names).
+    type: bool
+    default: true
+  group_by:
+    description:
+      - The groups the hosts are added to.
+      - V(space) adds the hosts to a C(space_<id>) group for the IP space of each of their addresses.
+      - V(subnet) adds the hosts to a C(subnet_<address>_<cidr>) group for the subnet of each of their addresses. The subnets are also added to the host variable C(subnets).
+      - V(tags) adds the hosts to a C(tag_<key>_<value>) group for each of their tags.
+    type: list
+    elements: str
+    choices:
+      - space
+      - subnet
+      - tags
+    default: [space, tags]
+  incremental:
+    description:
+      - Update the cached inventory with the objects created, updated or deleted since it was read, instead of reading all objects again.
+      - Only the changed objects and the identifiers of all objects are read. The cached inventory is updated every time the inventory is loaded, so set a long O(cache_timeout).
+      - Requires O(cache).
+    type: bool
+    default: false
+  max_concurrency:
+    description:
+      - The maximum number of result pages fetched at the same time, for each type of object.
+    type: int
+    default: 4
+extends_documentation_fragment:
+  - constructed
+  - inventory_cache
+"""  # noqa: E501
+
+EXAMPLES = r"""
+# universal_ddi.ipam_hosts.yml
+plugin: infoblox.universal_ddi.ipam_hosts
+portal_url: https://csp.infoblox.com
+# The API key is read from the INFOBLOX_PORTAL_KEY environment variable
+group_by:
+  - space
+  - subnet
+  - tags
+
+# Keep the inventory in a cache, only reading the changes when it is loaded
+plugin: infoblox.universal_ddi.ipam_hosts
+fixed_addresses: false
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: /tmp/universal_ddi_inventory
+cache_timeout: 86400
+incremental: true
+
+# Use the first DNS name to reach the hosts
+plugin: infoblox.universal_ddi.ipam_hosts
+compose:
+  ansible_host: dns_names | first | default(addresses[0].address)
+"""  # noqa: E501
+
+import ipaddress
+from datetime import datetime, timedelta, timezone
+
+from ansible.errors import AnsibleError
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
+from ansible.vars.reserved import is_reserved_name
+from ansible_collections.infoblox.universal_ddi.plugins.plugin_utils.inventory import (
+    filter_query,
+    inventory_client,
+    list_concurrently,
+)
+
+try:
+    from dns_data import RecordApi
+    from ipam import FixedAddressApi, IpamHostApi, SubnetApi
+except ImportError:
+    pass  # Handled by inventory_client
+
+# Fields read for the objects joined with the hosts
+_FIXED_ADDRESS_FIELDS = [
+    "id",
+    "address",
+    "ip_space",
+    "name",
+    "hostname",
+    "match_type",
+    "match_value",
+    "comment",
+    "tags",
+]
+_RECORD_FIELDS = ["id", "absolute_name_spec", "rdata"]
+_SUBNET_FIELDS = ["id", "address", "cidr", "space", "name"]
+
+# Changes are read from this long before the previous read, in case the clocks of the controller and the portal differ
+_CLOCK_SKEW = timedelta(minutes=5)
+
+
+def _and(query, other):
+    return f"({query}) and {other}" if query else other
+
+
+def _normalize_address(address):
+    try:
+        return ipaddress.ip_address(address).compressed
+    except ValueError:
+        return address
+
+
+def _last(id):
+    return id.rsplit("/", 1)[-1]
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
+    NAME = "infoblox.universal_ddi.ipam_hosts"
+
+    def verify_file(self, path):
+        if super(InventoryModule, self).verify_file(path):
+            return path.endswith(("ipam_hosts.yml", "ipam_hosts.yaml"))
+        return False
+
+    def requests(self, client):
+        """
+        The list API calls reading the objects of the inventory.
+
+        :return: Dictionary of the names of the object types and (list_func, kwargs) tuples
+        """
+        requests = dict(
+            hosts=(
+                IpamHostApi(client).list,
+                dict(
+                    raw=True,
+                    filter=filter_query(self.get_option("filters"), self.get_option("filter_query")),
+                    tfilter=filter_query(self.get_option("tag_filters"), self.get_option("tag_filter_query")),
+                ),
+            )
+        )
+        if self.get_option("fixed_addresses"):
+            requests["fixed_addresses"] = (FixedAddressApi(client).list, dict(fields=_FIXED_ADDRESS_FIELDS))
+        if self.get_option("dns_names"):
+            requests["records"] = (
+                RecordApi(client).list,
+                dict(fields=_RECORD_FIELDS, filter="type=='A' or type=='AAAA'"),
+            )
+        if "subnet" in self.get_option("group_by"):
+            requests["subnets"] = (SubnetApi(client).list, dict(fields=_SUBNET_FIELDS))
+        return requests
+
+    def fetch(self, data=None):
+        """
+        Read the objects of the inventory.
+
+        :param data: The objects read before. If set, only the objects changed since are read, along with the
+            identifiers of all objects to drop the deleted ones.
+        :return: Dictionary with the time the objects were read and, for each type of object, the objects by id
+        """
+        for exclusive in (("filters", "filter_query"), ("tag_filters", "tag_filter_query")):
+            if all(self.get_option(o) for o in exclusive):
+                raise AnsibleError(f"{exclusive[0]} and {exclusive[1]} are mutually exclusive")
+
+        fetched_at = (datetime.now(timezone.utc) - _CLOCK_SKEW).strftime("%Y-%m-%dT%H:%M:%SZ")
+        requests = self.requests(inventory_client(self))
+
+        incremental = {}
+        if data is not None:
+            for name in list(requests):
+                if name not in data:
+                    # Not read before, e.g. because the options changed
+                    continue
+                list_func, kwargs = requests[name]
+                since = f"updated_at>'{data['fetched_at']}'"
+                requests[name] = (list_func, dict(kwargs, filter=_and(kwargs.get("filter"), since)))
+                requests[f"{name}_ids"] = (list_func, dict(kwargs, fields=["id"]))
+                incremental[name] = data[name]
+
+        results = list_concurrently(requests, self.get_option("max_concurrency"))
+
+        fetched = dict(fetched_at=fetched_at)
+        for name in requests:
+            if name.endswith("_ids"):
+                continue
+            objects = dict(incremental.get(name, {}))
+            objects.update((o["id"], o) for o in results[name])
+            if name in incremental:
+                ids = set(o["id"] for o in results[f"{name}_ids"])
+                objects = {k: v for k, v in objects.items() if k in ids}
+            fetched[name] = objects
+        return fetched
+
+    def hostname_of(self, host):
+        for field in self.get_option("hostnames"):
+            if field == "address":
+                addresses = host.get("addresses") or []
+                if addresses and addresses[0].get("address"):
+                    return addresses[0]["address"]
+            elif host.get(field):
+                return str(host[field])
+        return None
+
+    def add_group(self, name, hostname):
+        group = self.inventory.add_group(self._sanitize_group_name(name))
+        self.inventory.add_child(group, hostname)
+
+    def populate(self, data):
+        fixed_addresses_of = {}
+        for fixed_address in data.get("fixed_addresses", {}).values():
+            key = (fixed_address.get("ip_space"), _normalize_address(fixed_address.get("address") or ""))
+            fixed_addresses_of.setdefault(key, []).append(fixed_address)
+
+        names_of = {}
+        for record in data.get("records", {}).values():
+            address = (record.get("rdata") or {}).get("address")
+            if address and record.get("absolute_name_spec"):
+                names_of.setdefault(_normalize_address(address), set()).add(record["absolute_name_spec"])
+
+        # Subnets by IP space and prefix length, to find the subnet of an address with one lookup per prefix length
+        subnets_of = {}
+        for subnet in data.get("subnets", {}).values():
+            try:
+                network = ipaddress.ip_network(f"{subnet['address']}/{subnet['cidr']}", strict=False)
+            except (KeyError, ValueError):
+                continue
+            subnets_of.setdefault(subnet.get("space"), {}).setdefault(subnet["cidr"], {})[network] = subnet
+
+        group_by = self.get_option("group_by")
+        strict = self.get_option("strict")
+        for host in data["hosts"].values():
+            hostname = self.hostname_of(host)
+            if hostname is None:
+                continue
+            self.inventory.add_host(hostname)
+
+            host_vars = dict(host)
+            fixed_addresses, dns_names, subnets = [], set(), []
+            for host_address in host.get("addresses") or []:
+                address, space = _normalize_address(host_address.get("address") or ""), host_address.get("space")
+                fixed_addresses.extend(fixed_addresses_of.get((space, address), []))
+                dns_names.update(names_of.get(address, ()))
+                subnet = self.subnet_of(subnets_of.get(space, {}), address)
+                if subnet is not None:
+                    subnets.append(subnet)
+
+                if "space" in group_by and space:
+                    self.add_group(f"space_{_last(space)}", hostname)
+                if "subnet" in group_by and subnet is not None:
+                    self.add_group(f"subnet_{subnet['address']}_{subnet['cidr']}", hostname)
+
+            if self.get_option("fixed_addresses"):
+                host_vars["fixed_addresses"] = fixed_addresses
+            if self.get_option("dns_names"):
+                host_vars["dns_names"] = sorted(dns_names)
+            if "subnet" in group_by:
+                host_vars["subnets"] = subnets
+
+            for key, value in host_vars.items():
+                # e.g. name and tags are playbook keywords
+                self.inventory.set_variable(hostname, f"host_{key}" if is_reserved_name(key) else key, value)
+            addresses = host.get("addresses") or []
+            if addresses and addresses[0].get("address"):
+                self.inventory.set_variable(hostname, "ansible_host", addresses[0]["address"])
+
+            if "tags" in group_by:
+                for key, value in (host.get("tags") or {}).items():
+                    self.add_group(f"tag_{key}_{value}", hostname)
+
+            self._set_composite_vars(self.get_option("compose"), host_vars, hostname, strict=strict)
+            self._add_host_to_composed_groups(self.get_option("groups"), host_vars, hostname, strict=strict)
+            self._add_host_to_keyed_groups(self.get_option("keyed_groups"), host_vars, hostname, strict=strict)
+
+    @staticmethod
+    def subnet_of(subnets, address):
+        """
+        Find the most specific subnet holding an address.
+
+        :param subnets: The subnets of the IP space of the address, by prefix length and network
+        """
+        try:
+            ip = ipaddress.ip_address(address)
+        except ValueError:
+            return None
+        for cidr in sorted(subnets, reverse=True):
+            if cidr > ip.max_prefixlen:
+                continue
+            subnet = subnets[cidr].get(ipaddress.ip_network((ip, cidr), strict=False))
+            if subnet is not None:
+                return subnet
+        return None
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(InventoryModule, self).parse(inventory, loader, path, cache)
+        self._read_config_data(path)
+
+        cache_key = self.get_cache_key(path)
+        # cache is False when the inventory is refreshed, e.g. by meta: refresh_inventory
+        use_cache = self.get_option("cache") and (cache or self.get_option("incremental"))
+        update_cache = self.get_option("cache") and not cache
+
+        data = None
+        if use_cache:
+            try:
+                data = self._cache[cache_key]
+            except KeyError:
+                update_cache = True
+        if data is None:
+            data = self.fetch()
+        elif self.get_option("incremental"):
+            data = self.fetch(data)
+            update_cache = True
+        if update_cache:
+            self._cache[cache_key] = data
+
+        self.populate(data)
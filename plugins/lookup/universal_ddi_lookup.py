@@ -22,9 +22,12 @@ requirements:
 
 options:
     _terms:
-      description: The name of the object to be returned from the Universal DDI API
+      description:
+        - The name of the object to be returned from the Universal DDI API.
+        - Several objects can be given, they are looked up at the same time and their results are returned in the same order.
       required: True
-      type: str
+      type: list
+      elements: str
     fields:
       description:
         - The list of field names to return for the specified object.
@@ -33,7 +36,8 @@ options:
     filters:
       description:
         - A dictionary containing filters that are used to filter the return objects.
-      type: dict
+        - A list of dictionaries looks up the object once for each of them, at the same time, when a single object is given. When several objects are given, the list must have one dictionary per object.
+      type: raw
     tfilters:
       description:
         - A dictionary containing tags that are used to filter the return objects.
@@ -43,6 +47,49 @@ options:
         - A dict object containing Universal DDI Portal URL and Key for authentication.
         - The portal URL and key can be set in the environment variables using `portal_url` and `portal_key` respectively.
         - Default value for portal_url is "https://csp.infoblox.com".
+    limit:
+      description:
+        - The maximum number of objects to return. All objects are returned if not set.
+      type: int
+      version_added: "1.3.0"
+    offset:
+      description:
+        - The number of objects to skip before the first object returned.
+      type: int
+      default: 0
+      version_added: "1.3.0"
+    page_size:
+      description:
+        - The number of objects requested per API call. The lookup requests pages until all objects, or O(limit) objects, are returned.
+      type: int
+      default: 1000
+      version_added: "1.3.0"
+    max_concurrency:
+      description:
+        - The maximum number of pages fetched at the same time, once the first page is full.
+      type: int
+      default: 1
+      version_added: "1.3.0"
+    cache:
+      description:
+        - Keep the objects returned in memory, keyed by the portal, the object type, O(filters), O(tfilters), O(fields), O(limit) and O(offset).
+        - The same lookup is then answered from memory for as long as the worker process runs, e.g. for all the items of a loop or all the templates of a task, and also by later tasks run by that process.
+        - Do not enable it for lookups that are expected to return new objects when repeated, e.g. with C(until) and C(retries).
+      type: bool
+      default: false
+      version_added: "1.3.0"
+    cache_ttl:
+      description:
+        - If greater than 0, the objects returned are also kept in files in O(cache_dir) for this number of seconds, so that lookups made by other tasks and other runs are answered from the files.
+      type: int
+      default: 0
+      version_added: "1.3.0"
+    cache_dir:
+      description:
+        - The directory of the files of O(cache_ttl).
+      type: path
+      default: ~/.ansible/tmp/universal_ddi_lookup
+      version_added: "1.3.0"
 """
 
 EXAMPLES = """
@@ -62,23 +109,51 @@ EXAMPLES = """
   ansible.builtin.set_fact:
     ip_space: "{{ lookup('infoblox.universal_ddi.universal_ddi_lookup','ipam/ip_space', tfilters={'location': 'site-1'} , provider={'portal_url': 'https://csp.infoblox.com', 'portal_key': 'portal_key'}) }}"
 
+- name: Get the first 100 subnets, fetching 4 pages at the same time and keeping them in a cache file for 10 minutes
+  ansible.builtin.set_fact:
+    subnets: "{{ lookup('infoblox.universal_ddi.universal_ddi_lookup','ipam/subnet', limit=100, page_size=25, max_concurrency=4, cache_ttl=600, provider={'portal_url': 'https://csp.infoblox.com', 'portal_key': 'portal_key'}) }}"
+
+- name: Get the IP Space of each host once, keeping the lookups in memory for all the items of the loop
+  ansible.builtin.debug:
+    msg: "{{ lookup('infoblox.universal_ddi.universal_ddi_lookup','ipam/ip_space', filters={'name': item.space}, cache=true, provider={'portal_url': 'https://csp.infoblox.com', 'portal_key': 'portal_key'}) }}"
+  loop: "{{ hosts }}"
+
+- name: Get the IP Spaces, DNS Views and Authoritative Zones at the same time
+  ansible.builtin.set_fact:
+    context: "{{ query('infoblox.universal_ddi.universal_ddi_lookup','ipam/ip_space', 'dns/view', 'dns/auth_zone', provider={'portal_url': 'https://csp.infoblox.com', 'portal_key': 'portal_key'}) }}"
+
+- name: Get two Subnets by name at the same time
+  ansible.builtin.set_fact:
+    subnets: "{{ query('infoblox.universal_ddi.universal_ddi_lookup','ipam/subnet', filters=[{'name': 'subnet-1'}, {'name': 'subnet-2'}], provider={'portal_url': 'https://csp.infoblox.com', 'portal_key': 'portal_key'}) }}"
+
 """  # noqa: E501
 
 RETURN = """
 results:
     description:
      - The result of the lookup call or the error provided by the API.
+     - One result per object looked up, in order.
     type: list
 """
 
+import copy
+import functools
+import hashlib
+import json
 import os
+import tempfile
+import threading
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 from ansible.errors import AnsibleError
 from ansible.plugins.lookup import LookupBase
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import iter_pages
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:
     HAS_REQUESTS_LIB = False
     REQUESTS_LIB_IMP_ERR = traceback.format_exc()
@@ -86,6 +161,14 @@ else:
     HAS_REQUESTS_LIB = True
     REQUESTS_LIB_IMP_ERR = None
 
+# One session for every lookup made by the same process, so that they reuse its keep-alive connections
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+_POOL_SIZE = 16
+
+# Objects returned by the lookups made by the same process, by cache key
+_CACHE = {}
+
 
 def return_base_url(obj_type):
     """Returns the base URL for the object type"""
@@ -111,8 +194,89 @@ def return_base_url(obj_type):
         raise AnsibleError(f"Invalid object type: {obj_type}")
 
 
-def get_object(obj_type, provider, filters, tfilters, fields):
-    """Creating the GET API request for lookup"""
+def get_session():
+    """Returns the session shared by the lookups"""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=_POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SESSION = session
+        return _SESSION
+
+
+def filter_expression(filters):
+    """Returns the filter expression matching all values of a dict, or None"""
+    if not filters or not isinstance(filters, dict):
+        return None
+    temp_filters = []
+    for k, v in filters.items():
+        if str(v).isdigit():
+            temp_filters.append(f"{k}=={v}")
+        else:
+            temp_filters.append(f"{k}=='{v}'")
+    return " and ".join(temp_filters)
+
+
+def cache_key(portal_url, portal_key, obj_type, **kwargs):
+    """Returns the key of the objects returned by a lookup, hashed so that it does not hold the portal key"""
+    key = json.dumps(dict(kwargs, portal_url=portal_url, portal_key=portal_key, obj_type=obj_type), sort_keys=True)
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def read_cache_file(cache_dir, key, ttl):
+    """Returns the objects kept in the cache file of a key, or None if there is none younger than ttl seconds"""
+    path = os.path.join(cache_dir, f"{key}.json")
+    try:
+        if time.time() - os.path.getmtime(path) > ttl:
+            return None
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_cache_file(cache_dir, key, res):
+    """Keeps the objects returned by a lookup in the cache file of its key"""
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(res, f)
+        # Replaced at once, so that concurrent lookups never read a partial file
+        os.replace(tmp, os.path.join(cache_dir, f"{key}.json"))
+    except OSError:
+        pass  # The cache is only an optimization
+
+
+class _ResponseError(Exception):
+    def __init__(self, result):
+        self.result = result
+
+
+class _Page(object):
+    def __init__(self, body):
+        self.body = body
+        self.results = body.get("results") if isinstance(body, dict) else None
+
+
+def get_object(
+    obj_type,
+    provider,
+    filters,
+    tfilters,
+    fields,
+    limit=None,
+    offset=0,
+    page_size=1000,
+    max_concurrency=1,
+    cache=False,
+    cache_ttl=0,
+    cache_dir=None,
+):
+    """Creating the GET API requests for lookup, reading all pages of the results"""
     try:
 
         if len(provider) > 0:
@@ -131,70 +295,115 @@ def get_object(obj_type, provider, filters, tfilters, fields):
             },
         )
     endpoint = f"{return_base_url(obj_type)}/{obj_type}"
-    flag = 0
+    params = {}
     if fields is not None and isinstance(fields, list):
-        temp_fields = ",".join(fields)
-        endpoint = endpoint + "?_fields=" + temp_fields
-        flag = 1
-
-    if filters != {} and isinstance(filters, dict):
-        temp_filters = []
-        for k, v in filters.items():
-            if str(v).isdigit():
-                temp_filters.append(f"{k}=={v}")
-            else:
-                temp_filters.append(f"{k}=='{v}'")
-        res = " and ".join(temp_filters)
-        if flag == 1:
-            endpoint = endpoint + "&_filter=" + res
-        else:
-            endpoint = endpoint + "?_filter=" + res
-            flag = 1
-
-    if tfilters != {} and isinstance(tfilters, dict):
-        temp_tfilters = []
-        for k, v in tfilters.items():
-            if str(v).isdigit():
-                temp_tfilters.append(f"{k}=={v}")
-            else:
-                temp_tfilters.append(f"{k}=='{v}'")
-        res = " and ".join(temp_tfilters)
-        if flag == 1:
-            endpoint = endpoint + "&_tfilter=" + res
-        else:
-            endpoint = endpoint + "?_tfilter=" + res
+        params["_fields"] = ",".join(fields)
+    if filter_expression(filters):
+        params["_filter"] = filter_expression(filters)
+    if filter_expression(tfilters):
+        params["_tfilter"] = filter_expression(tfilters)
+
+    key = cache_key(portal_url, portal_key, obj_type, params=params, limit=limit, offset=offset)
+    if cache and key in _CACHE:
+        return copy.deepcopy(_CACHE[key])
+    if cache_ttl > 0:
+        res = read_cache_file(cache_dir, key, cache_ttl)
+        if res is not None:
+            if cache:
+                _CACHE[key] = res
+            return copy.deepcopy(res)
 
     # reproduced module_utils. Replace once published
+    headers = {"Authorization": f"Token {portal_key}"}
+    url = f"{portal_url}{endpoint}"
+    session = get_session()
+    if limit is not None:
+        page_size = max(1, min(page_size, limit))
+
+    def list_page(offset, limit):
+        try:
+            result = session.get(url, headers=headers, params=dict(params, _offset=offset, _limit=limit))
+        except Exception:
+            raise Exception("API request failed")
+        if result.status_code not in [200, 201, 204]:
+            raise _ResponseError(result)
+        return _Page(result.json())
+
     try:
-        headers = {"Authorization": f"Token {portal_key}"}
-        url = f"{portal_url}{endpoint}"
-        result = requests.get(url, headers=headers)
-    except Exception:
-        raise Exception("API request failed")
-
-    if result.status_code in [200, 201, 204]:
-        return [result.json()]
-    elif result.status_code == 401:
-        return [result.content]
-    else:
-        meta = {"status": result.status_code, "response": result.json()}
+        first = list_page(offset, page_size)
+        if first.results is None:
+            # A single object, not a collection
+            res = [first.body]
+        else:
+            objects = list(first.results)
+            if len(first.results) == page_size and (limit is None or len(objects) < limit):
+                # Following pages, from the end of the first page
+                start = offset + page_size
+                pages = iter_pages(
+                    lambda offset, limit: list_page(start + offset, limit),
+                    limit=page_size,
+                    max_concurrency=max_concurrency,
+                )
+                for page in pages:
+                    objects.extend(page)
+                    if limit is not None and len(objects) >= limit:
+                        pages.close()
+                        break
+            if limit is not None:
+                objects = objects[:limit]
+            res = [dict(first.body, results=objects)]
+    except _ResponseError as e:
+        if e.result.status_code == 401:
+            return [e.result.content]
+        meta = {"status": e.result.status_code, "response": e.result.json()}
         return [meta]
 
+    if cache:
+        _CACHE[key] = res
+    if cache_ttl > 0:
+        write_cache_file(cache_dir, key, res)
+    return copy.deepcopy(res)
+
 
 class LookupModule(LookupBase):
     def run(self, terms, variables=None, **kwargs):
         if not HAS_REQUESTS_LIB:
-            raise AnsibleError("The 'universal_ddi' lookup cannot be run without the 'requests' library installed.")(
-                REQUESTS_LIB_IMP_ERR
+            raise AnsibleError(
+                f"The 'universal_ddi' lookup cannot be run without the 'requests' library installed. {REQUESTS_LIB_IMP_ERR}"
             )
-        try:
-            obj_type = terms[0]
-        except IndexError:
+        if not terms:
             raise AnsibleError("the object_type must be specified")
 
         fields = kwargs.pop("fields", None)
         filters = kwargs.pop("filters", {})
         tfilters = kwargs.pop("tfilters", {})
         provider = kwargs.pop("provider", {})
-        res = get_object(obj_type, provider, filters, tfilters, fields)
-        return res
+
+        if isinstance(filters, list):
+            if len(terms) == 1:
+                terms = terms * len(filters)
+            elif len(filters) != len(terms):
+                raise AnsibleError("filters must have one dictionary per object_type")
+        else:
+            filters = [filters] * len(terms)
+
+        get = functools.partial(
+            get_object,
+            provider=provider,
+            tfilters=tfilters,
+            fields=fields,
+            limit=kwargs.pop("limit", None),
+            offset=kwargs.pop("offset", 0),
+            page_size=kwargs.pop("page_size", 1000),
+            max_concurrency=kwargs.pop("max_concurrency", 1),
+            cache=kwargs.pop("cache", False),
+            cache_ttl=kwargs.pop("cache_ttl", 0),
+            cache_dir=os.path.expanduser(kwargs.pop("cache_dir", "~/.ansible/tmp/universal_ddi_lookup")),
+        )
+        if len(terms) == 1:
+            return list(get(terms[0], filters=filters[0]))
+
+        # The object types are looked up at the same time, over the shared session
+        with ThreadPoolExecutor(max_workers=min(len(terms), _POOL_SIZE)) as executor:
+            results = executor.map(lambda query: get(query[0], filters=query[1]), zip(terms, filters))
+            return [result for res in results for result in res]
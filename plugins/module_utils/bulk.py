@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Infoblox
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import csv
+import gzip
+import json
+
+from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+
+
+class ItemFileError(Exception):
+    """
+    Raised when the items of a bulk module cannot be read from a file.
+    """
+
+
+def _open(path):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, encoding="utf-8", newline="")
+
+
+def _csv_value(value):
+    # Cells holding JSON objects or lists, e.g. tags, are decoded. Other cells are kept as strings and converted by
+    # the argument spec validation.
+    value = value.strip()
+    if value[:1] in ("{", "["):
+        try:
+            return json.loads(value)
+        except ValueError:
+            pass
+    return value
+
+
+def read_items(path):
+    """
+    Read the items of a bulk module from a file, as they are needed.
+
+    Files ending with ``.csv`` (optionally followed by ``.gz``) are read as CSV with a header row naming the fields,
+    empty cells are left out. Other files are read as JSON Lines, one object per line.
+
+    :param path: Path of the file
+    :return: Generator of dicts, one per item
+    """
+    is_csv = path[:-3].endswith(".csv") if path.endswith(".gz") else path.endswith(".csv")
+    with _open(path) as f:
+        if is_csv:
+            for lineno, row in enumerate(csv.DictReader(f), 2):
+                if None in row:
+                    raise ItemFileError(f"{path}:{lineno}: More cells than header fields")
+                yield {k.strip(): _csv_value(v) for k, v in row.items() if v is not None and v.strip() != ""}
+        else:
+            for lineno, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    item = json.loads(line)
+                except ValueError as e:
+                    raise ItemFileError(f"{path}:{lineno}: {e}")
+                if not isinstance(item, dict):
+                    raise ItemFileError(f"{path}:{lineno}: Expected a JSON object")
+                yield item
+
+
+def validate_items(items, spec, location=None):
+    """
+    Validate items against the argument spec of their option, as Ansible does for the items given in a task.
+
+    :param items: Iterable of dicts
+    :param spec: The argument spec of an item, i.e. the ``options`` of a list of dicts option
+    :param location: Describes where the items come from, for error messages
+    :return: Generator of the validated items, with default values set and values converted to the types of the spec
+    """
+    validator = ArgumentSpecValidator(spec)
+    for index, item in enumerate(items, 1):
+        result = validator.validate(item)
+        if result.error_messages:
+            where = f"{location} item {index}" if location else f"item {index}"
+            raise ItemFileError(f"{where}: {', '.join(result.error_messages)}")
+        yield result.validated_parameters
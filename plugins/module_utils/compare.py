@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Infoblox
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import ipaddress
+
+# List fields holding references or names the API treats as sets: their order is not significant
+UNORDERED_FIELDS = frozenset(
+    [
+        "default_realms",
+        "destination_types_enabled",
+        "exclude_types",
+        "excluded_accounts",
+        "federated_realms",
+        "filters",
+        "filters_large_selection",
+        "filters_v6",
+        "hosts",
+        "interface_labels",
+        "ip_spaces",
+        "nsgs",
+        "resources",
+        "restricted_to_accounts",
+        "routing_protocols",
+        "subnets",
+        "zones",
+    ]
+)
+
+
+def _as_dict(existing):
+    """
+    Convert the existing object to plain data, as returned by the API. Models are dumped at once, which is much faster
+    than reading them field by field.
+    """
+    if hasattr(existing, "model_dump"):
+        return existing.model_dump(by_alias=True, exclude_none=True)
+    return existing
+
+
+def _strip(value):
+    """
+    Drop the fields of the payload that are not set.
+    """
+    if isinstance(value, list):
+        return [_strip(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _strip(v) for k, v in value.items() if v is not None}
+    return value
+
+
+def _same_scalar(existing, value):
+    if isinstance(existing, bool) or isinstance(value, bool):
+        return False
+    if (
+        isinstance(existing, (int, float))
+        and isinstance(value, str)
+        or isinstance(existing, str)
+        and isinstance(value, (int, float))
+    ):
+        try:
+            return float(existing) == float(value)
+        except ValueError:
+            return False
+    if isinstance(existing, str) and isinstance(value, str):
+        # e.g. 2001:DB8::1 and 2001:db8::1
+        try:
+            return ipaddress.ip_address(existing) == ipaddress.ip_address(value)
+        except ValueError:
+            return False
+    return False
+
+
+def _same_list(existing, value, unordered):
+    if len(existing) != len(value):
+        return False
+    if not unordered:
+        return all(_same(e, v) for e, v in zip(existing, value))
+
+    # Each element of the payload must match a different element of the existing list. Elements equal as a whole
+    # are paired at once.
+    remaining, partial = list(existing), []
+    for v in value:
+        if v in remaining:
+            remaining.remove(v)
+        else:
+            partial.append(v)
+
+    # The others may match several elements, e.g. dicts with fewer fields: the pairing of an element is given up
+    # for another one if that lets the current element be paired too.
+    matches = [[i for i, e in enumerate(remaining) if _same(e, v)] for v in partial]
+    paired = {}
+
+    def _pair(j, visited):
+        for i in matches[j]:
+            if i not in visited:
+                visited.add(i)
+                if i not in paired or _pair(paired[i], visited):
+                    paired[i] = j
+                    return True
+        return False
+
+    return all(_pair(j, set()) for j in range(len(partial)))
+
+
+def _same(existing, value, key=None):
+    """
+    Check whether an existing value matches a value of the payload. Only the fields set in the payload are compared.
+    """
+    if value is None or existing == value:
+        # Values equal as a whole are compared at once
+        return True
+    if existing is None:
+        # The API leaves out empty values
+        return value == [] or value == {} or value == ""
+    if isinstance(value, dict):
+        if not isinstance(existing, dict):
+            return False
+        # An inherited value is the value of the inheritance source, it is not set on the object
+        inherited = value.get("action") == "inherit" and existing.get("action") == "inherit"
+        for k, v in value.items():
+            if v is None or (inherited and k == "value"):
+                continue
+            if not _same(existing.get(k), v, k):
+                return False
+        return True
+    if isinstance(value, list):
+        return isinstance(existing, list) and _same_list(existing, value, key in UNORDERED_FIELDS)
+    return _same_scalar(existing, value)
+
+
+def is_changed(existing, payload):
+    """
+    Check if the existing object is different from the payload.
+
+    The payload fields that are not None are compared, others are ignored. Nested objects are compared recursively,
+    lists element by element, and the comparison stops at the first difference. Lists of the UNORDERED_FIELDS are
+    compared regardless of their order, values inherited on both sides are not compared, and scalars of different
+    types are compared as the API would store them, e.g. "10" and 10.
+
+    :param existing: The existing object, as a model or a dict
+    :param payload: The desired object, as a dict
+    :return: True if any field of the payload differs
+    """
+    return not _same(_as_dict(existing), payload)
+
+
+def changes(existing, payload):
+    """
+    Get the fields of the payload that differ from the existing object, as a diff of the module result.
+
+    :param existing: The existing object, as a model or a dict
+    :param payload: The desired object, as a dict
+    :return: Dictionary with the before and after values of the fields that differ
+    """
+    existing = _as_dict(existing)
+    before, after = {}, {}
+    for k, v in payload.items():
+        if not _same(existing.get(k), v, k):
+            if k in existing:
+                before[k] = existing[k]
+            after[k] = _strip(v)
+    return dict(before=before, after=after)
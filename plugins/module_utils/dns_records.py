@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Infoblox
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import ipaddress
+import json
+
+# Record fields that are compared to decide whether a record has to be updated. The record options are only applied
+# when a record is created.
+RECORD_FIELDS = ["comment", "disabled", "rdata", "tags", "ttl"]
+
+# The rdata fields that identify a record of a given type. Records of the same name and type are different records
+# if these fields differ, and the same record (possibly to be updated) otherwise.
+# The rdata of types not listed here is compared as a whole.
+_RDATA_KEYS = {
+    "A": ["address"],
+    "AAAA": ["address"],
+    "CAA": ["flags", "tag", "value"],
+    "CNAME": ["cname"],
+    "DHCID": ["dhcid"],
+    "DNAME": ["target"],
+    "HTTPS": ["priority", "target_name"],
+    "MX": ["exchange", "preference"],
+    "NAPTR": ["order", "preference", "flags", "services", "regexp", "replacement"],
+    "NS": ["dname"],
+    "PTR": ["dname"],
+    "SOA": [],
+    "SRV": ["priority", "weight", "port", "target"],
+    "SSHFP": ["algorithm", "fingerprint_type", "fingerprint"],
+    "SVCB": ["priority", "target_name"],
+    "TXT": ["text"],
+}
+
+# Values the API uses for identifying rdata fields that are left out
+_RDATA_DEFAULTS = {
+    "CAA": {"flags": 0},
+    "SRV": {"weight": 0},
+}
+
+_DOMAIN_NAME_FIELDS = ["cname", "dname", "exchange", "replacement", "target", "target_name"]
+
+
+def normalize_name(name):
+    """
+    Normalize the name of a record relative to its zone. The zone apex is represented by an empty string.
+    """
+    name = (name or "").strip().lower().rstrip(".")
+    return "" if name == "@" else name
+
+
+def _normalize_value(field, value):
+    if isinstance(value, str):
+        if field == "address":
+            try:
+                return ipaddress.ip_address(value.strip()).compressed
+            except ValueError:
+                return value.strip()
+        if field in _DOMAIN_NAME_FIELDS:
+            return value.strip().lower().rstrip(".")
+        if value.strip().isdigit():
+            return int(value)
+        return value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True)
+    return value
+
+
+def record_key(name_in_zone, record_type, rdata):
+    """
+    Build a hashable key identifying a record in its zone.
+
+    :param name_in_zone: The name of the record relative to the zone
+    :param record_type: The record type, e.g. A or MX
+    :param rdata: The record data
+    :return: Tuple of the normalized name, type and identifying rdata fields
+    """
+    record_type = (record_type or "").upper()
+    rdata = rdata or {}
+    keys = _RDATA_KEYS.get(record_type)
+    if keys is None:
+        keys = sorted(rdata)
+    defaults = _RDATA_DEFAULTS.get(record_type, {})
+
+    return (
+        normalize_name(name_in_zone),
+        record_type,
+        tuple((k, _normalize_value(k, rdata.get(k, defaults.get(k)))) for k in keys),
+    )
+
+
+def key_of(record):
+    """
+    Build the key of a record given as a dict, as returned by the API or passed to a module.
+    """
+    return record_key(record.get("name_in_zone"), record.get("type"), record.get("rdata"))
+
+
+def record_changed(existing, desired, is_changed):
+    """
+    Check whether an existing record has to be updated to match the desired one.
+
+    :param existing: The existing record, as a dict
+    :param desired: The desired record, as a dict. Only fields that are set are compared.
+    :param is_changed: The function used to compare objects, e.g. UniversalDDIAnsibleModule.is_changed
+    """
+    payload = {k: desired[k] for k in RECORD_FIELDS if desired.get(k) is not None}
+    if "rdata" in payload:
+        # The identifying rdata fields already match, only compare the remaining ones as given
+        record_type = (desired.get("type") or "").upper()
+        keys = _RDATA_KEYS.get(record_type, [])
+        payload["rdata"] = {k: v for k, v in payload["rdata"].items() if k not in keys}
+        if not payload["rdata"]:
+            del payload["rdata"]
+    return is_changed(existing, payload)
+
+
+def is_purgeable(record, exclude_types=None):
+    """
+    Check whether an existing record may be deleted when it is not among the desired records of its zone.
+
+    SOA records and records maintained by the platform, e.g. the NS records generated from the name server assignment
+    or records added by dynamic updates, are never purged. Only records created through the API are.
+
+    :param record: The existing record, as a dict including its type and source
+    :param exclude_types: Record types that are never purged
+    """
+    record_type = (record.get("type") or "").upper()
+    if record_type == "SOA" or record_type in [t.upper() for t in exclude_types or []]:
+        return False
+    return (record.get("source") or []) == ["STATIC"]
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Infoblox
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import ipaddress
+from bisect import bisect_left, bisect_right
+
+
+def interval_of(network):
+    """
+    Get the addresses of a network or an address range as integers.
+
+    :param network: A network as "a.b.c.d/n", an address, or a range as a (start, end) tuple of addresses
+    :return: Tuple of the IP version, the first and the last address
+    """
+    if isinstance(network, (tuple, list)):
+        start, end = ipaddress.ip_address(network[0]), ipaddress.ip_address(network[1])
+        return start.version, int(start), int(end)
+    network = ipaddress.ip_network(network, strict=False)
+    return network.version, int(network.network_address), int(network.broadcast_address)
+
+
+def merge(intervals):
+    """
+    Merge (first, last) intervals, e.g. the networks in use in an address block.
+
+    :param intervals: Iterable of (first, last) tuples of integers, in any order
+    :return: List of the disjoint (first, last) tuples covering the same integers, in ascending order
+    """
+    merged = []
+    for first, last in sorted(intervals):
+        if merged and first <= merged[-1][1] + 1:
+            if last > merged[-1][1]:
+                merged[-1] = (merged[-1][0], last)
+        else:
+            merged.append((first, last))
+    return merged
+
+
+def subtract(first, last, used):
+    """
+    Get the parts of an interval that are not in use.
+
+    :param first: The first integer of the interval
+    :param last: The last integer of the interval
+    :param used: List of disjoint (first, last) tuples in ascending order, as returned by merge
+    :return: List of the free (first, last) tuples, in ascending order
+    """
+    free = []
+    for used_first, used_last in used:
+        if used_last < first:
+            continue
+        if used_first > last:
+            break
+        if used_first > first:
+            free.append((first, used_first - 1))
+        first = used_last + 1
+    if first <= last:
+        free.append((first, last))
+    return free
+
+
+def aligned_blocks(free, size, count=None):
+    """
+    Iterate over the blocks of a size aligned on that size in free intervals, e.g. the /24 networks of free space.
+
+    :param free: Iterable of disjoint (first, last) tuples in ascending order, as returned by subtract
+    :param size: The size of the blocks, a power of 2
+    :param count: The number of blocks to return, or None for all of them
+    :return: Generator of the first integer of each block, in ascending order
+    """
+    found = 0
+    for first, last in free:
+        start = -(-first // size) * size
+        while start + size - 1 <= last:
+            if count is not None and found >= count:
+                return
+            yield start
+            found += 1
+            start += size
+
+
+def largest_prefix(first, last, bits):
+    """
+    Get the prefix length of the largest network that fits in an interval, e.g. /23 for 10.0.1.0 - 10.0.4.255.
+
+    :param first: The first integer of the interval
+    :param last: The last integer of the interval
+    :param bits: The number of bits of the addresses, 32 or 128
+    :return: The prefix length, or None if the interval is empty
+    """
+    best = None
+    while first <= last:
+        # The largest network starting at first, shrunk until it fits
+        size = first & -first if first else 1 << bits
+        while size > last - first + 1:
+            size >>= 1
+        prefix = bits - size.bit_length() + 1
+        best = prefix if best is None else min(best, prefix)
+        first += size
+    return best
+
+
+class IntervalSet(object):
+    """
+    A set of integers held as disjoint intervals in ascending order, e.g. the addresses of the subnets of an IP space.
+
+    Lookups of the part of an interval in the set take O(log n), for n intervals in the set.
+    """
+
+    def __init__(self, intervals=()):
+        merged = merge(intervals)
+        self.starts = [first for first, _ in merged]
+        self.ends = [last for _, last in merged]
+        # Number of integers in the intervals before each interval
+        self._before = [0]
+        for first, last in merged:
+            self._before.append(self._before[-1] + last - first + 1)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        return iter(zip(self.starts, self.ends))
+
+    @property
+    def size(self):
+        """
+        The number of integers in the set.
+        """
+        return self._before[-1]
+
+    def _slice(self, first, last):
+        # The indices of the intervals overlapping first - last
+        return bisect_left(self.ends, first), bisect_right(self.starts, last)
+
+    def overlapping(self, first, last):
+        """
+        Get the intervals of the set overlapping an interval.
+
+        :return: List of (first, last) tuples, in ascending order
+        """
+        i, j = self._slice(first, last)
+        return list(zip(self.starts[i:j], self.ends[i:j]))
+
+    def covered(self, first, last):
+        """
+        Count the integers of an interval that are in the set.
+        """
+        i, j = self._slice(first, last)
+        if i >= j:
+            return 0
+        count = self._before[j] - self._before[i]
+        count -= max(0, first - self.starts[i])
+        count -= max(0, self.ends[j - 1] - last)
+        return count
+
+    def gaps(self, first, last):
+        """
+        Get the parts of an interval that are not in the set.
+
+        :return: List of (first, last) tuples, in ascending order
+        """
+        return subtract(first, last, self.overlapping(first, last))
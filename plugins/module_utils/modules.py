@@ -6,12 +6,29 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import gzip
+import json
+import os
+import random
+import socket
+import tempfile
+import threading
+import time
 import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
 
 from ansible.module_utils.basic import AnsibleModule, env_fallback, missing_required_lib
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.compare import changes, is_changed
 
 try:
     import universal_ddi_client
+    import urllib3
+    from universal_ddi_client import ApiException
+    from urllib3.connection import HTTPConnection
 
     HAS_UNIVERSAL_DDI_CLIENT = True
     UNIVERSAL_DDI_CLIENT_IMP_ERR = None
@@ -19,6 +36,20 @@ except ImportError:
     HAS_UNIVERSAL_DDI_CLIENT = False
     UNIVERSAL_DDI_CLIENT_IMP_ERR = traceback.format_exc()
 
+# API clients are shared by everything running in the same process, so that every API call made for the same
+# portal reuses one connection pool (and its keep-alive connections) instead of paying a new TLS handshake.
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+
+# Response statuses of requests that are retried
+_RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+# Methods of requests that are only retried if the server did not process them, i.e. if they were rate limited. A
+# DELETE retried after the server processed it would fail with 404 and hide that the object was deleted.
+_NON_IDEMPOTENT_METHODS = frozenset(["POST", "DELETE"])
+# Delays between retries, in seconds
+_RETRY_BACKOFF = 0.5
+_MAX_RETRY_DELAY = 60.0
+
 
 class UniversalDDIAnsibleModule(AnsibleModule):
     def __init__(self, *args, **kwargs):
@@ -33,6 +64,7 @@ class UniversalDDIAnsibleModule(AnsibleModule):
         super(UniversalDDIAnsibleModule, self).__init__(*args, **kwargs)
         self._client = None
         self._limit = 1000
+        self._trace = [] if self.params.get("trace") else None
 
         if not HAS_UNIVERSAL_DDI_CLIENT:
             self.fail_json(
@@ -46,12 +78,27 @@ class UniversalDDIAnsibleModule(AnsibleModule):
     @property
     def client(self):
         if not self._client:
-            self._client = _get_client(self)
+            self._client = get_client(self.params)
+            self._client.rest_client.trace = self._trace
 
         return self._client
 
+    def exit_json(self, **kwargs):
+        if self._trace is not None:
+            kwargs["api_trace"] = self._trace
+        super(UniversalDDIAnsibleModule, self).exit_json(**kwargs)
+
+    def fail_json(self, msg, **kwargs):
+        # fail_json may be called by AnsibleModule before the trace is set up
+        if getattr(self, "_trace", None) is not None:
+            kwargs["api_trace"] = self._trace
+        super(UniversalDDIAnsibleModule, self).fail_json(msg, **kwargs)
+
     def is_changed(self, existing, payload):
-        return _is_changed(existing, payload)
+        return is_changed(existing, payload)
+
+    def changes(self, existing, payload):
+        return changes(existing, payload)
 
     def validate_readonly_on_update(self, existing, update_body, fields):
         for field in fields:
@@ -61,6 +108,78 @@ class UniversalDDIAnsibleModule(AnsibleModule):
 
         return update_body
 
+    @property
+    def assume_absent(self):
+        """
+        Whether the object is created without being looked up first, as it is known not to exist.
+        """
+        return bool(self.params.get("assume_absent")) and self.params.get("state") == "present"
+
+    @property
+    def delete_by_id(self):
+        """
+        Whether the object is deleted by its id alone, without being read first. A missing object is then only noticed
+        when the API does not find it to delete. In check mode, the object is read to report whether it exists.
+        """
+        return self.params.get("state") == "absent" and self.params.get("id") is not None and not self.check_mode
+
+    def list_existing(self, list_func, filter, keys, **kwargs):
+        """
+        List the objects matching the filter identifying the object of the module.
+
+        Only the id and keys of the objects are requested if the state is absent, or if it is present and the payload
+        holds no other fields than the keys of the filter, as there is nothing else to compare. The results are then
+        ProbedObject. Otherwise, the full objects are requested.
+
+        :param list_func: The list method of an API object, e.g. ViewApi(self.client).list
+        :param filter: The filter matching the object by its keys
+        :param keys: The names of the fields compared by filter
+        :param kwargs: Additional arguments of list_func for the full objects, e.g. inherit
+        :return: The response of list_func, or an object with the same results attribute
+        """
+        payload = getattr(self, "payload_params", None) or {}
+        state = self.params.get("state")
+        if state != "absent" and (
+            state != "present" or set(k for k, v in payload.items() if v is not None) - set(keys)
+        ):
+            return list_func(filter=filter, **kwargs)
+
+        probe = _raw_list(getattr(list_func.__self__, f"{list_func.__name__}_without_preload_content"))
+        resp = probe(filter=filter, fields=",".join(["id"] + list(keys)))
+        return _RawPage([ProbedObject(obj) for obj in resp.results or []])
+
+    @property
+    def write_inherit(self):
+        """
+        The inherit argument of create and update calls. Inherited values are only requested if the full object is
+        returned by the module.
+        """
+        return "none" if self.params.get("return_object") == "minimal" else "full"
+
+    def written_object(self, resp, read, id=None, stale=False):
+        """
+        Get the object returned by the module after it was created or updated.
+
+        The object is only read again if the full object is to be returned and the response of the write call does not
+        hold it, either because it is empty or because the object was changed by a later call (``stale``). With
+        ``return_object=minimal``, the object is never read again.
+
+        :param resp: The response of the create or update call, may be None
+        :param read: The read method of the API object, e.g. RecordApi(self.client).read
+        :param id: The resource identifier of the object, if the response may not hold it
+        :param stale: Whether the object was changed since the write call
+        :return: The object as a dict
+        """
+        obj = resp.result if resp is not None else None
+        if self.params.get("return_object") == "minimal":
+            if obj is None:
+                return dict(id=id) if id is not None else {}
+            return obj.model_dump(by_alias=True, exclude_none=True)
+
+        if obj is None or stale:
+            obj = read(id if id is not None else obj.id, inherit="full").result
+        return obj.model_dump(by_alias=True, exclude_none=True)
+
     def find_address_blocks_by_tags(self, tag_filters):
         """
         Find address blocks by tag filters.
@@ -70,32 +189,269 @@ class UniversalDDIAnsibleModule(AnsibleModule):
         """
 
         from ipam import AddressBlockApi
-        from universal_ddi_client import ApiException
 
         tag_filter_str = None
         if tag_filters:
             tag_filter_str = " and ".join([f"{k}=='{v}'" for k, v in tag_filters.items()])
 
-        offset = 0
-        all_results = []  # Initialize a list to accumulate all results
+        return list(self.paginate(AddressBlockApi(self.client).list, tfilter=tag_filter_str, inherit="full"))
+
+    def find_children(self, parent_ids):
+        """
+        Find the address blocks, subnets and ranges directly in address blocks, e.g. to compute their free space.
+
+        The children of many address blocks are read at once, with only their addresses.
+
+        :param parent_ids: List of address block IDs
+        :return: Dictionary of the children of each address block, as networks "a.b.c.d/n" or (start, end) ranges
+        """
+
+        from ipam import AddressBlockApi, RangeApi, SubnetApi
+
+        children = {id: [] for id in parent_ids}
+        # Keep the filters short enough for the URL
+        for i in range(0, len(parent_ids), 50):
+            parent_filter = " or ".join(f"parent=='{id}'" for id in parent_ids[i : i + 50])
+            for api in (AddressBlockApi, SubnetApi):
+                for child in self.paginate(
+                    api(self.client).list, filter=parent_filter, fields=["parent", "address", "cidr"]
+                ):
+                    children.setdefault(child.get("parent"), []).append(f"{child['address']}/{child['cidr']}")
+            for child in self.paginate(
+                RangeApi(self.client).list, filter=parent_filter, fields=["parent", "start", "end"]
+            ):
+                children.setdefault(child.get("parent"), []).append((child["start"], child["end"]))
+        return children
+
+    def paginate(self, list_func, **kwargs):
+        """
+        Iterate over all objects returned by a list API call, failing the module if any page cannot be fetched.
+
+        Pages are fetched as the objects are consumed, so only a few pages are held in memory at any time.
+
+        :param list_func: The list method of an API object, e.g. RecordApi(self.client).list
+        :param kwargs: Additional arguments passed to every call of list_func. If ``fields`` is a list of field names,
+            only those fields are requested and the objects are returned as plain dicts.
+        :return: Generator of all objects, in the order returned by the API
+        """
+        max_concurrency = self.params.get("max_concurrency") or 1
+
+        try:
+            for obj in iter_objects(list_func, limit=self._limit, max_concurrency=max_concurrency, **kwargs):
+                yield obj
+        except ApiException as e:
+            self.fail_json(msg=f"Failed to execute command: {e.status} {e.reason} {e.body}")
+
+    def write_objects(self, objects):
+        """
+        Write objects to the file given by the dest option as JSON Lines, as they are produced.
+
+        The file is gzip compressed if its name ends with ``.gz``. It is written to a temporary file first and only
+        moved into place once all objects have been written.
+
+        :param objects: Iterable of API objects or plain dicts
+        :return: Dictionary with the path of the file and the number of objects written
+        """
+        dest = os.path.abspath(self.params["dest"])
+        if not os.path.isdir(os.path.dirname(dest)):
+            self.fail_json(msg=f"Destination directory {os.path.dirname(dest)} does not exist")
+        try:
+            tmp, count = write_lines(dest, (json_line(obj) for obj in objects or []))
+        except OSError as e:
+            self.fail_json(msg=f"Failed to write {dest}: {e}")
+        self.atomic_move(tmp, dest)
+        return dict(dest=dest, count=count)
+
+
+def json_line(obj):
+    """
+    Serialize an API object or a plain dict as a line of JSON.
+    """
+    if isinstance(obj, dict):
+        return json.dumps(obj)
+    return obj.model_dump_json(by_alias=True, exclude_none=True)
+
+
+def write_lines(dest, lines):
+    """
+    Write lines to a temporary file in the directory of dest, as they are produced.
+
+    The file is gzip compressed if dest ends with ``.gz``. It is removed if producing the lines fails, otherwise it is
+    up to the caller to move it into place, e.g. with AnsibleModule.atomic_move.
+
+    :param dest: The path the file is meant for
+    :param lines: Iterable of strings, without line endings
+    :return: Tuple of the path of the temporary file and the number of lines written
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(dest), prefix=".universal_ddi_")
+    os.close(fd)
 
+    count = 0
+    try:
+        with (gzip.open if dest.endswith(".gz") else open)(tmp, "wt", encoding="utf-8") as f:
+            for line in lines:
+                f.write(line)
+                f.write("\n")
+                count += 1
+    except BaseException:
+        # Also covers fail_json raised while fetching the objects
+        os.remove(tmp)
+        raise
+
+    return tmp, count
+
+
+def iter_pages(list_func, limit=1000, max_concurrency=1, **kwargs):
+    """
+    Iterate over the pages of a list API call, in order.
+
+    The first page is fetched on its own. Only if it is full are the following pages requested, keeping up to
+    max_concurrency requests in flight until a page comes back short.
+
+    :param list_func: The list method of an API object, e.g. RecordApi(client).list
+    :param limit: Number of objects requested per page
+    :param max_concurrency: Maximum number of pages fetched at the same time
+    :param kwargs: Additional arguments passed to every call of list_func
+    :return: Generator of lists of objects, one per page
+    """
+    results = list_func(offset=0, limit=limit, **kwargs).results or []
+    yield results
+    if len(results) < limit:
+        return
+
+    offset = limit
+    if max_concurrency <= 1:
         while True:
-            try:
-                resp = AddressBlockApi(self.client).list(
-                    offset=offset, limit=self._limit, tfilter=tag_filter_str, inherit="full"
-                )
+            results = list_func(offset=offset, limit=limit, **kwargs).results or []
+            yield results
+            if len(results) < limit:
+                return
+            offset += limit
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        pending = deque()
+        while True:
+            while len(pending) < max_concurrency:
+                pending.append(executor.submit(list_func, offset=offset, limit=limit, **kwargs))
+                offset += limit
 
-                # Accumulate results from this page
-                all_results.extend(resp.results)
+            results = pending.popleft().result().results or []
+            yield results
+            if len(results) < limit:
+                # Pages requested after a short page are past the end of the collection
+                for future in pending:
+                    future.cancel()
+                return
 
-                if len(resp.results) < self._limit:
-                    break
-                offset += self._limit
 
-            except ApiException as e:
-                self.fail_json(msg=f"Failed to execute command: {e.status} {e.reason} {e.body}")
+def iter_objects(list_func, limit=1000, max_concurrency=1, fields=None, raw=False, **kwargs):
+    """
+    Iterate over all objects returned by a list API call, as returned by iter_pages.
+
+    :param list_func: The list method of an API object, e.g. RecordApi(client).list
+    :param limit: Number of objects requested per page
+    :param max_concurrency: Maximum number of pages fetched at the same time
+    :param fields: List of the names of the fields to request. All fields are returned if not set.
+    :param raw: Return the objects as plain dicts rather than models. Always the case if fields are given, as
+        projected objects may lack fields the models require.
+    :param kwargs: Additional arguments passed to every call of list_func
+    :return: Generator of all objects, in the order returned by the API
+    """
+    if fields or raw:
+        list_func = _raw_list(getattr(list_func.__self__, f"{list_func.__name__}_without_preload_content"))
+    if fields:
+        kwargs["fields"] = ",".join(fields)
 
-        return all_results
+    for page in iter_pages(list_func, limit=limit, max_concurrency=max_concurrency, **kwargs):
+        for obj in page:
+            yield obj
+
+
+def run_concurrently(func, items, max_concurrency=1):
+    """
+    Call func for every item, with at most max_concurrency calls in flight.
+
+    API errors do not stop the remaining calls, they are returned with the item they were raised for.
+
+    :param func: Function called with a single item
+    :param items: Iterable of items
+    :param max_concurrency: Maximum number of calls made at the same time
+    :return: List of (item, result, error) tuples, in the order of items. error is the ApiException raised, if any.
+    """
+
+    def _call(item):
+        try:
+            return item, func(item), None
+        except ApiException as e:
+            return item, None, e
+
+    if max_concurrency <= 1:
+        return [_call(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        return list(executor.map(_call, items))
+
+
+class ProbedObject(object):
+    """
+    An object read with only some of its fields, standing in for the model of the full object.
+    """
+
+    def __init__(self, fields):
+        self._fields = fields
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self._fields.get(name)
+
+    def __repr__(self):
+        return repr(self._fields)
+
+    def model_dump(self, by_alias=True, exclude_none=True):
+        return {k: v for k, v in self._fields.items() if v is not None or not exclude_none}
+
+
+class _RawPage(object):
+    def __init__(self, results):
+        self.results = results
+
+
+def _raw_list(list_func):
+    """
+    Adapt the ``*_without_preload_content`` variant of a list API method, so that it returns pages of plain dicts.
+
+    :param list_func: The list method variant returning the raw HTTP response
+    :return: Function with the same arguments as list_func, returning an object with a ``results`` list
+    """
+
+    def _list(**kwargs):
+        resp = list_func(**kwargs)
+        if not 200 <= resp.status <= 299:
+            raise ApiException(status=resp.status, reason=resp.reason, body=resp.data.decode("utf-8", "replace"))
+        return _RawPage(json.loads(resp.data).get("results"))
+
+    return _list
+
+
+def universal_ddi_info_argument_spec():
+    return dict(
+        dest=dict(type="path"),
+        fields=dict(type="list", elements="str"),
+        max_concurrency=dict(type="int", default=4),
+    )
+
+
+def universal_ddi_find_argument_spec():
+    return dict(
+        assume_absent=dict(type="bool", default=False),
+    )
+
+
+def universal_ddi_write_argument_spec():
+    return dict(
+        return_object=dict(type="str", choices=["minimal", "full"], default="full"),
+    )
 
 
 def universal_ddi_client_common_argument_spec():
@@ -112,18 +468,197 @@ def universal_ddi_client_common_argument_spec():
             fallback=(env_fallback, ["INFOBLOX_PORTAL_URL"]),
             default="https://csp.infoblox.com",
         ),
+        pool_size=dict(
+            type="int",
+            fallback=(env_fallback, ["INFOBLOX_POOL_SIZE"]),
+            default=10,
+        ),
+        trace=dict(
+            type="bool",
+            fallback=(env_fallback, ["INFOBLOX_TRACE"]),
+            default=False,
+        ),
+        max_retries=dict(
+            type="int",
+            fallback=(env_fallback, ["INFOBLOX_MAX_RETRIES"]),
+            default=5,
+        ),
+        rate_limit=dict(
+            type="float",
+            fallback=(env_fallback, ["INFOBLOX_RATE_LIMIT"]),
+        ),
     )
 
 
-def _get_client(module):
-    config = _get_client_config(module)
-    client = universal_ddi_client.ApiClient(config)
+class _TokenBucket(object):
+    """
+    Client side rate limit, allowing rate requests per second on average and bursts of up to burst requests.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.capacity = float(burst or max(1.0, self.rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Take a token, waiting until one is available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Tokens are reserved ahead, so that concurrent callers wait in turn rather than all at once
+            self._tokens -= 1
+            wait = -self._tokens / self.rate
+        if wait > 0:
+            time.sleep(wait)
+
+
+def _retry_after(resp):
+    """
+    Get the delay requested by the Retry-After header of a response, in seconds.
+    """
+    value = resp.getheader("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_delay(attempt, retry_after=None):
+    """
+    Get the delay before a retry: the delay requested by the server if any, otherwise an exponential backoff with full
+    jitter, so that concurrent clients that were throttled together do not retry together.
+    """
+    if retry_after is not None:
+        return min(retry_after, _MAX_RETRY_DELAY)
+    return random.uniform(0, min(_RETRY_BACKOFF * 2**attempt, _MAX_RETRY_DELAY))
+
+
+class _RESTClient(object):
+    """
+    Wraps the REST client of an ApiClient, so that every request made through it can be instrumented, retried and
+    rate limited.
+
+    When ``trace`` is set to a list, a compact record is appended to it for every request, including retries.
+
+    Requests are retried up to ``max_retries`` times when the portal is rate limiting them, is unavailable or cannot be
+    reached. POST requests creating objects and DELETE requests are only retried when they were rate limited or could
+    not be sent at all, so that an object is never created twice and a deleted object is not reported as missing.
+
+    Connection errors left once the retries are exhausted are raised as ApiException with status 0, so that modules
+    report them like any other API error.
+    """
+
+    def __init__(self, rest_client):
+        self._rest_client = rest_client
+        self.trace = None
+        self.max_retries = 0
+        self._limiter = None
+
+    def __getattr__(self, name):
+        return getattr(self._rest_client, name)
+
+    def set_rate_limit(self, rate):
+        """
+        Limit the requests made through the client to rate requests per second on average. No limit if not set.
+        """
+        if not rate or rate <= 0:
+            self._limiter = None
+        elif self._limiter is None or self._limiter.rate != rate:
+            self._limiter = _TokenBucket(rate)
+
+    def _can_retry(self, method, attempt, status=None, sent=True):
+        if attempt >= self.max_retries:
+            return False
+        if method.upper() in _NON_IDEMPOTENT_METHODS:
+            return status == 429 or not sent
+        return True
+
+    def request(self, method, url, headers=None, body=None, post_params=None, _request_timeout=None):
+        attempt = 0
+        while True:
+            if self._limiter is not None:
+                self._limiter.acquire()
+
+            start = time.monotonic()
+            try:
+                resp = self._rest_client.request(
+                    method, url, headers=headers, body=body, post_params=post_params, _request_timeout=_request_timeout
+                )
+            except urllib3.exceptions.HTTPError as e:
+                # The request was not sent if the connection could not be established
+                reason = getattr(e, "reason", e)
+                sent = not isinstance(
+                    reason, (urllib3.exceptions.NewConnectionError, urllib3.exceptions.ConnectTimeoutError)
+                )
+                if not self._can_retry(method, attempt, sent=sent):
+                    raise ApiException(status=0, reason=str(e))
+                time.sleep(_retry_delay(attempt))
+                attempt += 1
+                continue
+
+            if self.trace is not None:
+                # The body is cached on the response, so reading it here does not change what the caller sees
+                data = resp.read()
+                parts = urlsplit(url)
+                self.trace.append(
+                    dict(
+                        method=method.upper(),
+                        path=f"{parts.path}?{parts.query}" if parts.query else parts.path,
+                        status=resp.status,
+                        bytes=len(data) if data else 0,
+                        latency_ms=round((time.monotonic() - start) * 1000, 1),
+                    )
+                )
+
+            if resp.status not in _RETRY_STATUSES or not self._can_retry(method, attempt, status=resp.status):
+                return resp
+
+            # Release the connection before waiting
+            resp.read()
+            time.sleep(_retry_delay(attempt, _retry_after(resp)))
+            attempt += 1
+
+
+def get_client(params):
+    """
+    Get the API client for the connection options, shared by everything running in the same process.
+
+    Also used by the plugins running on the controller, e.g. inventory plugins.
+
+    :param params: The connection options, i.e. the options of universal_ddi_client_common_argument_spec
+    :return: The API client, set up with the retries and rate limit of params
+    """
+    config = _get_client_config(params)
+    key = (config.portal_url, config.portal_key, config.connection_pool_maxsize)
+
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            client = universal_ddi_client.ApiClient(config)
+            # Responses are decoded transparently by urllib3
+            client.set_default_header("Accept-Encoding", "gzip, deflate")
+            client.rest_client = _RESTClient(client.rest_client)
+            _CLIENTS[key] = client
+
+    client.rest_client.max_retries = params.get("max_retries") or 0
+    client.rest_client.set_rate_limit(params.get("rate_limit"))
     return client
 
 
-def _get_client_config(module):
-    portal_url = module.params.get("portal_url")
-    portal_key = module.params.get("portal_key")
+def _get_client_config(params):
+    portal_url = params.get("portal_url")
+    portal_key = params.get("portal_key")
 
     # Use None for empty values, so that the client can handle it
     if not portal_url:
@@ -136,40 +671,8 @@ def _get_client_config(module):
         portal_key=portal_key,
         client_name="ansible",
     )
-    config.debug = True
+    config.connection_pool_maxsize = params.get("pool_size")
+    config.socket_options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    # Requests are retried by _RESTClient, urllib3 must not retry them on its own
+    config.retries = urllib3.Retry(total=0, respect_retry_after_header=False, raise_on_status=False)
     return config
-
-
-def _is_changed(existing, payload):
-    """
-    Check if the existing object is different from the payload.
-    The payload keys that are not none are considered for comparison, others are ignored.
-    If the value is a complex object, the comparison is done recursively.
-
-    :param existing:
-    :param payload:
-    :return:
-    """
-    changed = False
-    for k, v in payload.items():
-        if v is not None:
-            if k not in existing:
-                changed = True
-            elif isinstance(v, list):
-                # If the order of the list is different, it is considered as changed
-                if len(v) != len(existing[k]):
-                    changed = True
-                else:
-                    for i in range(len(v)):
-                        if isinstance(v[i], dict) or isinstance(v[i], list):
-                            changed = _is_changed(existing[k][i], v[i])
-                        else:
-                            changed = existing[k][i] != v[i]  # Direct comparison for primitives
-            elif isinstance(v, dict):
-                changed = _is_changed(existing[k], v)
-            elif existing[k] != v:
-                changed = True
-        if changed:
-            break
-
-    return changed
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Infoblox
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import ipaddress
+
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.intervals import (
+    aligned_blocks,
+    interval_of,
+    merge,
+    subtract,
+)
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import run_concurrently
+
+# The largest count accepted by the next available IP, subnet and address block endpoints
+MAX_COUNT = 20
+
+
+def rank(candidates):
+    """
+    Order (capacity, id) candidates by descending capacity, dropping the ones known to be full.
+
+    The sort is stable: candidates of unknown capacity (-1) come last, in their original order.
+    """
+    return [c for c in sorted(candidates, key=lambda c: -c[0]) if c[0] != 0]
+
+
+def _wave(candidates, start, needed, max_concurrency):
+    """
+    The end of the next wave of candidates: as many as their capacity requires for the needed results.
+    """
+    end, capacity = start, 0
+    while end < len(candidates) and end - start < max_concurrency and capacity < needed:
+        capacity += candidates[end][0] if candidates[end][0] > 0 else needed
+        end += 1
+    return end
+
+
+def find_next_available(query, candidates, count, max_concurrency=1, key=None, whole=False):
+    """
+    Find next available addresses or networks in several resources.
+
+    Each resource is queried once, for the results still needed, and query is responsible for asking the API for them
+    in requests it accepts. The candidates are queried in waves of up to max_concurrency resources at the same time,
+    each wave with only as many resources as their capacity requires, until count results are found.
+
+    :param query: Function called with the id of a resource and a count, returning the list of results, possibly
+        fewer than count, or None if the resource cannot return them
+    :param candidates: List of (capacity, id) tuples in order of preference, as returned by rank. The capacity is the
+        number of results the resource can return, or -1 if unknown.
+    :param count: The number of results to find
+    :param max_concurrency: The maximum number of resources queried at the same time
+    :param key: Function returning the identity of a result, e.g. its address. Results already found in another
+        resource, e.g. a nested address block, are dropped.
+    :param whole: All results must come from a single resource, e.g. contiguous addresses. Only resources that return
+        count results are used.
+    :return: List of up to count results, from the resources in order of preference
+    :raises ApiException: The first error raised by query, once the resources queried at the same time are done
+    """
+    key = key or (lambda r: r)
+    max_concurrency = max(1, max_concurrency)
+
+    if whole:
+        candidates = [c for c in candidates if c[0] < 0 or c[0] >= count]
+        for start in range(0, len(candidates), max_concurrency):
+            wave = candidates[start : start + max_concurrency]
+            for _, results, error in run_concurrently(lambda c: query(c[1], count), wave, max_concurrency):
+                if error is not None:
+                    raise error
+                if isinstance(results, list) and len(results) >= count:
+                    return results[:count]
+        return []
+
+    found, seen = [], set()
+    start = 0
+    while start < len(candidates) and len(found) < count:
+        remaining = count - len(found)
+        end = _wave(candidates, start, remaining, max_concurrency)
+
+        def _search(candidate):
+            capacity, id = candidate
+            return query(id, min(remaining, capacity) if capacity > 0 else remaining)
+
+        for _, results, error in run_concurrently(_search, candidates[start:end], max_concurrency):
+            if error is not None:
+                raise error
+            for r in results or []:
+                if key(r) not in seen:
+                    seen.add(key(r))
+                    found.append(r)
+        start = end
+
+    return found[:count]
+
+
+def next_available_networks(network, children, cidr, count):
+    """
+    Compute the first free networks of a prefix length in a network, e.g. the next available subnets of an address
+    block, without asking the API.
+
+    :param network: The parent network, as "a.b.c.d/n"
+    :param children: Iterable of the networks and ranges in use in the parent, as accepted by interval_of
+    :param cidr: The prefix length of the networks to find
+    :param count: The number of networks to find
+    :return: List of up to count network addresses, as strings in ascending order
+    """
+    version, first, last = interval_of(network)
+    make, bits = (ipaddress.IPv4Address, 32) if version == 4 else (ipaddress.IPv6Address, 128)
+    used = []
+    for child in children:
+        child_version, child_first, child_last = interval_of(child)
+        if child_version == version:
+            used.append((child_first, child_last))
+    free = subtract(first, last, merge(used))
+    return [str(make(start)) for start in aligned_blocks(free, 1 << (bits - cidr), count)]
+
+
+def compute_next_available(address_blocks, find_children, cidr, count, message, first_of=None):
+    """
+    Compute the next available networks of address blocks, from the address blocks, subnets and ranges already in
+    them, without asking the API for them, e.g. the next available subnets or address blocks.
+
+    The children of all the address blocks are read at once, then the free space of each address block is carved in
+    networks of the requested CIDR, in ascending order, until count networks are found. Address blocks that are too
+    small for the CIDR are skipped. As the API may not agree with the networks computed, e.g. if a network was created
+    in the meantime, the first network is checked against the next available network returned by the API.
+
+    :param address_blocks: The address blocks, in order of preference
+    :param find_children: Function called with the ids of the address blocks, returning a dict of the networks and
+        ranges in use in each of them, as accepted by next_available_networks, keyed by address block id
+    :param cidr: The prefix length of the networks to find
+    :param count: The number of networks to find
+    :param message: The error message if no address block can hold the CIDR, with a {bits} placeholder for the number
+        of bits of the addresses
+    :param first_of: Function called with the id of the address block of the first network, returning the address of
+        the next available network of the CIDR returned by the API, or None if it returns none
+    :return: List of up to count network addresses
+    :raises ValueError: No address block can hold networks of the CIDR, or the first network is not the one returned
+        by the API
+    """
+    bits = [32 if ipaddress.ip_address(ab.address).version == 4 else 128 for ab in address_blocks]
+    candidates = [ab for ab, max_cidr in zip(address_blocks, bits) if ab.cidr < cidr <= max_cidr]
+    if not candidates:
+        raise ValueError(message.format(bits=bits[0]))
+
+    children = find_children([ab.id for ab in candidates])
+    results, first = [], None
+    for ab in candidates:
+        if len(results) >= count:
+            break
+        networks = next_available_networks(
+            f"{ab.address}/{ab.cidr}", children.get(ab.id, []), cidr, count - len(results)
+        )
+        if networks and first is None:
+            first = ab
+        results.extend(networks)
+
+    if first_of is not None and first is not None:
+        expected = first_of(first.id)
+        # Compare the addresses, not their spelling, e.g. of IPv6 addresses
+        if not expected or ipaddress.ip_address(expected.split("/")[0]) != ipaddress.ip_address(results[0]):
+            returned = f"{expected.split('/')[0]}/{cidr}" if expected else "none"
+            raise ValueError(
+                f"The next available network computed in {first.id} is {results[0]}/{cidr}, but the API returns "
+                f"{returned}. Its networks may have changed in the meantime."
+            )
+    return results
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Infoblox
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import ipaddress
+
+# The types of networks, from the outermost: address blocks are in address blocks, subnets are in address blocks and
+# ranges are in subnets or address blocks
+NETWORK_TYPES = ("address_block", "subnet", "range")
+_RANK = dict((network_type, rank) for rank, network_type in enumerate(NETWORK_TYPES))
+
+
+def network_of(network_type, address=None, cidr=None, start=None, end=None):
+    """
+    Get the addresses of a network as integers.
+
+    :param network_type: One of NETWORK_TYPES
+    :param address: The address of an address block or a subnet, as "a.b.c.d/n" or "a.b.c.d" with cidr
+    :param cidr: The CIDR of an address block or a subnet, if not in address
+    :param start: The first address of a range
+    :param end: The last address of a range
+    :return: Tuple of the IP version, the first and the last address, and a description of the network
+    :raises ValueError: The addresses are not valid
+    """
+    if network_type == "range":
+        if not start or not end:
+            raise ValueError("a range needs a start and an end")
+        first, last = ipaddress.ip_address(start), ipaddress.ip_address(end)
+        if first.version != last.version or first > last:
+            raise ValueError(f"{start}-{end} is not a range of addresses")
+        return first.version, int(first), int(last), f"{first}-{last}"
+
+    if not address:
+        raise ValueError(f"{network_type.replace('_', ' ')} needs an address")
+    if "/" not in address:
+        if cidr is None:
+            raise ValueError(f"{address} has no CIDR")
+        address = f"{address}/{cidr}"
+    network = ipaddress.ip_network(address, strict=False)
+    return network.version, int(network.network_address), int(network.broadcast_address), str(network)
+
+
+def _describe(entry):
+    network_type = entry["type"].replace("_", " ")
+    if entry.get("id"):
+        return f"{network_type} {entry['description']} ({entry['id']})"
+    if entry.get("index") is not None:
+        return f"{network_type} {entry['description']} (item {entry['index']})"
+    return f"{network_type} {entry['description']}"
+
+
+def _check(entry, container):
+    """
+    Check a network against the smallest network containing or overlapping it.
+
+    :return: Tuple of the status and the message, or None if the network can be in the container
+    """
+    if entry["last"] > container["last"]:
+        return "conflict", f"overlaps {_describe(container)}"
+    if (entry["first"], entry["last"], entry["type"]) == (container["first"], container["last"], container["type"]):
+        if container.get("planned"):
+            return "duplicate", f"is the same as {_describe(container)}"
+        return "exists", f"is {_describe(container)}"
+    if _RANK[entry["type"]] < _RANK[container["type"]] or (
+        entry["type"] == container["type"] and entry["type"] != "address_block"
+    ):
+        return "conflict", f"cannot be in {_describe(container)}"
+    return None
+
+
+def find_conflicts(existing, planned):
+    """
+    Check planned networks against the existing networks and against each other, before creating any of them.
+
+    The networks of each IP space and IP version are sorted once, the outermost first, and swept with a stack of the
+    networks containing the current one, which takes O(n log n) for n networks. Networks must be nested or disjoint:
+    address blocks may be nested, subnets must be in address blocks or outside of them, ranges must be in a subnet or
+    an address block, and no network may partially overlap another one.
+
+    :param existing: Iterable of the existing networks, as dicts with space, type, id, version, first, last and
+        description, e.g. from network_of
+    :param planned: List of the planned networks, as dicts with space, type, version, first, last and description
+    :return: List with, for each planned network, None if it can be created, or a dict with its status ("exists" if
+        the same network already exists, "duplicate" if it is planned twice, or "conflict") and a message
+    """
+    entries = [dict(e, planned=False) for e in existing]
+    entries.extend(dict(p, planned=True, index=i) for i, p in enumerate(planned))
+    # Outermost first, existing networks before the same planned networks
+    entries.sort(key=lambda e: (e["space"], e["version"], e["first"], -e["last"], _RANK[e["type"]], e["planned"]))
+
+    results = [None] * len(planned)
+    stack = []
+    scope = None
+    for entry in entries:
+        if (entry["space"], entry["version"]) != scope:
+            scope = (entry["space"], entry["version"])
+            stack = []
+        while stack and stack[-1]["last"] < entry["first"]:
+            stack.pop()
+
+        problem = _check(entry, stack[-1]) if stack else None
+        if problem is None:
+            stack.append(entry)
+            continue
+
+        status, msg = problem
+        if entry["planned"]:
+            results[entry["index"]] = dict(status=status, msg=f"{_describe(entry)} {msg}")
+        elif stack[-1]["planned"] and results[stack[-1]["index"]] is None:
+            # An existing network would be in a planned network, e.g. an address block in a planned subnet
+            container = stack[-1]
+            results[container["index"]] = dict(status=status, msg=f"{_describe(entry)} {msg}")
+        if not entry["planned"]:
+            # Existing networks are consistent with each other
+            stack.append(entry)
+    return results
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Infoblox
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import ipaddress
+import socket
+from array import array
+from bisect import bisect_left, bisect_right
+
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.intervals import (
+    IntervalSet,
+    interval_of,
+    largest_prefix,
+)
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+_BITS = {4: 32, 6: 128}
+
+
+def _address_value(address):
+    """
+    The IP version and the integer value of an address, or None if it is not an address.
+    """
+    try:
+        # Much faster than ipaddress for the many IPv4 addresses of an IP space
+        return 4, int.from_bytes(socket.inet_pton(socket.AF_INET, address), "big")
+    except (OSError, TypeError):
+        pass
+    try:
+        value = ipaddress.ip_address(address)
+    except ValueError:
+        return None
+    return value.version, int(value)
+
+
+class AddressIndex(object):
+    """
+    The addresses in use of one IP version, sorted to count the addresses in any interval in O(log n).
+
+    IPv4 addresses are held as 32-bit integers, and sorted and searched with NumPy if it is installed, so that millions
+    of addresses take a few megabytes.
+    """
+
+    def __init__(self, version):
+        self.version = version
+        self._values = array("I") if version == 4 else []
+        self._sorted = None
+
+    def add(self, value):
+        self._values.append(value)
+        self._sorted = None
+
+    def __len__(self):
+        return len(self._values)
+
+    def _index(self):
+        if self._sorted is None:
+            if HAS_NUMPY and self.version == 4:
+                self._sorted = np.sort(np.array(self._values, dtype=np.uint32))
+            else:
+                self._sorted = sorted(self._values)
+        return self._sorted
+
+    def count(self, first, last):
+        """
+        Count the addresses from first to last, both included.
+        """
+        index = self._index()
+        if HAS_NUMPY and self.version == 4:
+            return int(np.searchsorted(index, last, side="right") - np.searchsorted(index, first, side="left"))
+        return bisect_right(index, last) - bisect_left(index, first)
+
+
+def _usage(version, first, last, used, addresses):
+    """
+    The free space of an interval, given the intervals in use.
+    """
+    bits = _BITS[version]
+    total = last - first + 1
+    gaps = used.gaps(first, last)
+    free = sum(gap_last - gap_first + 1 for gap_first, gap_last in gaps)
+
+    largest = None
+    for gap_first, gap_last in gaps:
+        prefix = largest_prefix(gap_first, gap_last, bits)
+        largest = prefix if largest is None else min(largest, prefix)
+
+    usage = dict(
+        total=total,
+        used=total - free,
+        free=free,
+        utilization=round(100.0 * (total - free) / total, 2),
+        free_ranges=len(gaps),
+        largest_free_cidr=largest,
+        # The share of the free space that is not in the largest free network
+        fragmentation=round(1 - float(1 << (bits - largest)) / free, 4) if free else 0.0,
+    )
+    if addresses is not None:
+        usage["addresses"] = addresses[version].count(first, last)
+    return usage
+
+
+def space_utilization(blocks, networks, addresses=None):
+    """
+    Compute the free space and the utilization of the address blocks of an IP space.
+
+    The space used in an address block is the space of the subnets and ranges in it, at any depth. Address blocks
+    nested in it are not used space. The addresses are streamed into sorted arrays and are not kept otherwise.
+
+    :param blocks: Iterable of the address blocks, as dicts with at least address and cidr
+    :param networks: Iterable of the subnets as "a.b.c.d/n" and of the ranges as (start, end) tuples
+    :param addresses: Iterable of the addresses in use, or None not to count them
+    :return: Tuple of the list of the address blocks with their utilization, by IP version and address, and of a
+        summary of the IP space by IP version
+    """
+    intervals = {4: [], 6: []}
+    for network in networks:
+        version, first, last = interval_of(network)
+        intervals[version].append((first, last))
+    used = dict((version, IntervalSet(values)) for version, values in intervals.items())
+
+    index = None
+    if addresses is not None:
+        index = {4: AddressIndex(4), 6: AddressIndex(6)}
+        for address in addresses:
+            value = _address_value(address)
+            if value is not None:
+                index[value[0]].add(value[1])
+
+    keyed = []
+    for block in blocks:
+        version, first, last = interval_of(f"{block['address']}/{block['cidr']}")
+        # Parent address blocks before the address blocks nested in them
+        keyed.append(((version, first, -last), last, block))
+    keyed.sort(key=lambda k: k[0])
+
+    results = []
+    spans = {4: [], 6: []}
+    for (version, first, _), last, block in keyed:
+        results.append(dict(block, **_usage(version, first, last, used[version], index)))
+        spans[version].append((first, last))
+
+    summary = {}
+    for version, values in spans.items():
+        space = IntervalSet(values)
+        if not space.size:
+            continue
+        free = sum(b - a + 1 for first, last in space for a, b in used[version].gaps(first, last))
+        summary[f"ipv{version}"] = dict(
+            blocks=len(values),
+            total=space.size,
+            used=space.size - free,
+            free=free,
+            utilization=round(100.0 * (space.size - free) / space.size, 2),
+        )
+        if index is not None:
+            summary[f"ipv{version}"]["addresses"] = sum(index[version].count(first, last) for first, last in space)
+    return results, summary
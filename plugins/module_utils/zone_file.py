@@ -0,0 +1,384 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2024 Infoblox
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import re
+
+# Maximum nesting of $INCLUDE directives
+_MAX_INCLUDE_DEPTH = 10
+
+_CLASSES = ["IN", "CH", "CS", "HS"]
+
+_TTL_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+_TTL_RE = re.compile(r"^(\d+[smhdw])+$", re.IGNORECASE)
+
+
+class ZoneFileError(Exception):
+    """
+    Raised when a zone file cannot be parsed.
+    """
+
+    def __init__(self, msg, location=None):
+        super(ZoneFileError, self).__init__(f"{location}: {msg}" if location else msg)
+
+
+class UnsupportedRecordError(ZoneFileError):
+    """
+    Raised for records that are valid in a zone file but cannot be mapped to the record data of the API.
+    """
+
+
+class _Quoted(str):
+    """
+    A token that was quoted in the zone file.
+    """
+
+
+def parse_ttl(value, location=None):
+    """
+    Parse a TTL in seconds, either as a plain number or in the BIND format, e.g. I(1h30m).
+    """
+    if value.isdigit():
+        return int(value)
+    if not _TTL_RE.match(value):
+        raise ZoneFileError(f"Invalid TTL: {value}", location)
+    return sum(int(n) * _TTL_UNITS[u.lower()] for n, u in re.findall(r"(\d+)([a-zA-Z])", value))
+
+
+def _is_ttl(value):
+    return value.isdigit() or bool(_TTL_RE.match(value))
+
+
+def _unescape(value):
+    """
+    Resolve the \\X and \\DDD escapes of a zone file string.
+    """
+    return re.sub(r"\\(\d{3}|.)", lambda m: chr(int(m.group(1))) if m.group(1).isdigit() else m.group(1), value)
+
+
+def _tokenize(line, location):
+    """
+    Split a line into tokens, returning the tokens and the change of the parentheses depth.
+    """
+    tokens = []
+    depth = 0
+    i = 0
+    n = len(line)
+    while i < n:
+        c = line[i]
+        if c in " \t\r\n":
+            i += 1
+        elif c == ";":
+            break
+        elif c == "(":
+            depth += 1
+            i += 1
+        elif c == ")":
+            depth -= 1
+            i += 1
+        elif c == '"':
+            j = i + 1
+            while j < n and line[j] != '"':
+                j += 2 if line[j] == "\\" else 1
+            if j >= n:
+                raise ZoneFileError("Unterminated quoted string", location)
+            tokens.append(_Quoted(_unescape(line[i + 1 : j])))
+            i = j + 1
+        else:
+            j = i
+            while j < n and line[j] not in ' \t\r\n;()"':
+                j += 2 if line[j] == "\\" else 1
+            tokens.append(line[i:j])
+            i = j
+    return tokens, depth
+
+
+def _entries(path):
+    """
+    Read the logical entries of a zone file, joining the lines of entries spanning parentheses.
+
+    :return: Generator of (location, tokens, has_owner) tuples. has_owner is false for entries starting with whitespace,
+        which reuse the owner of the previous record.
+    """
+    with open(path, encoding="utf-8") as f:
+        tokens, depth, has_owner, location = [], 0, True, None
+        for lineno, line in enumerate(f, 1):
+            if depth == 0:
+                location = f"{path}:{lineno}"
+                has_owner = bool(line) and line[0] not in " \t"
+            line_tokens, delta = _tokenize(line, f"{path}:{lineno}")
+            tokens.extend(line_tokens)
+            depth += delta
+            if depth < 0:
+                raise ZoneFileError("Unbalanced parentheses", f"{path}:{lineno}")
+            if depth == 0 and tokens:
+                yield location, tokens, has_owner
+                tokens = []
+        if depth:
+            raise ZoneFileError("Unbalanced parentheses", location)
+
+
+def absolute_name(name, origin):
+    """
+    Make a domain name of a zone file absolute, relative to origin.
+    """
+    if name == "@":
+        return origin
+    if name.endswith(".") and not name.endswith("\\."):
+        return name
+    return f"{name}.{origin}" if origin != "." else f"{name}."
+
+
+def iter_records(path, origin, default_ttl=None):
+    """
+    Parse a zone file, including the files it references with $INCLUDE.
+
+    The file is read as a stream, the records are yielded as they are parsed.
+
+    :param path: Path of the zone file
+    :param origin: The initial origin, i.e. the name of the zone
+    :param default_ttl: TTL of the records that do not have one, until a $TTL directive is found
+    :return: Generator of dicts with the owner I(name) of the record, its I(ttl), I(type), the tokens of its record
+        I(data), its I(record_class), the I(origin) relative names in the record data refer to and the I(location) it
+        was read from
+    """
+    state = dict(owner=None, ttl=default_ttl, last_ttl=default_ttl)
+    origin = absolute_name(origin, ".") if origin else "."
+    for record in _iter_file(path, origin, state, 0):
+        yield record
+
+
+def _iter_file(path, origin, state, depth):
+    if depth > _MAX_INCLUDE_DEPTH:
+        raise ZoneFileError("Too many nested $INCLUDE directives", path)
+
+    for location, tokens, has_owner in _entries(path):
+        if tokens[0].startswith("$") and not isinstance(tokens[0], _Quoted):
+            directive = tokens[0].upper()
+            if directive == "$ORIGIN" and len(tokens) == 2:
+                origin = absolute_name(tokens[1], origin)
+            elif directive == "$TTL" and len(tokens) == 2:
+                state["ttl"] = parse_ttl(tokens[1], location)
+            elif directive == "$INCLUDE" and len(tokens) in (2, 3):
+                include = os.path.join(os.path.dirname(path), tokens[1])
+                include_origin = absolute_name(tokens[2], origin) if len(tokens) == 3 else origin
+                # The included file does not change the origin of the including one
+                for record in _iter_file(include, include_origin, state, depth + 1):
+                    yield record
+            else:
+                raise ZoneFileError(f"Unsupported directive: {' '.join(tokens)}", location)
+            continue
+
+        tokens = list(tokens)
+        if has_owner:
+            state["owner"] = absolute_name(tokens.pop(0), origin)
+        elif state["owner"] is None:
+            raise ZoneFileError("Record without owner name", location)
+
+        ttl = None
+        record_class = "IN"
+        for _ in range(2):
+            if tokens and ttl is None and _is_ttl(tokens[0]):
+                ttl = parse_ttl(tokens.pop(0), location)
+            elif tokens and tokens[0].upper() in _CLASSES:
+                record_class = tokens.pop(0).upper()
+        if not tokens:
+            raise ZoneFileError("Record without type", location)
+
+        if ttl is None:
+            # RFC 2308 $TTL, falling back to the last explicit TTL as in RFC 1035
+            ttl = state["ttl"] if state["ttl"] is not None else state["last_ttl"]
+        else:
+            state["last_ttl"] = ttl
+
+        yield dict(
+            name=state["owner"],
+            ttl=ttl,
+            type=tokens[0].upper(),
+            data=tokens[1:],
+            record_class=record_class,
+            origin=origin,
+            location=location,
+        )
+
+
+def name_in_zone(name, zone):
+    """
+    Get the name of a record relative to its zone, both given as absolute names.
+
+    :return: The relative name, an empty string for the zone apex, or None if the name is not in the zone
+    """
+    name, zone = name.lower(), zone.lower()
+    if name == zone:
+        return ""
+    if zone == ".":
+        return name.rstrip(".")
+    if name.endswith("." + zone):
+        return name[: -len(zone) - 1]
+    return None
+
+
+def _int(value, location):
+    try:
+        return int(value)
+    except ValueError:
+        raise ZoneFileError(f"Invalid number: {value}", location)
+
+
+# Record data layouts, as (field, kind) pairs in the order of the zone file presentation format. The kind is one of
+# I(int), I(name) for domain names, I(ttl), I(str) or I(rest) for a field made of all remaining tokens.
+_RDATA_LAYOUTS = {
+    "A": [("address", "str")],
+    "AAAA": [("address", "str")],
+    "CAA": [("flags", "int"), ("tag", "str"), ("value", "str")],
+    "CNAME": [("cname", "name")],
+    "DHCID": [("dhcid", "rest")],
+    "DNAME": [("target", "name")],
+    "HTTPS": [("priority", "int"), ("target_name", "name")],
+    "MX": [("preference", "int"), ("exchange", "name")],
+    "NAPTR": [
+        ("order", "int"),
+        ("preference", "int"),
+        ("flags", "str"),
+        ("services", "str"),
+        ("regexp", "str"),
+        ("replacement", "name"),
+    ],
+    "NS": [("dname", "name")],
+    "PTR": [("dname", "name")],
+    "SOA": [
+        ("mname", "name"),
+        ("rname", "name"),
+        ("serial", "int"),
+        ("refresh", "ttl"),
+        ("retry", "ttl"),
+        ("expire", "ttl"),
+        ("negative_ttl", "ttl"),
+    ],
+    "SRV": [("priority", "int"), ("weight", "int"), ("port", "int"), ("target", "name")],
+    "SSHFP": [("algorithm", "int"), ("fingerprint_type", "int"), ("fingerprint", "rest")],
+    "SVCB": [("priority", "int"), ("target_name", "name")],
+    "TXT": [("text", "text")],
+}
+
+SUPPORTED_TYPES = sorted(_RDATA_LAYOUTS)
+
+
+def rdata_of(record):
+    """
+    Map the record data tokens of a parsed record to the record data of the API.
+
+    :param record: A record as returned by iter_records
+    :return: The record data, as a dict
+    :raises UnsupportedRecordError: if the record type or the record data cannot be represented by the API
+    """
+    location = record["location"]
+    if record["record_class"] != "IN":
+        raise UnsupportedRecordError(f"Unsupported class: {record['record_class']}", location)
+
+    layout = _RDATA_LAYOUTS.get(record["type"])
+    if layout is None:
+        raise UnsupportedRecordError(f"Unsupported record type: {record['type']}", location)
+
+    data = list(record["data"])
+    if data and data[0] == "\\#":
+        raise UnsupportedRecordError("Unsupported generic record data", location)
+
+    rdata = {}
+    for field, kind in layout:
+        if kind == "text":
+            if len(data) > 1 and not all(isinstance(d, _Quoted) for d in data):
+                # Unquoted tokens are separate character strings, e.g. hello world, kept apart by quoting each one
+                rdata[field] = " ".join(_quote(d if isinstance(d, _Quoted) else _unescape(d)) for d in data)
+            else:
+                # Quoted character strings are joined, as for the long TXT records of DKIM keys
+                rdata[field] = "".join(d if isinstance(d, _Quoted) else _unescape(d) for d in data)
+            data = []
+        elif kind == "rest":
+            rdata[field] = "".join(data)
+            data = []
+        elif not data:
+            raise ZoneFileError(f"Missing {field} in {record['type']} record", location)
+        elif kind == "int":
+            rdata[field] = _int(data.pop(0), location)
+        elif kind == "ttl":
+            rdata[field] = parse_ttl(data.pop(0), location)
+        elif kind == "name":
+            rdata[field] = absolute_name(data.pop(0), record["origin"])
+        else:
+            rdata[field] = data.pop(0)
+
+    if data:
+        if record["type"] in ("HTTPS", "SVCB"):
+            raise UnsupportedRecordError("Unsupported service parameters", location)
+        raise ZoneFileError(f"Unexpected data in {record['type']} record: {' '.join(data)}", location)
+    return rdata
+
+
+# Record data fields written as quoted strings
+_QUOTED_FIELDS = {"CAA": ["value"], "NAPTR": ["flags", "services", "regexp"], "TXT": ["text"]}
+
+# Maximum length of a character string
+_MAX_STRING_LENGTH = 255
+
+
+def _quote(value):
+    value = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{value}"'
+
+
+def format_record(record):
+    """
+    Format a record of the API in the zone file presentation format, with its owner name relative to its zone.
+
+    :param record: The record, as a dict with at least its I(name_in_zone), I(type) and I(rdata)
+    :return: The line of the record, or a comment for records whose data cannot be formatted
+    """
+    record_type = (record.get("type") or "").upper()
+    name = record.get("name_in_zone") or "@"
+    ttl = record.get("ttl")
+    rdata = record.get("rdata") or {}
+
+    layout = _RDATA_LAYOUTS.get(record_type)
+    if layout is None:
+        return f"; {name} {record_type}: unsupported record type"
+
+    data = []
+    for field, kind in layout:
+        value = rdata.get(field)
+        if value is None:
+            if kind in ("text", "rest") or field in _QUOTED_FIELDS.get(record_type, []):
+                value = ""
+            else:
+                return f"; {name} {record_type}: missing {field}"
+        if kind == "text":
+            # Long texts are split into character strings, as they are joined when read
+            chunks = [value[i : i + _MAX_STRING_LENGTH] for i in range(0, len(value), _MAX_STRING_LENGTH)]
+            data.extend(_quote(c) for c in chunks or [""])
+        elif field in _QUOTED_FIELDS.get(record_type, []):
+            data.append(_quote(value))
+        elif kind == "name":
+            data.append(value or "@")
+        else:
+            data.append(str(value))
+
+    fields = [name] + ([str(ttl)] if ttl is not None else []) + ["IN", record_type] + data
+    return " ".join(fields)
+
+
+def format_zone(records, origin):
+    """
+    Format the records of a zone as a zone file.
+
+    :param records: Iterable of records, as accepted by format_record
+    :param origin: The name of the zone
+    :return: Generator of the lines of the zone file
+    """
+    yield f"$ORIGIN {absolute_name(origin, '.')}"
+    for record in records:
+        yield format_record(record)
@@ -215,6 +215,7 @@ options:
 
 extends_documentation_fragment:
     - infoblox.universal_ddi.common
+    - infoblox.universal_ddi.find
 """  # noqa: E501
 
 EXAMPLES = r"""
@@ -520,7 +521,10 @@ item:
             returned: Always
 """  # noqa: E501
 
-from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import UniversalDDIAnsibleModule
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import (
+    UniversalDDIAnsibleModule,
+    universal_ddi_find_argument_spec,
+)
 
 try:
     from anycast import OnPremAnycastManagerApi, OnpremHost
@@ -535,7 +539,19 @@ class OnPremAnycastManagerModule(UniversalDDIAnsibleModule):
     def __init__(self, *args, **kwargs):
         super(OnPremAnycastManagerModule, self).__init__(*args, **kwargs)
 
-        exclude = ["state", "csp_url", "api_key", "portal_url", "portal_key", "id"]
+        exclude = [
+            "state",
+            "csp_url",
+            "api_key",
+            "portal_url",
+            "portal_key",
+            "pool_size",
+            "trace",
+            "max_retries",
+            "rate_limit",
+            "id",
+            "assume_absent",
+        ]
         self._payload_params = {k: v for k, v in self.params.items() if v is not None and k not in exclude}
         self._payload = OnpremHost.from_dict(self._payload_params)
         self._existing = None
@@ -561,7 +577,7 @@ class OnPremAnycastManagerModule(UniversalDDIAnsibleModule):
             # if existing is None, then it is a create operation
             return True
 
-        return self.is_changed(self.existing.model_dump(by_alias=True, exclude_none=True), self.payload_params)
+        return self.is_changed(self.existing, self.payload_params)
 
     def find(self):
         if self.params["id"] is not None:
@@ -638,7 +654,7 @@ class OnPremAnycastManagerModule(UniversalDDIAnsibleModule):
         # based on the state that is passed in, we will execute the appropriate
         # functions
         try:
-            self.existing = self.find()
+            self.existing = None if self.assume_absent else self.find()
             item = {}
             if self.params["state"] == "present" and self.existing is None:
                 item = self.create()
@@ -654,14 +670,21 @@ class OnPremAnycastManagerModule(UniversalDDIAnsibleModule):
                 result["changed"] = True
                 result["msg"] = "Anycast Host deleted"
 
+            if self._diff and self.params["state"] == "present" and self.existing is not None:
+                # Only the fields to update, compared before the update
+                result["diff"] = self.changes(self.existing, self.payload_params)
+
             if self.check_mode:
-                # if in check mode, do not update the result or the diff, just return the changed state
+                # if in check mode, do not update the result, just return the changed state and the diff
                 self.exit_json(**result)
 
-            result["diff"] = dict(
-                before=self.existing.model_dump(by_alias=True, exclude_none=True) if self.existing is not None else {},
-                after=item,
-            )
+            if "diff" not in result:
+                result["diff"] = dict(
+                    before=(
+                        self.existing.model_dump(by_alias=True, exclude_none=True) if self.existing is not None else {}
+                    ),
+                    after=item,
+                )
             result["object"] = item
             result["id"] = (
                 self.existing.id if self.existing is not None else item["id"] if (item and "id" in item) else None
@@ -735,6 +758,7 @@ def main():
         ipv6_address=dict(type="str"),
         name=dict(type="str"),
     )
+    module_args.update(universal_ddi_find_argument_spec())
 
     module = OnPremAnycastManagerModule(
         argument_spec=module_args,
@@ -273,6 +273,7 @@ options:
 
 extends_documentation_fragment:
     - infoblox.universal_ddi.common
+    - infoblox.universal_ddi.find
 """  # noqa: E501
 
 EXAMPLES = r"""
@@ -802,7 +803,10 @@ item:
             returned: Always
 """  # noqa: E501
 
-from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import UniversalDDIAnsibleModule
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import (
+    UniversalDDIAnsibleModule,
+    universal_ddi_find_argument_spec,
+)
 
 try:
     from cloud_discovery import DiscoveryConfig, ProvidersApi
@@ -815,7 +819,19 @@ class ProvidersModule(UniversalDDIAnsibleModule):
     def __init__(self, *args, **kwargs):
         super(ProvidersModule, self).__init__(*args, **kwargs)
 
-        exclude = ["state", "csp_url", "api_key", "portal_url", "portal_key", "id"]
+        exclude = [
+            "state",
+            "csp_url",
+            "api_key",
+            "portal_url",
+            "portal_key",
+            "pool_size",
+            "trace",
+            "max_retries",
+            "rate_limit",
+            "id",
+            "assume_absent",
+        ]
         self._payload_params = {k: v for k, v in self.params.items() if v is not None and k not in exclude}
         self._payload = DiscoveryConfig.from_dict(self._payload_params)
         self._existing = None
@@ -841,7 +857,7 @@ class ProvidersModule(UniversalDDIAnsibleModule):
             # if existing is None, then it is a create operation
             return True
 
-        return self.is_changed(self.existing.model_dump(by_alias=True, exclude_none=True), self.payload_params)
+        return self.is_changed(self.existing, self.payload_params)
 
     def find(self):
         if self.params["id"] is not None:
@@ -967,7 +983,7 @@ class ProvidersModule(UniversalDDIAnsibleModule):
         # based on the state that is passed in, we will execute the appropriate
         # functions
         try:
-            self.existing = self.find()
+            self.existing = None if self.assume_absent else self.find()
             item = {}
             if self.params["state"] == "present" and self.existing is None:
                 item = self.create()
@@ -983,14 +999,21 @@ class ProvidersModule(UniversalDDIAnsibleModule):
                 result["changed"] = True
                 result["msg"] = "Providers deleted"
 
+            if self._diff and self.params["state"] == "present" and self.existing is not None:
+                # Only the fields to update, compared before the update
+                result["diff"] = self.changes(self.existing, self.payload_params)
+
             if self.check_mode:
-                # if in check mode, do not update the result or the diff, just return the changed state
+                # if in check mode, do not update the result, just return the changed state and the diff
                 self.exit_json(**result)
 
-            result["diff"] = dict(
-                before=self.existing.model_dump(by_alias=True, exclude_none=True) if self.existing is not None else {},
-                after=item,
-            )
+            if "diff" not in result:
+                result["diff"] = dict(
+                    before=(
+                        self.existing.model_dump(by_alias=True, exclude_none=True) if self.existing is not None else {}
+                    ),
+                    after=item,
+                )
             result["object"] = item
             result["id"] = (
                 self.existing.id if self.existing is not None else item["id"] if (item and "id" in item) else None
@@ -1126,6 +1149,7 @@ def main():
         ),
         tags=dict(type="dict"),
     )
+    module_args.update(universal_ddi_find_argument_spec())
 
     module = ProvidersModule(
         argument_spec=module_args,
@@ -34,6 +34,7 @@ options:
 
 extends_documentation_fragment:
     - infoblox.universal_ddi.common
+    - infoblox.universal_ddi.info
 """  # noqa: E501
 
 EXAMPLES = r"""
@@ -456,11 +457,14 @@ objects:
             returned: Always
 """  # noqa: E501
 
-from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import UniversalDDIAnsibleModule
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import (
+    UniversalDDIAnsibleModule,
+    universal_ddi_info_argument_spec,
+)
 
 try:
     from cloud_discovery import ProvidersApi
-    from universal_ddi_client import ApiException, NotFoundException
+    from universal_ddi_client import NotFoundException
 except ImportError:
     pass  # Handled by UniversalDDIAnsibleModule
 
@@ -488,27 +492,7 @@ class ProvidersInfoModule(UniversalDDIAnsibleModule):
         elif self.params["filter_query"] is not None:
             filter_str = self.params["filter_query"]
 
-        all_results = []
-        offset = 0
-
-        while True:
-            try:
-                resp = ProvidersApi(self.client).list(offset=offset, limit=self._limit, filter=filter_str)
-
-                # If no results, set results to empty list
-                if not resp.results:
-                    resp.results = []
-
-                all_results.extend(resp.results)
-
-                if len(resp.results) < self._limit:
-                    break
-                offset += self._limit
-
-            except ApiException as e:
-                self.fail_json(msg=f"Failed to execute command: {e.status} {e.reason} {e.body}")
-
-        return all_results
+        return self.paginate(ProvidersApi(self.client).list, filter=filter_str, fields=self.params["fields"])
 
     def run_command(self):
         result = dict(objects=[])
@@ -518,9 +502,13 @@ class ProvidersInfoModule(UniversalDDIAnsibleModule):
 
         find_results = self.find()
 
+        if self.params["dest"] is not None:
+            result.update(self.write_objects(find_results))
+            self.exit_json(**result)
+
         all_results = []
         for r in find_results:
-            all_results.append(r.model_dump(by_alias=True, exclude_none=True))
+            all_results.append(r if isinstance(r, dict) else r.model_dump(by_alias=True, exclude_none=True))
 
         result["objects"] = all_results
         self.exit_json(**result)
@@ -533,6 +521,7 @@ def main():
         filters=dict(type="dict", required=False),
         filter_query=dict(type="str", required=False),
     )
+    module_args.update(universal_ddi_info_argument_spec())
 
     module = ProvidersInfoModule(
         argument_spec=module_args,
@@ -0,0 +1,507 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Infoblox Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+module: dhcp_fixed_address_bulk
+short_description: Manage many Fixed Addresses at once
+description:
+    - Creates, updates or deletes many fixed addresses in a single task, e.g. to migrate the MAC reservations of a DHCP server.
+    - The fixed addresses are given either with O(fixed_addresses) or in a CSV or JSON Lines file with O(src). Files are read as a stream and are not loaded in memory at once.
+    - The existing fixed addresses of the IP spaces involved are read once, the fixed addresses to create, update or delete are computed locally and the changes are applied concurrently in batches.
+    - MAC addresses and hexadecimal client identifiers are validated and normalized locally, e.g. V(00-1A-2B-3C-4D-5E) and V(001a.2b3c.4d5e) both become V(00:1a:2b:3c:4d:5e). Fixed addresses with invalid values are reported as failed without calling the API.
+    - A fixed address is identified by its O(fixed_addresses[].address) and O(fixed_addresses[].ip_space).
+version_added: 1.3.0
+author: Infoblox Inc. (@infobloxopen)
+options:
+    ip_space:
+        description:
+            - "The resource identifier of the IP space of the fixed addresses that do not set O(fixed_addresses[].ip_space)."
+        type: str
+    state:
+        description:
+            - Indicate desired state of the fixed addresses
+        type: str
+        required: false
+        choices:
+            - present
+            - absent
+        default: present
+    fixed_addresses:
+        description:
+            - "The fixed addresses."
+            - "Mutually exclusive with O(src)."
+        type: list
+        elements: dict
+        suboptions:
+            address:
+                description:
+                    - "The reserved address."
+                type: str
+                required: true
+            ip_space:
+                description:
+                    - "The resource identifier of the IP space. Defaults to O(ip_space)."
+                type: str
+            match_type:
+                description:
+                    - "Indicates how to match the client:"
+                    - "* I(mac): match the client MAC address for both IPv4 and IPv6,"
+                    - "* I(client_text) or I(client_hex): match the client identifier for IPv4 only,"
+                    - "* I(relay_text) or I(relay_hex): match the circuit ID or remote ID in the DHCP relay agent option (82) for IPv4 only,"
+                    - "* I(duid): match the DHCP unique identifier, currently match only for IPv6 protocol."
+                    - "Required with O(state=present)."
+                type: str
+                choices:
+                    - mac
+                    - client_text
+                    - client_hex
+                    - relay_text
+                    - relay_hex
+                    - duid
+            match_value:
+                description:
+                    - "The value to match."
+                    - "Required with O(state=present)."
+                type: str
+            name:
+                description:
+                    - "The name of the fixed address. May contain 1 to 256 characters. Can include UTF-8."
+                type: str
+            comment:
+                description:
+                    - "The description for the fixed address. May contain 0 to 1024 characters. Can include UTF-8."
+                type: str
+            hostname:
+                description:
+                    - "The DHCP host name."
+                type: str
+            disable_dhcp:
+                description:
+                    - "Optional. I(true) to disable object. A disabled object is effectively non-existent when generating configuration."
+                type: bool
+            dhcp_options:
+                description:
+                    - "The list of DHCP options. May be either a specific option or a group of options."
+                type: list
+                elements: dict
+                suboptions:
+                    group:
+                        description:
+                            - "The resource identifier."
+                        type: str
+                    option_code:
+                        description:
+                            - "The resource identifier."
+                        type: str
+                    option_value:
+                        description:
+                            - "The option value."
+                        type: str
+                    type:
+                        description:
+                            - "The type of item."
+                            - "Valid values are:"
+                            - "* I(group)"
+                            - "* I(option)"
+                        type: str
+            tags:
+                description:
+                    - "The tags for the fixed address in JSON format."
+                type: dict
+    src:
+        description:
+            - "The path of a file on the managed node holding the fixed addresses, with the fields documented for O(fixed_addresses)."
+            - "Files ending with C(.csv) are read as CSV with a header row naming the fields. Cells of O(fixed_addresses[].dhcp_options) and O(fixed_addresses[].tags) hold JSON. Other files are read as JSON Lines, one fixed address per line. Files ending with C(.gz) are decompressed."
+            - "Mutually exclusive with O(fixed_addresses)."
+        type: path
+    batch_size:
+        description:
+            - "The number of fixed addresses read before their changes are applied."
+        type: int
+        default: 1000
+    max_concurrency:
+        description:
+            - "The maximum number of API calls made at the same time, both to read the existing fixed addresses and to apply the changes."
+        type: int
+        default: 8
+
+extends_documentation_fragment:
+    - infoblox.universal_ddi.common
+"""  # noqa: E501
+
+EXAMPLES = r"""
+    - name: "Create an IP Space (required as parent)"
+      infoblox.universal_ddi.ipam_ip_space:
+        name: "example-ip_space"
+        state: "present"
+      register: ip_space
+
+    - name: "Create a Subnet (required as parent)"
+      infoblox.universal_ddi.ipam_subnet:
+        address: "10.0.0.0/16"
+        space: "{{ ip_space.id }}"
+        state: "present"
+
+    - name: Create Fixed Addresses
+      infoblox.universal_ddi.dhcp_fixed_address_bulk:
+        ip_space: "{{ ip_space.id }}"
+        fixed_addresses:
+          - address: "10.0.0.1"
+            match_type: "mac"
+            match_value: "00-1A-2B-3C-4D-5E"
+            name: "printer-1"
+          - address: "10.0.0.2"
+            match_type: "client_hex"
+            match_value: "01:00:1a:2b:3c:4d:5f"
+        state: "present"
+
+    - name: Load the reservations exported from a DHCP server
+      infoblox.universal_ddi.dhcp_fixed_address_bulk:
+        ip_space: "{{ ip_space.id }}"
+        src: "/tmp/reservations.csv.gz"
+        max_concurrency: 16
+
+    - name: Delete Fixed Addresses
+      infoblox.universal_ddi.dhcp_fixed_address_bulk:
+        ip_space: "{{ ip_space.id }}"
+        fixed_addresses:
+          - address: "10.0.0.1"
+          - address: "10.0.0.2"
+        state: "absent"
+"""  # noqa: E501
+
+RETURN = r"""
+created:
+    description:
+        - Number of fixed addresses created
+    type: int
+    returned: Always
+updated:
+    description:
+        - Number of fixed addresses updated
+    type: int
+    returned: Always
+deleted:
+    description:
+        - Number of fixed addresses deleted
+    type: int
+    returned: Always
+unchanged:
+    description:
+        - Number of fixed addresses already in the desired state
+    type: int
+    returned: Always
+failed_records:
+    description:
+        - The fixed addresses that are invalid or could not be changed, with the reason
+    type: list
+    elements: dict
+    returned: Always
+    contains:
+        record:
+            description:
+                - The fixed address as given
+            type: dict
+        msg:
+            description:
+                - The validation error or the error returned by the API
+            type: str
+timing:
+    description:
+        - Time taken by the module, in seconds
+    type: dict
+    returned: Always
+    contains:
+        read:
+            description:
+                - Time taken to validate the fixed addresses and read the existing fixed addresses
+            type: float
+        apply:
+            description:
+                - Time taken to apply the changes
+            type: float
+        total:
+            description:
+                - Total time
+            type: float
+"""  # noqa: E501
+
+import ipaddress
+import itertools
+import re
+import time
+
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.bulk import (
+    ItemFileError,
+    read_items,
+    validate_items,
+)
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import (
+    UniversalDDIAnsibleModule,
+    run_concurrently,
+)
+
+try:
+    from ipam import FixedAddress, FixedAddressApi
+    from universal_ddi_client import ApiException
+except ImportError:
+    pass  # Handled by UniversalDDIAnsibleModule
+
+FIXED_ADDRESS_OPTIONS = dict(
+    address=dict(type="str", required=True),
+    ip_space=dict(type="str"),
+    match_type=dict(type="str", choices=["mac", "client_text", "client_hex", "relay_text", "relay_hex", "duid"]),
+    match_value=dict(type="str"),
+    name=dict(type="str"),
+    comment=dict(type="str"),
+    hostname=dict(type="str"),
+    disable_dhcp=dict(type="bool"),
+    dhcp_options=dict(
+        type="list",
+        elements="dict",
+        options=dict(
+            group=dict(type="str"),
+            option_code=dict(type="str"),
+            option_value=dict(type="str"),
+            type=dict(type="str"),
+        ),
+    ),
+    tags=dict(type="dict"),
+)
+
+# Fields read for the existing fixed addresses
+_EXISTING_FIELDS = ["id", "address", "ip_space"] + [
+    k for k in FIXED_ADDRESS_OPTIONS if k not in ("address", "ip_space")
+]
+
+# Maximum number of IP spaces combined in the filter of a single list request
+_MAX_SPACES_PER_FILTER = 20
+
+_HEX_SEPARATORS_RE = re.compile(r"[\s:.\-]")
+
+
+def _normalize_hex(value, octets=None):
+    """
+    Normalize a hexadecimal value, e.g. a MAC address, to lower case octets separated by colons.
+
+    :param octets: The number of octets the value must have, if any
+    :raises ValueError: if the value is not valid
+    """
+    digits = _HEX_SEPARATORS_RE.sub("", value).lower()
+    if ":" in value or "-" in value:
+        # Leading zeros may be left out of separated octets, e.g. 0:1a:2b:3c:4d:5e
+        parts = re.split(r"[:\-]", value.strip().lower())
+        if all(1 <= len(p) <= 2 for p in parts):
+            digits = "".join(p.zfill(2) for p in parts)
+    if not digits or len(digits) % 2 or not all(c in "0123456789abcdef" for c in digits):
+        raise ValueError(f"Invalid hexadecimal value: {value}")
+    if octets is not None and len(digits) != octets * 2:
+        raise ValueError(f"Invalid MAC address: {value}")
+    return ":".join(digits[i : i + 2] for i in range(0, len(digits), 2))
+
+
+def normalize_match_value(match_type, value):
+    """
+    Normalize the value matching the client of a fixed address.
+
+    :raises ValueError: if the value is not valid for the match type
+    """
+    if match_type == "mac":
+        return _normalize_hex(value, octets=6)
+    if match_type in ("client_hex", "relay_hex", "duid"):
+        return _normalize_hex(value)
+    if not value:
+        raise ValueError("Empty match value")
+    return value
+
+
+def _normalize_address(address):
+    try:
+        return ipaddress.ip_address(address.strip()).compressed
+    except ValueError:
+        return address.strip()
+
+
+class FixedAddressBulkModule(UniversalDDIAnsibleModule):
+    def __init__(self, *args, **kwargs):
+        super(FixedAddressBulkModule, self).__init__(*args, **kwargs)
+        self._limit = 1000
+
+    def items(self):
+        """
+        Read the desired fixed addresses. Files are read again on every call rather than held in memory.
+        """
+        if self.params["src"] is not None:
+            items = validate_items(read_items(self.params["src"]), FIXED_ADDRESS_OPTIONS, self.params["src"])
+        else:
+            items = self.params["fixed_addresses"]
+
+        for item in items:
+            item = {k: v for k, v in item.items() if v is not None}
+            if "ip_space" not in item and self.params["ip_space"] is not None:
+                item["ip_space"] = self.params["ip_space"]
+            yield item
+
+    def validate(self, item):
+        """
+        Validate and normalize a fixed address.
+
+        :return: The normalized fixed address
+        :raises ValueError: if the fixed address is not valid
+        """
+        if "ip_space" not in item:
+            raise ValueError("Missing ip_space")
+        if self.params["state"] == "present":
+            if "match_type" not in item or "match_value" not in item:
+                raise ValueError("Missing match_type or match_value")
+            item["match_value"] = normalize_match_value(item["match_type"], item["match_value"])
+        item["address"] = _normalize_address(item["address"])
+        return item
+
+    def find(self, spaces):
+        """
+        Read the existing fixed addresses of the IP spaces, indexed by IP space and address.
+        """
+        existing = {}
+        spaces = sorted(spaces)
+        for i in range(0, len(spaces), _MAX_SPACES_PER_FILTER):
+            filter = " or ".join(f"ip_space=='{s}'" for s in spaces[i : i + _MAX_SPACES_PER_FILTER])
+            for fa in self.paginate(
+                FixedAddressApi(self.client).list, filter=filter, inherit="none", fields=_EXISTING_FIELDS
+            ):
+                if fa.get("match_type") and fa.get("match_value"):
+                    try:
+                        fa["match_value"] = normalize_match_value(fa["match_type"], fa["match_value"])
+                    except ValueError:
+                        pass
+                existing[(fa.get("ip_space"), _normalize_address(fa.get("address") or ""))] = fa
+        return existing
+
+    def create(self, item):
+        return FixedAddressApi(self.client).create(body=FixedAddress.from_dict(item))
+
+    def update(self, pair):
+        existing, item = pair
+        return FixedAddressApi(self.client).update(id=existing["id"], body=FixedAddress.from_dict(item))
+
+    def delete(self, pair):
+        existing, _ = pair
+        return FixedAddressApi(self.client).delete(existing["id"])
+
+    def plan(self, batch, existing, seen, result):
+        """
+        Compute the changes for a batch of fixed addresses.
+
+        :return: List of (func, item) tuples, where item is a fixed address or an (existing, desired) pair
+        """
+        changes = []
+        for item in batch:
+            try:
+                item = self.validate(item)
+            except ValueError as e:
+                result["failed_records"].append(dict(record=item, msg=str(e)))
+                continue
+
+            key = (item["ip_space"], item["address"])
+            if key in seen:
+                result["failed_records"].append(dict(record=item, msg="Duplicate fixed address"))
+                continue
+            seen.add(key)
+
+            current = existing.get(key)
+            if self.params["state"] == "absent":
+                if current is not None:
+                    changes.append((self.delete, (current, item)))
+                else:
+                    result["unchanged"] += 1
+            elif current is None:
+                changes.append((self.create, item))
+            elif self.is_changed(current, {k: v for k, v in item.items() if k not in ("address", "ip_space")}):
+                changes.append((self.update, (current, item)))
+            else:
+                result["unchanged"] += 1
+        return changes
+
+    def run_command(self):
+        start = time.monotonic()
+        result = dict(changed=False, created=0, updated=0, deleted=0, unchanged=0, failed_records=[])
+        counters = {self.create: "created", self.update: "updated", self.delete: "deleted"}
+
+        try:
+            # The IP spaces are collected first, so that their fixed addresses can be read before the items are
+            # streamed again to be applied
+            spaces = set(item["ip_space"] for item in self.items() if "ip_space" in item)
+            existing = self.find(spaces)
+            read_done = time.monotonic()
+
+            seen = set()
+            items = self.items()
+            while True:
+                batch = list(itertools.islice(items, self.params["batch_size"]))
+                if not batch:
+                    break
+
+                changes = self.plan(batch, existing, seen, result)
+                if changes:
+                    result["changed"] = True
+                if self.check_mode:
+                    for func, _ in changes:
+                        result[counters[func]] += 1
+                    continue
+
+                for (func, item), _, error in run_concurrently(
+                    lambda change: change[0](change[1]), changes, self.params["max_concurrency"]
+                ):
+                    if error is None:
+                        result[counters[func]] += 1
+                    else:
+                        record = item[1] if isinstance(item, tuple) else item
+                        result["failed_records"].append(
+                            dict(record=record, msg=f"{error.status} {error.reason} {error.body}")
+                        )
+        except ItemFileError as e:
+            self.fail_json(msg=f"Failed to read fixed addresses: {e}", **result)
+        except (IOError, OSError) as e:
+            self.fail_json(msg=f"Failed to read fixed addresses: {e}", **result)
+        except ApiException as e:
+            self.fail_json(msg=f"Failed to execute command: {e.status} {e.reason} {e.body}")
+
+        end = time.monotonic()
+        result["timing"] = dict(
+            read=round(read_done - start, 3), apply=round(end - read_done, 3), total=round(end - start, 3)
+        )
+        if result["failed_records"]:
+            self.fail_json(msg=f"Failed to change {len(result['failed_records'])} fixed addresses", **result)
+
+        self.exit_json(**result)
+
+
+def main():
+    module_args = dict(
+        ip_space=dict(type="str"),
+        state=dict(type="str", required=False, choices=["present", "absent"], default="present"),
+        fixed_addresses=dict(type="list", elements="dict", options=FIXED_ADDRESS_OPTIONS),
+        src=dict(type="path"),
+        batch_size=dict(type="int", default=1000),
+        max_concurrency=dict(type="int", default=8),
+    )
+
+    module = FixedAddressBulkModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+        mutually_exclusive=[["fixed_addresses", "src"]],
+        required_one_of=[["fixed_addresses", "src"]],
+    )
+
+    module.run_command()
+
+
+if __name__ == "__main__":
+    main()
@@ -45,6 +45,7 @@ options:
 
 extends_documentation_fragment:
     - infoblox.universal_ddi.common
+    - infoblox.universal_ddi.info
 """  # noqa: E501
 
 EXAMPLES = r"""
@@ -201,11 +202,14 @@ objects:
             returned: Always
 """  # noqa: E501
 
-from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import UniversalDDIAnsibleModule
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import (
+    UniversalDDIAnsibleModule,
+    universal_ddi_info_argument_spec,
+)
 
 try:
     from ipam import HaGroupApi
-    from universal_ddi_client import ApiException, NotFoundException
+    from universal_ddi_client import NotFoundException
 except ImportError:
     pass  # Handled by UniversalDDIAnsibleModule
 
@@ -239,29 +243,9 @@ class HaGroupInfoModule(UniversalDDIAnsibleModule):
         elif self.params["tag_filter_query"] is not None:
             tag_filter_str = self.params["tag_filter_query"]
 
-        all_results = []
-        offset = 0
-
-        while True:
-            try:
-                resp = HaGroupApi(self.client).list(
-                    offset=offset, limit=self._limit, filter=filter_str, tfilter=tag_filter_str
-                )
-
-                # If no results, set results to empty list
-                if not resp.results:
-                    resp.results = []
-
-                all_results.extend(resp.results)
-
-                if len(resp.results) < self._limit:
-                    break
-                offset += self._limit
-
-            except ApiException as e:
-                self.fail_json(msg=f"Failed to execute command: {e.status} {e.reason} {e.body}")
-
-        return all_results
+        return self.paginate(
+            HaGroupApi(self.client).list, filter=filter_str, tfilter=tag_filter_str, fields=self.params["fields"]
+        )
 
     def run_command(self):
         result = dict(objects=[])
@@ -271,9 +255,13 @@ class HaGroupInfoModule(UniversalDDIAnsibleModule):
 
         find_results = self.find()
 
+        if self.params["dest"] is not None:
+            result.update(self.write_objects(find_results))
+            self.exit_json(**result)
+
         all_results = []
         for r in find_results:
-            all_results.append(r.model_dump(by_alias=True, exclude_none=True))
+            all_results.append(r if isinstance(r, dict) else r.model_dump(by_alias=True, exclude_none=True))
 
         result["objects"] = all_results
         self.exit_json(**result)
@@ -288,6 +276,7 @@ def main():
         tag_filters=dict(type="dict", required=False),
         tag_filter_query=dict(type="str", required=False),
     )
+    module_args.update(universal_ddi_info_argument_spec())
 
     module = HaGroupInfoModule(
         argument_spec=module_args,
@@ -1000,6 +1000,7 @@ options:
 
 extends_documentation_fragment:
     - infoblox.universal_ddi.common
+    - infoblox.universal_ddi.find
 """  # noqa: E501
 
 EXAMPLES = r"""
@@ -2707,7 +2708,11 @@ item:
             returned: Always
 """  # noqa: E501
 
-from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import UniversalDDIAnsibleModule
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import (
+    ProbedObject,
+    UniversalDDIAnsibleModule,
+    universal_ddi_find_argument_spec,
+)
 
 try:
     from ipam import Server, ServerApi
@@ -2720,7 +2725,19 @@ class DHCPServerModule(UniversalDDIAnsibleModule):
     def __init__(self, *args, **kwargs):
         super(DHCPServerModule, self).__init__(*args, **kwargs)
 
-        exclude = ["state", "csp_url", "api_key", "portal_url", "portal_key", "id"]
+        exclude = [
+            "state",
+            "csp_url",
+            "api_key",
+            "portal_url",
+            "portal_key",
+            "pool_size",
+            "trace",
+            "max_retries",
+            "rate_limit",
+            "id",
+            "assume_absent",
+        ]
         self._payload_params = {k: v for k, v in self.params.items() if v is not None and k not in exclude}
         self._payload = Server.from_dict(self._payload_params)
         self._existing = None
@@ -2746,10 +2763,13 @@ class DHCPServerModule(UniversalDDIAnsibleModule):
             # if existing is None, then it is a create operation
             return True
 
-        return self.is_changed(self.existing.model_dump(by_alias=True, exclude_none=True), self.payload_params)
+        return self.is_changed(self.existing, self.payload_params)
 
     def find(self):
         if self.params["id"] is not None:
+            if self.delete_by_id:
+                # The object is deleted by its id, it does not need to be read
+                return ProbedObject(dict(id=self.params["id"]))
             try:
                 resp = ServerApi(self.client).read(self.params["id"], inherit="full")
                 return resp.result
@@ -2759,7 +2779,7 @@ class DHCPServerModule(UniversalDDIAnsibleModule):
                 raise e
         else:
             filter = f"name=='{self.params['name']}'"
-            resp = ServerApi(self.client).list(filter=filter, inherit="full")
+            resp = self.list_existing(ServerApi(self.client).list, filter, ["name"], inherit="full")
 
             # If no results, set results to empty list
             if not resp.results:
@@ -2798,7 +2818,7 @@ class DHCPServerModule(UniversalDDIAnsibleModule):
         # based on the state that is passed in, we will execute the appropriate
         # functions
         try:
-            self.existing = self.find()
+            self.existing = None if self.assume_absent else self.find()
             item = {}
             if self.params["state"] == "present" and self.existing is None:
                 item = self.create()
@@ -2810,18 +2830,31 @@ class DHCPServerModule(UniversalDDIAnsibleModule):
                     result["changed"] = True
                     result["msg"] = "Server updated"
             elif self.params["state"] == "absent" and self.existing is not None:
-                self.delete()
-                result["changed"] = True
-                result["msg"] = "Server deleted"
+                try:
+                    self.delete()
+                    result["changed"] = True
+                    result["msg"] = "Server deleted"
+                except NotFoundException:
+                    if not self.delete_by_id:
+                        raise
+                    # Deleted by id, the object was not read before and does not exist
+                    self.existing = None
+
+            if self._diff and self.params["state"] == "present" and self.existing is not None:
+                # Only the fields to update, compared before the update
+                result["diff"] = self.changes(self.existing, self.payload_params)
 
             if self.check_mode:
-                # if in check mode, do not update the result or the diff, just return the changed state
+                # if in check mode, do not update the result, just return the changed state and the diff
                 self.exit_json(**result)
 
-            result["diff"] = dict(
-                before=self.existing.model_dump(by_alias=True, exclude_none=True) if self.existing is not None else {},
-                after=item,
-            )
+            if "diff" not in result:
+                result["diff"] = dict(
+                    before=(
+                        self.existing.model_dump(by_alias=True, exclude_none=True) if self.existing is not None else {}
+                    ),
+                    after=item,
+                )
             result["object"] = item
             result["id"] = (
                 self.existing.id if self.existing is not None else item["id"] if (item and "id" in item) else None
@@ -3195,6 +3228,7 @@ def main():
         tags=dict(type="dict"),
         vendor_specific_option_option_space=dict(type="str"),
     )
+    module_args.update(universal_ddi_find_argument_spec())
 
     module = DHCPServerModule(
         argument_spec=module_args,
@@ -626,6 +626,7 @@ options:
 
 extends_documentation_fragment:
     - infoblox.universal_ddi.common
+    - infoblox.universal_ddi.find
 """  # noqa: E501
 
 EXAMPLES = r"""
@@ -1977,7 +1978,11 @@ item:
                     returned: Always
 """  # noqa: E501
 
-from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import UniversalDDIAnsibleModule
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import (
+    ProbedObject,
+    UniversalDDIAnsibleModule,
+    universal_ddi_find_argument_spec,
+)
 
 try:
     from dns_config import AuthZone, AuthZoneApi
@@ -1990,7 +1995,19 @@ class AuthZoneModule(UniversalDDIAnsibleModule):
     def __init__(self, *args, **kwargs):
         super(AuthZoneModule, self).__init__(*args, **kwargs)
 
-        exclude = ["state", "csp_url", "api_key", "portal_url", "portal_key", "id"]
+        exclude = [
+            "state",
+            "csp_url",
+            "api_key",
+            "portal_url",
+            "portal_key",
+            "pool_size",
+            "trace",
+            "max_retries",
+            "rate_limit",
+            "id",
+            "assume_absent",
+        ]
         self._payload_params = {k: v for k, v in self.params.items() if v is not None and k not in exclude}
         self._payload = AuthZone.from_dict(self._payload_params)
         self._existing = None
@@ -2016,10 +2033,13 @@ class AuthZoneModule(UniversalDDIAnsibleModule):
             # if existing is None, then it is a create operation
             return True
 
-        return self.is_changed(self.existing.model_dump(by_alias=True, exclude_none=True), self.payload_params)
+        return self.is_changed(self.existing, self.payload_params)
 
     def find(self):
         if self.params["id"] is not None:
+            if self.delete_by_id:
+                # The object is deleted by its id, it does not need to be read
+                return ProbedObject(dict(id=self.params["id"]))
             try:
                 resp = AuthZoneApi(self.client).read(self.params["id"], inherit="full")
                 return resp.result
@@ -2029,7 +2049,7 @@ class AuthZoneModule(UniversalDDIAnsibleModule):
                 raise e
         else:
             filter = f"fqdn=='{self.params['fqdn']}' and view=='{self.params['view']}'"
-            resp = AuthZoneApi(self.client).list(filter=filter, inherit="full")
+            resp = self.list_existing(AuthZoneApi(self.client).list, filter, ["fqdn", "view"], inherit="full")
             if len(resp.results) == 1:
                 return resp.results[0]
             if len(resp.results) > 1:
@@ -2066,7 +2086,7 @@ class AuthZoneModule(UniversalDDIAnsibleModule):
         # based on the state that is passed in, we will execute the appropriate
         # functions
         try:
-            self.existing = self.find()
+            self.existing = None if self.assume_absent else self.find()
             item = {}
             if self.params["state"] == "present" and self.existing is None:
                 item = self.create()
@@ -2078,18 +2098,31 @@ class AuthZoneModule(UniversalDDIAnsibleModule):
                     result["changed"] = True
                     result["msg"] = "AuthZone updated"
             elif self.params["state"] == "absent" and self.existing is not None:
-                self.delete()
-                result["changed"] = True
-                result["msg"] = "AuthZone deleted"
+                try:
+                    self.delete()
+                    result["changed"] = True
+                    result["msg"] = "AuthZone deleted"
+                except NotFoundException:
+                    if not self.delete_by_id:
+                        raise
+                    # Deleted by id, the object was not read before and does not exist
+                    self.existing = None
+
+            if self._diff and self.params["state"] == "present" and self.existing is not None:
+                # Only the fields to update, compared before the update
+                result["diff"] = self.changes(self.existing, self.payload_params)
 
             if self.check_mode:
-                # if in check mode, do not update the result or the diff, just return the changed state
+                # if in check mode, do not update the result, just return the changed state and the diff
                 self.exit_json(**result)
 
-            result["diff"] = dict(
-                before=self.existing.model_dump(by_alias=True, exclude_none=True) if self.existing is not None else {},
-                after=item,
-            )
+            if "diff" not in result:
+                result["diff"] = dict(
+                    before=(
+                        self.existing.model_dump(by_alias=True, exclude_none=True) if self.existing is not None else {}
+                    ),
+                    after=item,
+                )
             result["object"] = item
             result["id"] = (
                 self.existing.id if self.existing is not None else item["id"] if (item and "id" in item) else None
@@ -2337,6 +2370,7 @@ def main():
             ),
         ),
     )
+    module_args.update(universal_ddi_find_argument_spec())
 
     module = AuthZoneModule(
         argument_spec=module_args,
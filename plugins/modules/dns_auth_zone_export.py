@@ -0,0 +1,277 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Infoblox Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+module: dns_auth_zone_export
+short_description: Exports the records of authoritative zones to files.
+description:
+    - Exports the DNS resource records of authoritative zones to files, one per zone, in the RFC 1035 zone file format or as JSON Lines.
+    - The records are written as the result pages are fetched, so that zones with a large number of records can be exported. Several zones are exported at the same time.
+    - Each file is written to a temporary file first and only moved into place once the zone has been exported.
+    - Records whose data cannot be represented in the zone file format are written as comments. The JSON Lines format contains all records and fields, as returned by the API.
+    - A zone that cannot be exported does not stop the export of the other zones. Its temporary file is removed and it is reported in RV(failed_zones).
+    - In check mode, only the FQDN of the zones is read and no file is written. The module reports the files it would write, and that it changed, as it always rewrites them.
+version_added: 1.3.0
+author: Infoblox Inc. (@infobloxopen)
+options:
+    zones:
+        description:
+            - "The resource identifiers of the authoritative zones to export."
+        type: list
+        elements: str
+        required: true
+    dest:
+        description:
+            - "The directory the files are written to, on the managed node."
+            - "The files are named after the FQDN and the resource identifier of the zones, so that zones with the same FQDN in different views get different files, e.g. C(example.com_<id>.zone) or C(example.com_<id>.jsonl), where C(<id>) is the last part of the resource identifier of the zone."
+            - "The C(/) of RFC 2317 zone names, e.g. C(0/26.2.0.192.in-addr.arpa), is replaced by C(-)."
+        type: path
+        required: true
+    format:
+        description:
+            - "The format of the files."
+        type: str
+        choices:
+            - zone
+            - jsonl
+        default: zone
+    compress:
+        description:
+            - "Compress the files with gzip, appending C(.gz) to their names."
+        type: bool
+        default: false
+    max_concurrency:
+        description:
+            - "The maximum number of zones exported at the same time."
+        type: int
+        default: 4
+
+extends_documentation_fragment:
+    - infoblox.universal_ddi.common
+"""  # noqa: E501
+
+EXAMPLES = r"""
+  - name: Get all Auth Zones
+    infoblox.universal_ddi.dns_auth_zone_info:
+      fields:
+        - id
+    register: auth_zones
+
+  - name: Export the Auth Zones to zone files
+    infoblox.universal_ddi.dns_auth_zone_export:
+      zones: "{{ auth_zones.objects | map(attribute='id') | list }}"
+      dest: "/var/backups/dns"
+      max_concurrency: 8
+
+  - name: Export an Auth Zone as compressed JSON Lines
+    infoblox.universal_ddi.dns_auth_zone_export:
+      zones:
+        - "{{ auth_zone_id }}"
+      dest: "/var/backups/dns"
+      format: jsonl
+      compress: true
+"""  # noqa: E501
+
+RETURN = r"""
+zones:
+    description:
+        - The exported zones
+    type: list
+    elements: dict
+    returned: Always
+    contains:
+        id:
+            description:
+                - The resource identifier of the zone
+            type: str
+        fqdn:
+            description:
+                - The FQDN of the zone
+            type: str
+        dest:
+            description:
+                - The path of the file the zone was exported to
+            type: str
+        count:
+            description:
+                - Number of records exported. Not returned in check mode.
+            type: int
+failed_zones:
+    description:
+        - The zones that could not be exported, with the error returned by the API
+    type: list
+    elements: dict
+    returned: Always
+    contains:
+        id:
+            description:
+                - The resource identifier of the zone
+            type: str
+        msg:
+            description:
+                - The error returned by the API
+            type: str
+elapsed:
+    description:
+        - Time taken to export the zones, in seconds
+    type: float
+    returned: Always
+"""  # noqa: E501
+
+import os
+import time
+
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import (
+    UniversalDDIAnsibleModule,
+    iter_objects,
+    json_line,
+    run_concurrently,
+    write_lines,
+)
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.zone_file import format_zone
+
+try:
+    from dns_config import AuthZoneApi
+    from dns_data import RecordApi
+    from universal_ddi_client import ApiException
+except ImportError:
+    pass  # Handled by UniversalDDIAnsibleModule
+
+# Fields read for the zone file format
+_ZONE_FIELDS = ["name_in_zone", "type", "rdata", "ttl"]
+
+
+class AuthZoneExportModule(UniversalDDIAnsibleModule):
+    def __init__(self, *args, **kwargs):
+        super(AuthZoneExportModule, self).__init__(*args, **kwargs)
+        self._limit = 1000
+
+    def dest_of(self, zone_id, fqdn):
+        extension = ".zone" if self.params["format"] == "zone" else ".jsonl"
+        if self.params["compress"]:
+            extension += ".gz"
+        name = f"{fqdn.rstrip('.').replace('/', '-')}_{zone_id.rsplit('/', 1)[-1]}"
+        return os.path.join(os.path.abspath(self.params["dest"]), name + extension)
+
+    def export(self, zone_id):
+        """
+        Export a zone to a temporary file. Called concurrently for several zones.
+
+        :return: Dictionary describing the exported zone, including the path of the temporary file
+        """
+        fqdn = AuthZoneApi(self.client).read(zone_id).result.fqdn
+        exported = dict(id=zone_id, fqdn=fqdn, dest=self.dest_of(zone_id, fqdn))
+        if self.check_mode:
+            return exported
+
+        if self.params["format"] == "zone":
+            records = iter_objects(
+                RecordApi(self.client).list,
+                limit=self._limit,
+                filter=f"zone=='{zone_id}'",
+                inherit="full",
+                fields=_ZONE_FIELDS,
+            )
+            lines = format_zone(records, fqdn)
+        else:
+            records = iter_objects(
+                RecordApi(self.client).list,
+                limit=self._limit,
+                filter=f"zone=='{zone_id}'",
+                inherit="full",
+                raw=True,
+            )
+            lines = (json_line(r) for r in records)
+
+        exported["tmp"], exported["count"] = write_lines(exported["dest"], lines)
+        if self.params["format"] == "zone":
+            # The $ORIGIN directive is not a record
+            exported["count"] -= 1
+        return exported
+
+    def export_or_error(self, zone_id):
+        """
+        Export a zone, returning the error instead of raising it, so that the other zones are still exported.
+
+        :return: Tuple of the dictionary returned by export, or None, and of the error message, or None
+        """
+        try:
+            return self.export(zone_id), None
+        except ApiException as e:
+            return None, f"{e.status} {e.reason} {e.body}"
+        except Exception as e:
+            # e.g. the destination cannot be written, the temporary file is already removed by write_lines
+            return None, str(e)
+
+    def run_command(self):
+        start = time.monotonic()
+        result = dict(changed=False, zones=[], failed_zones=[])
+
+        if not os.path.isdir(self.params["dest"]):
+            self.fail_json(msg=f"Destination directory {self.params['dest']} does not exist")
+
+        outcomes = [
+            (zone_id, exported, error)
+            for zone_id, (exported, error), _ in run_concurrently(
+                self.export_or_error, self.params["zones"], self.params["max_concurrency"]
+            )
+        ]
+        try:
+            dests = {}
+            for zone_id, exported, _ in outcomes:
+                if exported is None:
+                    continue
+                if exported["dest"] in dests:
+                    self.fail_json(
+                        msg=f"Zones {dests[exported['dest']]} and {zone_id} would both be exported to {exported['dest']}"
+                    )
+                dests[exported["dest"]] = zone_id
+
+            for zone_id, exported, error in outcomes:
+                if error is not None:
+                    result["failed_zones"].append(dict(id=zone_id, msg=error))
+                    continue
+                if exported.get("tmp") is not None:
+                    self.atomic_move(exported["tmp"], exported["dest"])
+                    del exported["tmp"]
+                result["zones"].append(exported)
+                result["changed"] = True
+        finally:
+            # The temporary files not moved into place, e.g. if moving one of them failed
+            for _, exported, _ in outcomes:
+                if exported and exported.get("tmp") and os.path.exists(exported["tmp"]):
+                    os.remove(exported["tmp"])
+
+        result["elapsed"] = round(time.monotonic() - start, 3)
+        if result["failed_zones"]:
+            self.fail_json(msg=f"Failed to export {len(result['failed_zones'])} zones", **result)
+
+        self.exit_json(**result)
+
+
+def main():
+    module_args = dict(
+        zones=dict(type="list", elements="str", required=True),
+        dest=dict(type="path", required=True),
+        format=dict(type="str", choices=["zone", "jsonl"], default="zone"),
+        compress=dict(type="bool", default=False),
+        max_concurrency=dict(type="int", default=4),
+    )
+
+    module = AuthZoneExportModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+
+    module.run_command()
+
+
+if __name__ == "__main__":
+    main()
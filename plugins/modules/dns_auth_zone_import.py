@@ -0,0 +1,287 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Infoblox Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+module: dns_auth_zone_import
+short_description: Imports the records of a zone file into an authoritative zone.
+description:
+    - Imports the DNS resource records of a zone file in the RFC 1035 master file format, e.g. a BIND zone file, into an authoritative zone.
+    - The zone file is read as a stream and the records are created concurrently in batches, so that zones with a large number of records can be imported.
+    - The directives V($ORIGIN), V($TTL) and V($INCLUDE), relative names and records spanning several lines are supported.
+    - Records already in the zone, compared as by M(infoblox.universal_ddi.dns_record_bulk), are left unchanged.
+    - Records of types the API does not support, records of other classes than V(IN) and records outside of the zone are skipped with a warning.
+version_added: 1.3.0
+author: Infoblox Inc. (@infobloxopen)
+options:
+    zone:
+        description:
+            - "The resource identifier of the authoritative zone the records are imported into."
+        type: str
+        required: true
+    src:
+        description:
+            - "The path of the zone file on the managed node."
+        type: path
+        required: true
+    origin:
+        description:
+            - "The initial origin of the zone file."
+            - "Defaults to the FQDN of the zone."
+        type: str
+    default_ttl:
+        description:
+            - "The TTL of the records that do not have one, before any V($TTL) directive."
+            - "Records without a TTL inherit the TTL of the zone if not set."
+        type: int
+    exclude_types:
+        description:
+            - "The record types that are not imported."
+            - "The SOA and NS records of the zone are maintained by the platform. Delegations are managed with M(infoblox.universal_ddi.dns_delegation)."
+        type: list
+        elements: str
+        default: ["SOA", "NS"]
+    batch_size:
+        description:
+            - "The number of records read from the zone file before they are created."
+        type: int
+        default: 1000
+    max_concurrency:
+        description:
+            - "The maximum number of API calls made at the same time, both to read the existing records and to create the new ones."
+        type: int
+        default: 8
+
+extends_documentation_fragment:
+    - infoblox.universal_ddi.common
+"""  # noqa: E501
+
+EXAMPLES = r"""
+  - name: Create an Auth Zone
+    infoblox.universal_ddi.dns_auth_zone:
+      fqdn: "example.com."
+      primary_type: cloud
+      state: present
+    register: auth_zone
+
+  - name: Import a BIND zone file
+    infoblox.universal_ddi.dns_auth_zone_import:
+      zone: "{{ auth_zone.id }}"
+      src: "/etc/bind/db.example.com"
+
+  - name: Import a zone file, including its NS records
+    infoblox.universal_ddi.dns_auth_zone_import:
+      zone: "{{ auth_zone.id }}"
+      src: "/etc/bind/db.example.com"
+      exclude_types:
+        - SOA
+      max_concurrency: 16
+"""  # noqa: E501
+
+RETURN = r"""
+created:
+    description:
+        - Number of records created
+    type: int
+    returned: Always
+existing:
+    description:
+        - Number of records of the zone file already in the zone
+    type: int
+    returned: Always
+skipped:
+    description:
+        - Number of records of the zone file that were not imported, because of O(exclude_types), because they are not supported or because they are outside of the zone
+    type: int
+    returned: Always
+failed_records:
+    description:
+        - The records that could not be created, with the error returned by the API
+    type: list
+    elements: dict
+    returned: Always
+    contains:
+        record:
+            description:
+                - The record read from the zone file
+            type: dict
+        msg:
+            description:
+                - The error returned by the API
+            type: str
+elapsed:
+    description:
+        - Time taken to import the zone file, in seconds
+    type: float
+    returned: Always
+"""  # noqa: E501
+
+import itertools
+import time
+
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.dns_records import key_of
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import (
+    UniversalDDIAnsibleModule,
+    run_concurrently,
+)
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.zone_file import (
+    UnsupportedRecordError,
+    ZoneFileError,
+    absolute_name,
+    iter_records,
+    name_in_zone,
+    rdata_of,
+)
+
+try:
+    from dns_config import AuthZoneApi
+    from dns_data import Record, RecordApi
+    from universal_ddi_client import ApiException
+except ImportError:
+    pass  # Handled by UniversalDDIAnsibleModule
+
+# Maximum number of skipped records reported as warnings
+_MAX_WARNINGS = 20
+
+
+class AuthZoneImportModule(UniversalDDIAnsibleModule):
+    def __init__(self, *args, **kwargs):
+        super(AuthZoneImportModule, self).__init__(*args, **kwargs)
+        self._limit = 1000
+        self._skipped = 0
+        self._existing = 0
+
+    def find(self):
+        """
+        Read the keys of the records already in the zone.
+        """
+        return set(
+            key_of(r)
+            for r in self.paginate(
+                RecordApi(self.client).list,
+                filter=f"zone=='{self.params['zone']}'",
+                inherit="none",
+                fields=["name_in_zone", "type", "rdata"],
+            )
+        )
+
+    def skip(self, msg):
+        if self._skipped < _MAX_WARNINGS:
+            self.warn(f"Skipped record: {msg}")
+        self._skipped += 1
+
+    def records(self, origin):
+        """
+        Read the records of the zone file as they are to be created.
+        """
+        exclude_types = [t.upper() for t in self.params["exclude_types"]]
+        for record in iter_records(self.params["src"], origin, self.params["default_ttl"]):
+            if record["type"] in exclude_types:
+                self._skipped += 1
+                continue
+
+            name = name_in_zone(record["name"], origin)
+            if name is None:
+                self.skip(f"{record['location']}: {record['name']} is outside of the zone")
+                continue
+
+            try:
+                rdata = rdata_of(record)
+            except UnsupportedRecordError as e:
+                self.skip(str(e))
+                continue
+
+            desired = dict(name_in_zone=name, type=record["type"], rdata=rdata)
+            if record["ttl"] is not None:
+                desired["ttl"] = record["ttl"]
+            yield desired
+
+    def new_records(self, origin, existing):
+        """
+        Read the records of the zone file that are not in the zone yet.
+
+        :param existing: The keys of the records in the zone
+        """
+        for record in self.records(origin):
+            key = key_of(record)
+            if key in existing:
+                self._existing += 1
+                continue
+            # Also skips the duplicates in the zone file
+            existing.add(key)
+            yield record
+
+    def create(self, record):
+        body = Record.from_dict(dict(record, zone=self.params["zone"]))
+        return RecordApi(self.client).create(body=body)
+
+    def run_command(self):
+        start = time.monotonic()
+        result = dict(changed=False, created=0, existing=0, skipped=0, failed_records=[])
+
+        try:
+            origin = self.params["origin"]
+            if origin is None:
+                origin = AuthZoneApi(self.client).read(self.params["zone"]).result.fqdn
+            origin = absolute_name(origin, ".")
+
+            records = self.new_records(origin, self.find())
+            while True:
+                batch = list(itertools.islice(records, self.params["batch_size"]))
+                if not batch:
+                    break
+
+                result["changed"] = True
+                if self.check_mode:
+                    result["created"] += len(batch)
+                    continue
+                for record, _, error in run_concurrently(self.create, batch, self.params["max_concurrency"]):
+                    if error is None:
+                        result["created"] += 1
+                    else:
+                        result["failed_records"].append(
+                            dict(record=record, msg=f"{error.status} {error.reason} {error.body}")
+                        )
+        except ZoneFileError as e:
+            self.fail_json(msg=f"Failed to parse zone file: {e}", **result)
+        except (IOError, OSError) as e:
+            self.fail_json(msg=f"Failed to read zone file: {e}", **result)
+        except ApiException as e:
+            self.fail_json(msg=f"Failed to execute command: {e.status} {e.reason} {e.body}")
+
+        result["existing"] = self._existing
+        result["skipped"] = self._skipped
+        result["elapsed"] = round(time.monotonic() - start, 3)
+        if result["failed_records"]:
+            self.fail_json(msg=f"Failed to create {len(result['failed_records'])} records", **result)
+
+        self.exit_json(**result)
+
+
+def main():
+    module_args = dict(
+        zone=dict(type="str", required=True),
+        src=dict(type="path", required=True),
+        origin=dict(type="str"),
+        default_ttl=dict(type="int"),
+        exclude_types=dict(type="list", elements="str", default=["SOA", "NS"]),
+        batch_size=dict(type="int", default=1000),
+        max_concurrency=dict(type="int", default=8),
+    )
+
+    module = AuthZoneImportModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+
+    module.run_command()
+
+
+if __name__ == "__main__":
+    main()
@@ -54,6 +54,7 @@ options:
 
 extends_documentation_fragment:
     - infoblox.universal_ddi.common
+    - infoblox.universal_ddi.info
 """  # noqa: E501
 
 EXAMPLES = r"""
@@ -1388,11 +1389,14 @@ objects:
                     returned: Always
 """  # noqa: E501
 
-from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import UniversalDDIAnsibleModule
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import (
+    UniversalDDIAnsibleModule,
+    universal_ddi_info_argument_spec,
+)
 
 try:
     from dns_config import AuthZoneApi
-    from universal_ddi_client import ApiException, NotFoundException
+    from universal_ddi_client import NotFoundException
 except ImportError:
     pass  # Handled by UniversalDDIAnsibleModule
 
@@ -1405,7 +1409,7 @@ class AuthZoneInfoModule(UniversalDDIAnsibleModule):
 
     def find_by_id(self):
         try:
-            resp = AuthZoneApi(self.client).read(self.params["id"], inherit="full")
+            resp = AuthZoneApi(self.client).read(self.params["id"], inherit=self.params["inherit"])
             return [resp.result]
         except NotFoundException as e:
             return None
@@ -1426,24 +1430,13 @@ class AuthZoneInfoModule(UniversalDDIAnsibleModule):
         elif self.params["tag_filter_query"] is not None:
             tag_filter_str = self.params["tag_filter_query"]
 
-        all_results = []
-        offset = 0
-
-        while True:
-            try:
-                resp = AuthZoneApi(self.client).list(
-                    offset=offset, limit=self._limit, filter=filter_str, tfilter=tag_filter_str, inherit="full"
-                )
-                all_results.extend(resp.results)
-
-                if len(resp.results) < self._limit:
-                    break
-                offset += self._limit
-
-            except ApiException as e:
-                self.fail_json(msg=f"Failed to execute command: {e.status} {e.reason} {e.body}")
-
-        return all_results
+        return self.paginate(
+            AuthZoneApi(self.client).list,
+            filter=filter_str,
+            tfilter=tag_filter_str,
+            inherit=self.params["inherit"],
+            fields=self.params["fields"],
+        )
 
     def run_command(self):
         result = dict(objects=[])
@@ -1453,9 +1446,13 @@ class AuthZoneInfoModule(UniversalDDIAnsibleModule):
 
         find_results = self.find()
 
+        if self.params["dest"] is not None:
+            result.update(self.write_objects(find_results))
+            self.exit_json(**result)
+
         all_results = []
         for r in find_results:
-            all_results.append(r.model_dump(by_alias=True, exclude_none=True))
+            all_results.append(r if isinstance(r, dict) else r.model_dump(by_alias=True, exclude_none=True))
 
         result["objects"] = all_results
         self.exit_json(**result)
@@ -1471,6 +1468,7 @@ def main():
         tag_filters=dict(type="dict", required=False),
         tag_filter_query=dict(type="str", required=False),
     )
+    module_args.update(universal_ddi_info_argument_spec())
 
     module = AuthZoneInfoModule(
         argument_spec=module_args,
@@ -354,6 +354,8 @@ options:
 
 extends_documentation_fragment:
     - infoblox.universal_ddi.common
+    - infoblox.universal_ddi.find
+    - infoblox.universal_ddi.write
 """  # noqa: E501
 
 EXAMPLES = r"""
@@ -1047,7 +1049,12 @@ item:
             returned: Always
 """  # noqa: E501
 
-from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import UniversalDDIAnsibleModule
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import (
+    ProbedObject,
+    UniversalDDIAnsibleModule,
+    universal_ddi_find_argument_spec,
+    universal_ddi_write_argument_spec,
+)
 
 try:
     from dns_data import Record, RecordApi
@@ -1061,7 +1068,21 @@ class RecordModule(UniversalDDIAnsibleModule):
     def __init__(self, *args, **kwargs):
         super(RecordModule, self).__init__(*args, **kwargs)
 
-        exclude = ["state", "csp_url", "api_key", "portal_url", "portal_key", "id", "configure_record_protection"]
+        exclude = [
+            "state",
+            "csp_url",
+            "api_key",
+            "portal_url",
+            "portal_key",
+            "pool_size",
+            "trace",
+            "max_retries",
+            "rate_limit",
+            "return_object",
+            "id",
+            "configure_record_protection",
+            "assume_absent",
+        ]
         self._payload_params = {k: v for k, v in self.params.items() if v is not None and k not in exclude}
         self._payload = Record.from_dict(self._payload_params)
         self._existing = None
@@ -1092,12 +1113,15 @@ class RecordModule(UniversalDDIAnsibleModule):
             # if existing is None, then it is a create operation
             return True
 
-        return self.is_changed(self.existing.model_dump(by_alias=True, exclude_none=True), self.payload_params)
+        return self.is_changed(self.existing, self.payload_params)
 
     # DNS record Operations using Absolute Name and View are not Supported in Ansible as querying via view
     # is not supported by the API.
     def find(self):
         if self.params["id"] is not None:
+            if self.delete_by_id:
+                # The object is deleted by its id, it does not need to be read
+                return ProbedObject(dict(id=self.params["id"]))
             try:
                 resp = RecordApi(self.client).read(self.params["id"], inherit="full")
                 return resp.result
@@ -1108,7 +1132,9 @@ class RecordModule(UniversalDDIAnsibleModule):
         else:
             filter = f"zone=='{self.params['zone']}' and type=='{self.params['type']}' and name_in_zone=='{self.params['name_in_zone']}'"
 
-            resp = RecordApi(self.client).list(filter=filter, inherit="full")
+            resp = self.list_existing(
+                RecordApi(self.client).list, filter, ["zone", "type", "name_in_zone"], inherit="full"
+            )
 
             if len(resp.results) == 0:
                 return None
@@ -1142,13 +1168,12 @@ class RecordModule(UniversalDDIAnsibleModule):
         if self.check_mode:
             return None
 
-        resp = RecordApi(self.client).create(body=self.payload, inherit="full")
+        resp = RecordApi(self.client).create(body=self.payload, inherit=self.write_inherit)
         desired_protection = self._normalize_protection_level(self.params.get("configure_record_protection"))
         if desired_protection is not None:
             self.configure_record_protection(record=resp.result)
-            # Re-read so returned object includes any protection updates.
-            resp = RecordApi(self.client).read(resp.result.id, inherit="full")
-        return resp.result.model_dump(by_alias=True, exclude_none=True)
+        # The created record does not include the protection updates
+        return self.written_object(resp, RecordApi(self.client).read, stale=desired_protection is not None)
 
     def update(self):
         if self.check_mode:
@@ -1169,14 +1194,11 @@ class RecordModule(UniversalDDIAnsibleModule):
         if self.payload_changed():
             update_body = self.payload
             update_body = self.validate_readonly_on_update(self.existing, update_body, ["type", "zone"])
-            resp = RecordApi(self.client).update(id=self.existing.id, body=update_body, inherit="full")
-            if resp is None or resp.result is None:
-                resp = RecordApi(self.client).read(self.existing.id, inherit="full")
-            return resp.result.model_dump(by_alias=True, exclude_none=True)
+            resp = RecordApi(self.client).update(id=self.existing.id, body=update_body, inherit=self.write_inherit)
+            return self.written_object(resp, RecordApi(self.client).read, id=self.existing.id)
         elif protection_changed:
             # Only protection changed, re-read the record to get updated data
-            resp = RecordApi(self.client).read(self.existing.id, inherit="full")
-            return resp.result.model_dump(by_alias=True, exclude_none=True)
+            return self.written_object(None, RecordApi(self.client).read, id=self.existing.id)
         else:
             return self.existing.model_dump(by_alias=True, exclude_none=True)
 
@@ -1192,7 +1214,7 @@ class RecordModule(UniversalDDIAnsibleModule):
         # based on the state that is passed in, we will execute the appropriate
         # functions
         try:
-            self.existing = self.find()
+            self.existing = None if self.assume_absent else self.find()
             item = {}
             if self.params["state"] == "present" and self.existing is None:
                 item = self.create()
@@ -1212,18 +1234,31 @@ class RecordModule(UniversalDDIAnsibleModule):
                     result["changed"] = True
                     result["msg"] = "Record updated"
             elif self.params["state"] == "absent" and self.existing is not None:
-                self.delete()
-                result["changed"] = True
-                result["msg"] = "Record deleted"
+                try:
+                    self.delete()
+                    result["changed"] = True
+                    result["msg"] = "Record deleted"
+                except NotFoundException:
+                    if not self.delete_by_id:
+                        raise
+                    # Deleted by id, the object was not read before and does not exist
+                    self.existing = None
+
+            if self._diff and self.params["state"] == "present" and self.existing is not None:
+                # Only the fields to update, compared before the update
+                result["diff"] = self.changes(self.existing, self.payload_params)
 
             if self.check_mode:
-                # if in check mode, do not update the result or the diff, just return the changed state
+                # if in check mode, do not update the result, just return the changed state and the diff
                 self.exit_json(**result)
 
-            result["diff"] = dict(
-                before=self.existing.model_dump(by_alias=True, exclude_none=True) if self.existing is not None else {},
-                after=item,
-            )
+            if "diff" not in result:
+                result["diff"] = dict(
+                    before=(
+                        self.existing.model_dump(by_alias=True, exclude_none=True) if self.existing is not None else {}
+                    ),
+                    after=item,
+                )
             result["object"] = item
             result["id"] = (
                 self.existing.id if self.existing is not None else item["id"] if (item and "id" in item) else None
@@ -1260,6 +1295,8 @@ def main():
         type=dict(type="str", required=True),
         zone=dict(type="str", required=True),
     )
+    module_args.update(universal_ddi_find_argument_spec())
+    module_args.update(universal_ddi_write_argument_spec())
 
     module = RecordModule(
         argument_spec=module_args,
@@ -0,0 +1,362 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Infoblox Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+module: dns_record_bulk
+short_description: Manages many DNS resource records of an authoritative zone at once.
+description:
+    - Manages many DNS resource records of an authoritative zone in a single task.
+    - The existing records of the zone are read once, the records to create, update or delete are computed locally and the changes are applied concurrently.
+    - A record is identified by its I(name_in_zone), I(type) and the I(rdata) fields that tell records of the same name and type apart, e.g. I(address) for B(A) records or I(exchange) and I(preference) for B(MX) records. Other fields of matching records are updated.
+    - With O(purge=true), the zone is made to contain exactly the given records. A run that changes nothing only costs the API calls listing the records of the zone.
+version_added: 1.3.0
+author: Infoblox Inc. (@infobloxopen)
+options:
+    zone:
+        description:
+            - "The resource identifier of the authoritative zone containing the records."
+        type: str
+        required: true
+    state:
+        description:
+            - Indicate desired state of the records
+        type: str
+        required: false
+        choices:
+            - present
+            - absent
+        default: present
+    records:
+        description:
+            - "The DNS resource records."
+        type: list
+        elements: dict
+        required: true
+        suboptions:
+            name_in_zone:
+                description:
+                    - "The relative owner name to the zone origin."
+                type: str
+                default: ""
+            type:
+                description:
+                    - "The DNS resource record type, e.g. I(A), I(CNAME) or I(MX)."
+                type: str
+                required: true
+            rdata:
+                description:
+                    - "The DNS resource record data, as documented for M(infoblox.universal_ddi.dns_record)."
+                type: dict
+                required: true
+            ttl:
+                description:
+                    - "The record time to live value in seconds."
+                type: int
+            comment:
+                description:
+                    - "The description for the DNS resource record."
+                type: str
+            disabled:
+                description:
+                    - "Indicates if the DNS resource record is disabled."
+                type: bool
+            tags:
+                description:
+                    - "The tags for the DNS resource record in JSON format."
+                type: dict
+            options:
+                description:
+                    - "The DNS resource record type-specific non-protocol options, as documented for M(infoblox.universal_ddi.dns_record)."
+                    - "Only applied when the record is created."
+                type: dict
+    purge:
+        description:
+            - "Delete the records of the zone that are not in O(records)."
+            - "SOA records, records of the types in O(purge_exclude_types) and records not created through the API, e.g. the NS records generated from the name server assignment or records added by dynamic updates, are never deleted."
+            - "Only applies with O(state=present)."
+        type: bool
+        default: false
+    purge_exclude_types:
+        description:
+            - "The record types that are not deleted with O(purge=true)."
+        type: list
+        elements: str
+        default: ["NS"]
+    max_concurrency:
+        description:
+            - "The maximum number of API calls made at the same time, both to read the existing records and to apply the changes."
+        type: int
+        default: 8
+
+extends_documentation_fragment:
+    - infoblox.universal_ddi.common
+"""  # noqa: E501
+
+EXAMPLES = r"""
+  - name: Create or update records in a zone
+    infoblox.universal_ddi.dns_record_bulk:
+      zone: "{{ auth_zone_id }}"
+      records:
+        - name_in_zone: "www"
+          type: "A"
+          rdata:
+            address: "192.168.10.10"
+          ttl: 300
+        - name_in_zone: "www"
+          type: "A"
+          rdata:
+            address: "192.168.10.11"
+          ttl: 300
+        - name_in_zone: ""
+          type: "MX"
+          rdata:
+            exchange: "mail.example.com."
+            preference: 10
+      state: present
+
+  - name: Load records from a variable file
+    infoblox.universal_ddi.dns_record_bulk:
+      zone: "{{ auth_zone_id }}"
+      records: "{{ lookup('ansible.builtin.file', 'records.json') | from_json }}"
+      max_concurrency: 16
+
+  - name: Make the zone contain exactly the given records
+    infoblox.universal_ddi.dns_record_bulk:
+      zone: "{{ auth_zone_id }}"
+      records: "{{ zone_records }}"
+      purge: true
+      purge_exclude_types:
+        - NS
+        - TXT
+
+  - name: Delete records from a zone
+    infoblox.universal_ddi.dns_record_bulk:
+      zone: "{{ auth_zone_id }}"
+      records:
+        - name_in_zone: "www"
+          type: "A"
+          rdata:
+            address: "192.168.10.11"
+      state: absent
+"""  # noqa: E501
+
+RETURN = r"""
+created:
+    description:
+        - Number of records created
+    type: int
+    returned: Always
+updated:
+    description:
+        - Number of records updated
+    type: int
+    returned: Always
+deleted:
+    description:
+        - Number of records deleted, including the records purged with O(purge=true)
+    type: int
+    returned: Always
+unchanged:
+    description:
+        - Number of records that already were in the desired state
+    type: int
+    returned: Always
+failed_records:
+    description:
+        - The records that could not be changed, with the error returned by the API
+    type: list
+    elements: dict
+    returned: Always
+    contains:
+        record:
+            description:
+                - The record as passed to the module, or the existing record for deletions and purged records
+            type: dict
+        msg:
+            description:
+                - The error returned by the API
+            type: str
+elapsed:
+    description:
+        - Time taken to read the existing records and apply the changes, in seconds
+    type: float
+    returned: Always
+"""  # noqa: E501
+
+import time
+
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.dns_records import (
+    is_purgeable,
+    key_of,
+    record_changed,
+)
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import (
+    UniversalDDIAnsibleModule,
+    run_concurrently,
+)
+
+try:
+    from dns_data import Record, RecordApi
+    from universal_ddi_client import ApiException
+except ImportError:
+    pass  # Handled by UniversalDDIAnsibleModule
+
+# Fields read for the existing records of the zone
+_EXISTING_FIELDS = ["id", "name_in_zone", "type", "rdata", "ttl", "comment", "disabled", "tags", "source"]
+
+
+class RecordBulkModule(UniversalDDIAnsibleModule):
+    def __init__(self, *args, **kwargs):
+        super(RecordBulkModule, self).__init__(*args, **kwargs)
+        self._desired = {}
+        for record in self.params["records"]:
+            record = {k: v for k, v in record.items() if v is not None}
+            key = key_of(record)
+            if key in self._desired:
+                self.fail_json(msg=f"Duplicate record: {record}")
+            self._desired[key] = record
+
+    def find(self):
+        """
+        Read all records of the zone.
+        """
+        return list(
+            self.paginate(
+                RecordApi(self.client).list,
+                filter=f"zone=='{self.params['zone']}'",
+                inherit="none",
+                fields=_EXISTING_FIELDS,
+            )
+        )
+
+    def plan(self, existing):
+        """
+        Compute the changes needed to bring the zone to the desired state.
+
+        :return: Tuple of the records to create, the (existing, desired) record pairs to update, the records to delete
+            and the number of records already in the desired state
+        """
+        index = {}
+        for record in existing:
+            index.setdefault(key_of(record), record)
+
+        creates, updates, deletes = [], [], []
+        unchanged = 0
+        for key, record in self._desired.items():
+            current = index.get(key)
+            if self.params["state"] == "absent":
+                if current is not None:
+                    deletes.append(current)
+                else:
+                    unchanged += 1
+            elif current is None:
+                creates.append(record)
+            elif record_changed(current, record, self.is_changed):
+                updates.append((current, record))
+            else:
+                unchanged += 1
+
+        if self.params["purge"] and self.params["state"] == "present":
+            # Duplicates of a desired record are purged as well, only the indexed one is kept
+            kept = set(id(index[key]) for key in self._desired if key in index)
+            for record in existing:
+                if id(record) not in kept and is_purgeable(record, self.params["purge_exclude_types"]):
+                    deletes.append(record)
+        return creates, updates, deletes, unchanged
+
+    def create(self, record):
+        body = Record.from_dict(dict(record, zone=self.params["zone"]))
+        return RecordApi(self.client).create(body=body)
+
+    def update(self, pair):
+        current, record = pair
+        # The type and zone of a record cannot be updated
+        body = Record.from_dict({k: v for k, v in record.items() if k not in ("type", "options")})
+        return RecordApi(self.client).update(id=current["id"], body=body)
+
+    def delete(self, record):
+        return RecordApi(self.client).delete(record["id"])
+
+    def apply(self, func, items):
+        """
+        Apply func to every item concurrently, returning the failures.
+        """
+        failed = []
+        for item, _, error in run_concurrently(func, items, self.params["max_concurrency"]):
+            if error is not None:
+                record = item[1] if isinstance(item, tuple) else item
+                failed.append(dict(record=record, msg=f"{error.status} {error.reason} {error.body}"))
+        return failed
+
+    def run_command(self):
+        start = time.monotonic()
+        result = dict(changed=False, created=0, updated=0, deleted=0, unchanged=0, failed_records=[])
+
+        try:
+            existing = self.find()
+            creates, updates, deletes, unchanged = self.plan(existing)
+
+            result["changed"] = bool(creates or updates or deletes)
+            result["unchanged"] = unchanged
+            for name, func, items in (
+                ("created", self.create, creates),
+                ("updated", self.update, updates),
+                ("deleted", self.delete, deletes),
+            ):
+                failures = [] if self.check_mode else self.apply(func, items)
+                result["failed_records"].extend(failures)
+                # Existing records may share a key with other records of the zone, their id tells them apart
+                failed = set((key_of(f["record"]), f["record"].get("id")) for f in failures)
+                records = [r for _, r in items] if name == "updated" else items
+                result[name] = len([r for r in records if (key_of(r), r.get("id")) not in failed])
+        except ApiException as e:
+            self.fail_json(msg=f"Failed to execute command: {e.status} {e.reason} {e.body}")
+
+        result["elapsed"] = round(time.monotonic() - start, 3)
+        if result["failed_records"]:
+            self.fail_json(msg=f"Failed to change {len(result['failed_records'])} records", **result)
+
+        self.exit_json(**result)
+
+
+def main():
+    module_args = dict(
+        zone=dict(type="str", required=True),
+        state=dict(type="str", required=False, choices=["present", "absent"], default="present"),
+        records=dict(
+            type="list",
+            elements="dict",
+            required=True,
+            options=dict(
+                name_in_zone=dict(type="str", default=""),
+                type=dict(type="str", required=True),
+                rdata=dict(type="dict", required=True),
+                ttl=dict(type="int"),
+                comment=dict(type="str"),
+                disabled=dict(type="bool"),
+                tags=dict(type="dict"),
+                options=dict(type="dict"),
+            ),
+        ),
+        purge=dict(type="bool", default=False),
+        purge_exclude_types=dict(type="list", elements="str", default=["NS"]),
+        max_concurrency=dict(type="int", default=8),
+    )
+
+    module = RecordBulkModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+
+    module.run_command()
+
+
+if __name__ == "__main__":
+    main()
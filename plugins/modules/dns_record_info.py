@@ -54,6 +54,7 @@ options:
 
 extends_documentation_fragment:
     - infoblox.universal_ddi.common
+    - infoblox.universal_ddi.info
 """  # noqa: E501
 
 EXAMPLES = r"""
@@ -76,6 +77,22 @@ EXAMPLES = r"""
     infoblox.universal_ddi.dns_record_info:
       tag_filters:
         location: "site-1"   
+
+  - name: Get the name and data of all Records in a zone
+    infoblox.universal_ddi.dns_record_info:
+      filters:
+        zone: "example_zone_id"
+      fields:
+        - name_in_zone
+        - type
+        - rdata
+      inherit: none
+
+  - name: Write all Records of a zone to a compressed JSON Lines file
+    infoblox.universal_ddi.dns_record_info:
+      filters:
+        zone: "example_zone_id"
+      dest: "/var/backups/records.jsonl.gz"
 """  # noqa: E501
 
 RETURN = r"""
@@ -548,11 +565,14 @@ objects:
             returned: Always
 """  # noqa: E501
 
-from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import UniversalDDIAnsibleModule
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import (
+    UniversalDDIAnsibleModule,
+    universal_ddi_info_argument_spec,
+)
 
 try:
     from dns_data import RecordApi
-    from universal_ddi_client import ApiException, NotFoundException
+    from universal_ddi_client import NotFoundException
 except ImportError:
     pass  # Handled by UniversalDDIAnsibleModule
 
@@ -565,7 +585,7 @@ class RecordInfoModule(UniversalDDIAnsibleModule):
 
     def find_by_id(self):
         try:
-            resp = RecordApi(self.client).read(self.params["id"], inherit="full")
+            resp = RecordApi(self.client).read(self.params["id"], inherit=self.params["inherit"])
             return [resp.result]
         except NotFoundException as e:
             return None
@@ -586,24 +606,13 @@ class RecordInfoModule(UniversalDDIAnsibleModule):
         elif self.params["tag_filter_query"] is not None:
             tag_filter_str = self.params["tag_filter_query"]
 
-        all_results = []
-        offset = 0
-
-        while True:
-            try:
-                resp = RecordApi(self.client).list(
-                    offset=offset, limit=self._limit, filter=filter_str, tfilter=tag_filter_str, inherit="full"
-                )
-                all_results.extend(resp.results)
-
-                if len(resp.results) < self._limit:
-                    break
-                offset += self._limit
-
-            except ApiException as e:
-                self.fail_json(msg=f"Failed to execute command: {e.status} {e.reason} {e.body}")
-
-        return all_results
+        return self.paginate(
+            RecordApi(self.client).list,
+            filter=filter_str,
+            tfilter=tag_filter_str,
+            inherit=self.params["inherit"],
+            fields=self.params["fields"],
+        )
 
     def run_command(self):
         result = dict(objects=[])
@@ -613,9 +622,13 @@ class RecordInfoModule(UniversalDDIAnsibleModule):
 
         find_results = self.find()
 
+        if self.params["dest"] is not None:
+            result.update(self.write_objects(find_results))
+            self.exit_json(**result)
+
         all_results = []
         for r in find_results:
-            all_results.append(r.model_dump(by_alias=True, exclude_none=True))
+            all_results.append(r if isinstance(r, dict) else r.model_dump(by_alias=True, exclude_none=True))
 
         result["objects"] = all_results
         self.exit_json(**result)
@@ -631,6 +644,7 @@ def main():
         tag_filters=dict(type="dict", required=False),
         tag_filter_query=dict(type="str", required=False),
     )
+    module_args.update(universal_ddi_info_argument_spec())
 
     module = RecordInfoModule(
         argument_spec=module_args,
@@ -857,7 +857,17 @@ class ViewModule(UniversalDDIAnsibleModule):
     def __init__(self, *args, **kwargs):
         super(ViewModule, self).__init__(*args, **kwargs)
 
-        exclude = ["csp_url", "api_key", "portal_url", "portal_key", "id"]
+        exclude = [
+            "csp_url",
+            "api_key",
+            "portal_url",
+            "portal_key",
+            "pool_size",
+            "trace",
+            "max_retries",
+            "rate_limit",
+            "id",
+        ]
         self._payload_params = {k: v for k, v in self.params.items() if v is not None and k not in exclude}
         self._payload = BulkCopyView.from_dict(self._payload_params)
         self._existing = None
@@ -783,6 +783,8 @@ options:
 
 extends_documentation_fragment:
     - infoblox.universal_ddi.common
+    - infoblox.universal_ddi.find
+    - infoblox.universal_ddi.write
 """  # noqa: E501
 
 EXAMPLES = r"""
@@ -2412,7 +2414,12 @@ item:
                     returned: Always
 """  # noqa: E501
 
-from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import UniversalDDIAnsibleModule
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import (
+    ProbedObject,
+    UniversalDDIAnsibleModule,
+    universal_ddi_find_argument_spec,
+    universal_ddi_write_argument_spec,
+)
 
 try:
     from ipam import AddressBlock, AddressBlockApi
@@ -2432,7 +2439,21 @@ class AddressBlockModule(UniversalDDIAnsibleModule):
                 self.params["address"], netmask = self.params["address"].split("/")
                 self.params["cidr"] = int(netmask)
 
-        exclude = ["state", "csp_url", "api_key", "portal_url", "portal_key", "id", "next_available_id"]
+        exclude = [
+            "state",
+            "csp_url",
+            "api_key",
+            "portal_url",
+            "portal_key",
+            "pool_size",
+            "trace",
+            "max_retries",
+            "rate_limit",
+            "return_object",
+            "id",
+            "next_available_id",
+            "assume_absent",
+        ]
         self._payload_params = {k: v for k, v in self.params.items() if v is not None and k not in exclude}
         self._payload = AddressBlock.from_dict(self._payload_params)
 
@@ -2465,10 +2486,13 @@ class AddressBlockModule(UniversalDDIAnsibleModule):
             # if existing is None, then it is a create operation
             return True
 
-        return self.is_changed(self.existing.model_dump(by_alias=True, exclude_none=True), self.payload_params)
+        return self.is_changed(self.existing, self.payload_params)
 
     def find(self):
         if self.params["id"] is not None:
+            if self.delete_by_id:
+                # The object is deleted by its id, it does not need to be read
+                return ProbedObject(dict(id=self.params["id"]))
             try:
                 resp = AddressBlockApi(self.client).read(self.params["id"], inherit="full")
                 return resp.result
@@ -2481,7 +2505,9 @@ class AddressBlockModule(UniversalDDIAnsibleModule):
             if self.params["address"] is None:
                 return None
             filter = f"address=='{self.params['address']}' and space=='{self.params['space']}' and cidr=={self.params['cidr']}"
-            resp = AddressBlockApi(self.client).list(filter=filter, inherit="full")
+            resp = self.list_existing(
+                AddressBlockApi(self.client).list, filter, ["address", "space", "cidr"], inherit="full"
+            )
             if len(resp.results) == 1:
                 return resp.results[0]
             if len(resp.results) > 1:
@@ -2498,8 +2524,8 @@ class AddressBlockModule(UniversalDDIAnsibleModule):
             naId = f"{self.next_available_id}/nextavailableaddressblock"
             self._payload.address = naId
 
-        resp = AddressBlockApi(self.client).create(body=self.payload, inherit="full")
-        return resp.result.model_dump(by_alias=True, exclude_none=True)
+        resp = AddressBlockApi(self.client).create(body=self.payload, inherit=self.write_inherit)
+        return self.written_object(resp, AddressBlockApi(self.client).read)
 
     def update(self):
         if self.check_mode:
@@ -2508,10 +2534,8 @@ class AddressBlockModule(UniversalDDIAnsibleModule):
         update_body = self.payload
         update_body = self.validate_readonly_on_update(self.existing, update_body, ["address", "space", "cidr"])
 
-        resp = AddressBlockApi(self.client).update(id=self.existing.id, body=update_body, inherit="full")
-        if resp is None or resp.result is None:
-            resp = AddressBlockApi(self.client).read(self.existing.id, inherit="full")
-        return resp.result.model_dump(by_alias=True, exclude_none=True)
+        resp = AddressBlockApi(self.client).update(id=self.existing.id, body=update_body, inherit=self.write_inherit)
+        return self.written_object(resp, AddressBlockApi(self.client).read, id=self.existing.id)
 
     def delete(self):
         if self.check_mode:
@@ -2525,7 +2549,7 @@ class AddressBlockModule(UniversalDDIAnsibleModule):
         # based on the state that is passed in, we will execute the appropriate
         # functions
         try:
-            self.existing = self.find()
+            self.existing = None if self.assume_absent else self.find()
             item = {}
             if self.params["state"] == "present" and self.existing is None:
                 item = self.create()
@@ -2537,18 +2561,31 @@ class AddressBlockModule(UniversalDDIAnsibleModule):
                     result["changed"] = True
                     result["msg"] = "AddressBlock updated"
             elif self.params["state"] == "absent" and self.existing is not None:
-                self.delete()
-                result["changed"] = True
-                result["msg"] = "AddressBlock deleted"
+                try:
+                    self.delete()
+                    result["changed"] = True
+                    result["msg"] = "AddressBlock deleted"
+                except NotFoundException:
+                    if not self.delete_by_id:
+                        raise
+                    # Deleted by id, the object was not read before and does not exist
+                    self.existing = None
+
+            if self._diff and self.params["state"] == "present" and self.existing is not None:
+                # Only the fields to update, compared before the update
+                result["diff"] = self.changes(self.existing, self.payload_params)
 
             if self.check_mode:
-                # if in check mode, do not update the result or the diff, just return the changed state
+                # if in check mode, do not update the result, just return the changed state and the diff
                 self.exit_json(**result)
 
-            result["diff"] = dict(
-                before=self.existing.model_dump(by_alias=True, exclude_none=True) if self.existing is not None else {},
-                after=item,
-            )
+            if "diff" not in result:
+                result["diff"] = dict(
+                    before=(
+                        self.existing.model_dump(by_alias=True, exclude_none=True) if self.existing is not None else {}
+                    ),
+                    after=item,
+                )
             result["object"] = item
             result["id"] = (
                 self.existing.id if self.existing is not None else item["id"] if (item and "id" in item) else None
@@ -2871,6 +2908,8 @@ def main():
             ),
         ),
     )
+    module_args.update(universal_ddi_find_argument_spec())
+    module_args.update(universal_ddi_write_argument_spec())
 
     module = AddressBlockModule(
         argument_spec=module_args,
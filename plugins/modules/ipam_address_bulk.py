@@ -0,0 +1,389 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Infoblox Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+module: ipam_address_bulk
+short_description: Manage many Addresses of an IP Space at once
+description:
+    - Reserves, updates or deletes many addresses of an IP space in a single task.
+    - The existing addresses of the IP space are read once, the addresses to create, update or delete are computed locally and the changes are applied concurrently.
+    - The addresses are given either with O(addresses) or in a CSV or JSON Lines file with O(src).
+version_added: 1.3.0
+author: Infoblox Inc. (@infobloxopen)
+options:
+    space:
+        description:
+            - "The resource identifier of the IP space of the addresses."
+        type: str
+        required: true
+    state:
+        description:
+            - Indicate desired state of the addresses
+        type: str
+        required: false
+        choices:
+            - present
+            - absent
+        default: present
+    addresses:
+        description:
+            - "The addresses."
+            - "Mutually exclusive with O(src)."
+        type: list
+        elements: dict
+        suboptions:
+            address:
+                description:
+                    - "The address in form \"a.b.c.d\"."
+                type: str
+                required: true
+            comment:
+                description:
+                    - "The description for the address object. May contain 0 to 1024 characters. Can include UTF-8."
+                type: str
+            hwaddr:
+                description:
+                    - "The hardware address associated with this IP address."
+                type: str
+            interface:
+                description:
+                    - "The name of the network interface card (NIC) associated with the address, if any."
+                type: str
+            names:
+                description:
+                    - "The list of all names associated with this address."
+                type: list
+                elements: dict
+                suboptions:
+                    name:
+                        description:
+                            - "The name expressed as a single label or FQDN."
+                        type: str
+                    type:
+                        description:
+                            - "The origin of the name."
+                        type: str
+            tags:
+                description:
+                    - "The tags for this address in JSON format."
+                type: dict
+    src:
+        description:
+            - "The path of a file on the managed node holding the addresses, with the fields documented for O(addresses)."
+            - "Files ending with C(.csv) are read as CSV with a header row naming the fields. Cells of O(addresses[].names) and O(addresses[].tags) hold JSON. Other files are read as JSON Lines, one address per line. Files ending with C(.gz) are decompressed."
+            - "Mutually exclusive with O(addresses)."
+        type: path
+    max_concurrency:
+        description:
+            - "The maximum number of API calls made at the same time, both to read the existing addresses and to apply the changes."
+        type: int
+        default: 8
+
+extends_documentation_fragment:
+    - infoblox.universal_ddi.common
+"""  # noqa: E501
+
+EXAMPLES = r"""
+    - name: "Create an IP Space (required as parent)"
+      infoblox.universal_ddi.ipam_ip_space:
+        name: "example-ipspace"
+        state: "present"
+      register: ip_space
+
+    - name: "Create a Subnet (required as parent)"
+      infoblox.universal_ddi.ipam_subnet:
+        address: "10.0.0.0/16"
+        space: "{{ ip_space.id }}"
+        state: "present"
+
+    - name: Reserve Addresses
+      infoblox.universal_ddi.ipam_address_bulk:
+        space: "{{ ip_space.id }}"
+        addresses:
+          - address: "10.0.0.3"
+            comment: "vm-1"
+          - address: "10.0.0.4"
+            comment: "vm-2"
+            tags:
+              location: "site 1"
+        state: "present"
+
+    - name: Reserve Addresses listed in a CSV file
+      infoblox.universal_ddi.ipam_address_bulk:
+        space: "{{ ip_space.id }}"
+        src: "/tmp/addresses.csv"
+        max_concurrency: 16
+
+    - name: Delete Addresses
+      infoblox.universal_ddi.ipam_address_bulk:
+        space: "{{ ip_space.id }}"
+        addresses:
+          - address: "10.0.0.3"
+          - address: "10.0.0.4"
+        state: "absent"
+"""  # noqa: E501
+
+RETURN = r"""
+results:
+    description:
+        - The outcome for each address, in the order they were given
+    type: list
+    elements: dict
+    returned: Always
+    contains:
+        address:
+            description:
+                - The address
+            type: str
+        status:
+            description:
+                - What was done for the address, one of V(created), V(updated), V(deleted), V(unchanged) or V(failed)
+            type: str
+        id:
+            description:
+                - The resource identifier of the Address object, if it exists
+            type: str
+        msg:
+            description:
+                - The error returned by the API, if the change failed
+            type: str
+created:
+    description:
+        - Number of addresses created
+    type: int
+    returned: Always
+updated:
+    description:
+        - Number of addresses updated
+    type: int
+    returned: Always
+deleted:
+    description:
+        - Number of addresses deleted
+    type: int
+    returned: Always
+unchanged:
+    description:
+        - Number of addresses already in the desired state
+    type: int
+    returned: Always
+failed_count:
+    description:
+        - Number of addresses that could not be changed
+    type: int
+    returned: Always
+timing:
+    description:
+        - Time taken by the module, in seconds
+    type: dict
+    returned: Always
+    contains:
+        read:
+            description:
+                - Time taken to read the addresses and the existing addresses of the IP space
+            type: float
+        apply:
+            description:
+                - Time taken to apply the changes
+            type: float
+        total:
+            description:
+                - Total time
+            type: float
+"""  # noqa: E501
+
+import ipaddress
+import time
+
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.bulk import (
+    ItemFileError,
+    read_items,
+    validate_items,
+)
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import (
+    UniversalDDIAnsibleModule,
+    run_concurrently,
+)
+
+try:
+    from ipam import Address, AddressApi
+    from universal_ddi_client import ApiException
+except ImportError:
+    pass  # Handled by UniversalDDIAnsibleModule
+
+ADDRESS_OPTIONS = dict(
+    address=dict(type="str", required=True),
+    comment=dict(type="str"),
+    hwaddr=dict(type="str"),
+    interface=dict(type="str"),
+    names=dict(
+        type="list",
+        elements="dict",
+        options=dict(
+            name=dict(type="str"),
+            type=dict(type="str"),
+        ),
+    ),
+    tags=dict(type="dict"),
+)
+
+# Fields read for the existing addresses of the IP space
+_EXISTING_FIELDS = ["id", "address", "comment", "hwaddr", "interface", "names", "tags"]
+
+
+def _normalize_address(address):
+    try:
+        return ipaddress.ip_address(address.strip()).compressed
+    except ValueError:
+        return address.strip()
+
+
+class AddressBulkModule(UniversalDDIAnsibleModule):
+    def __init__(self, *args, **kwargs):
+        super(AddressBulkModule, self).__init__(*args, **kwargs)
+        self._limit = 1000
+
+    def desired(self):
+        """
+        Read the desired addresses, indexed by their normalized address, keeping the order they were given in.
+        """
+        if self.params["src"] is not None:
+            items = validate_items(read_items(self.params["src"]), ADDRESS_OPTIONS, self.params["src"])
+        else:
+            items = self.params["addresses"]
+
+        desired = {}
+        for item in items:
+            item = {k: v for k, v in item.items() if v is not None}
+            key = _normalize_address(item["address"])
+            if key in desired:
+                self.fail_json(msg=f"Duplicate address: {item['address']}")
+            desired[key] = item
+        return desired
+
+    def find(self):
+        """
+        Read the existing addresses of the IP space, indexed by their normalized address.
+        """
+        return {
+            _normalize_address(a["address"]): a
+            for a in self.paginate(
+                AddressApi(self.client).list,
+                filter=f"space=='{self.params['space']}'",
+                fields=_EXISTING_FIELDS,
+            )
+            if a.get("address")
+        }
+
+    def create(self, item):
+        body = Address.from_dict(dict(item, space=self.params["space"]))
+        return AddressApi(self.client).create(body=body).result.id
+
+    def update(self, pair):
+        existing, item = pair
+        # The space of an address cannot be updated
+        body = Address.from_dict(item)
+        AddressApi(self.client).update(id=existing["id"], body=body)
+        return existing["id"]
+
+    def delete(self, existing):
+        AddressApi(self.client).delete(existing["id"])
+        return existing["id"]
+
+    def run_command(self):
+        start = time.monotonic()
+        result = dict(changed=False, results=[], created=0, updated=0, deleted=0, unchanged=0, failed_count=0)
+
+        try:
+            desired = self.desired()
+        except ItemFileError as e:
+            self.fail_json(msg=f"Failed to read addresses: {e}")
+        except (IOError, OSError) as e:
+            self.fail_json(msg=f"Failed to read addresses: {e}")
+
+        try:
+            existing = self.find()
+            read_done = time.monotonic()
+
+            outcomes = {}
+            creates, updates, deletes = [], [], []
+            for key, item in desired.items():
+                current = existing.get(key)
+                if self.params["state"] == "absent":
+                    if current is not None:
+                        deletes.append(current)
+                    else:
+                        outcomes[key] = dict(status="unchanged")
+                elif current is None:
+                    creates.append(item)
+                elif self.is_changed(current, {k: v for k, v in item.items() if k != "address"}):
+                    updates.append((current, item))
+                else:
+                    outcomes[key] = dict(status="unchanged", id=current["id"])
+
+            for status, func, items in (
+                ("created", self.create, creates),
+                ("updated", self.update, updates),
+                ("deleted", self.delete, deletes),
+            ):
+                if self.check_mode:
+                    applied = [(item, None, None) for item in items]
+                else:
+                    applied = run_concurrently(func, items, self.params["max_concurrency"])
+                for item, id, error in applied:
+                    # Updates are (existing, desired) pairs, deletions are existing addresses
+                    address = item[1]["address"] if isinstance(item, tuple) else item["address"]
+                    if error is not None:
+                        outcome = dict(status="failed", msg=f"{error.status} {error.reason} {error.body}")
+                    elif id is None and status != "created":
+                        outcome = dict(status=status, id=item[0]["id"] if isinstance(item, tuple) else item["id"])
+                    else:
+                        outcome = dict(status=status, id=id)
+                    outcomes[_normalize_address(address)] = outcome
+        except ApiException as e:
+            self.fail_json(msg=f"Failed to execute command: {e.status} {e.reason} {e.body}")
+
+        for key, item in desired.items():
+            outcome = dict(address=item["address"], **outcomes[key])
+            result["results"].append(outcome)
+            result["failed_count" if outcome["status"] == "failed" else outcome["status"]] += 1
+        result["changed"] = bool(result["created"] or result["updated"] or result["deleted"])
+
+        end = time.monotonic()
+        result["timing"] = dict(
+            read=round(read_done - start, 3), apply=round(end - read_done, 3), total=round(end - start, 3)
+        )
+        if result["failed_count"]:
+            self.fail_json(msg=f"Failed to change {result['failed_count']} addresses", **result)
+
+        self.exit_json(**result)
+
+
+def main():
+    module_args = dict(
+        space=dict(type="str", required=True),
+        state=dict(type="str", required=False, choices=["present", "absent"], default="present"),
+        addresses=dict(type="list", elements="dict", options=ADDRESS_OPTIONS),
+        src=dict(type="path"),
+        max_concurrency=dict(type="int", default=8),
+    )
+
+    module = AddressBulkModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+        mutually_exclusive=[["addresses", "src"]],
+        required_one_of=[["addresses", "src"]],
+    )
+
+    module.run_command()
+
+
+if __name__ == "__main__":
+    main()
@@ -850,6 +850,8 @@ options:
 
 extends_documentation_fragment:
     - infoblox.universal_ddi.common
+    - infoblox.universal_ddi.find
+    - infoblox.universal_ddi.write
 """  # noqa: E501
 
 EXAMPLES = r"""
@@ -2566,7 +2568,12 @@ item:
             returned: Always
 """  # noqa: E501
 
-from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import UniversalDDIAnsibleModule
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import (
+    ProbedObject,
+    UniversalDDIAnsibleModule,
+    universal_ddi_find_argument_spec,
+    universal_ddi_write_argument_spec,
+)
 
 try:
     from ipam import IPSpace, IpSpaceApi
@@ -2579,7 +2586,20 @@ class IPSpaceModule(UniversalDDIAnsibleModule):
     def __init__(self, *args, **kwargs):
         super(IPSpaceModule, self).__init__(*args, **kwargs)
 
-        exclude = ["state", "csp_url", "api_key", "portal_url", "portal_key", "id"]
+        exclude = [
+            "state",
+            "csp_url",
+            "api_key",
+            "portal_url",
+            "portal_key",
+            "pool_size",
+            "trace",
+            "max_retries",
+            "rate_limit",
+            "return_object",
+            "id",
+            "assume_absent",
+        ]
         self._payload_params = {k: v for k, v in self.params.items() if v is not None and k not in exclude}
         self._payload = IPSpace.from_dict(self._payload_params)
         self._existing = None
@@ -2605,10 +2625,13 @@ class IPSpaceModule(UniversalDDIAnsibleModule):
             # if existing is None, then it is a create operation
             return True
 
-        return self.is_changed(self.existing.model_dump(by_alias=True, exclude_none=True), self.payload_params)
+        return self.is_changed(self.existing, self.payload_params)
 
     def find(self):
         if self.params["id"] is not None:
+            if self.delete_by_id:
+                # The object is deleted by its id, it does not need to be read
+                return ProbedObject(dict(id=self.params["id"]))
             try:
                 resp = IpSpaceApi(self.client).read(self.params["id"], inherit="full")
                 return resp.result
@@ -2618,7 +2641,7 @@ class IPSpaceModule(UniversalDDIAnsibleModule):
                 raise e
         else:
             filter = f"name=='{self.params['name']}'"
-            resp = IpSpaceApi(self.client).list(filter=filter, inherit="full")
+            resp = self.list_existing(IpSpaceApi(self.client).list, filter, ["name"], inherit="full")
             if len(resp.results) == 1:
                 return resp.results[0]
             if len(resp.results) > 1:
@@ -2630,17 +2653,15 @@ class IPSpaceModule(UniversalDDIAnsibleModule):
         if self.check_mode:
             return None
 
-        resp = IpSpaceApi(self.client).create(body=self.payload, inherit="full")
-        return resp.result.model_dump(by_alias=True, exclude_none=True)
+        resp = IpSpaceApi(self.client).create(body=self.payload, inherit=self.write_inherit)
+        return self.written_object(resp, IpSpaceApi(self.client).read)
 
     def update(self):
         if self.check_mode:
             return None
 
-        resp = IpSpaceApi(self.client).update(id=self.existing.id, body=self.payload, inherit="full")
-        if resp is None or resp.result is None:
-            resp = IpSpaceApi(self.client).read(self.existing.id, inherit="full")
-        return resp.result.model_dump(by_alias=True, exclude_none=True)
+        resp = IpSpaceApi(self.client).update(id=self.existing.id, body=self.payload, inherit=self.write_inherit)
+        return self.written_object(resp, IpSpaceApi(self.client).read, id=self.existing.id)
 
     def delete(self):
         if self.check_mode:
@@ -2654,7 +2675,7 @@ class IPSpaceModule(UniversalDDIAnsibleModule):
         # based on the state that is passed in, we will execute the appropriate
         # functions
         try:
-            self.existing = self.find()
+            self.existing = None if self.assume_absent else self.find()
             item = {}
             if self.params["state"] == "present" and self.existing is None:
                 item = self.create()
@@ -2666,18 +2687,31 @@ class IPSpaceModule(UniversalDDIAnsibleModule):
                     result["changed"] = True
                     result["msg"] = "IpSpace updated"
             elif self.params["state"] == "absent" and self.existing is not None:
-                self.delete()
-                result["changed"] = True
-                result["msg"] = "IpSpace deleted"
+                try:
+                    self.delete()
+                    result["changed"] = True
+                    result["msg"] = "IpSpace deleted"
+                except NotFoundException:
+                    if not self.delete_by_id:
+                        raise
+                    # Deleted by id, the object was not read before and does not exist
+                    self.existing = None
+
+            if self._diff and self.params["state"] == "present" and self.existing is not None:
+                # Only the fields to update, compared before the update
+                result["diff"] = self.changes(self.existing, self.payload_params)
 
             if self.check_mode:
-                # if in check mode, do not update the result or the diff, just return the changed state
+                # if in check mode, do not update the result, just return the changed state and the diff
                 self.exit_json(**result)
 
-            result["diff"] = dict(
-                before=self.existing.model_dump(by_alias=True, exclude_none=True) if self.existing is not None else {},
-                after=item,
-            )
+            if "diff" not in result:
+                result["diff"] = dict(
+                    before=(
+                        self.existing.model_dump(by_alias=True, exclude_none=True) if self.existing is not None else {}
+                    ),
+                    after=item,
+                )
             result["object"] = item
             result["id"] = (
                 self.existing.id if self.existing is not None else item["id"] if (item and "id" in item) else None
@@ -3023,6 +3057,8 @@ def main():
         tags=dict(type="dict"),
         vendor_specific_option_option_space=dict(type="str"),
     )
+    module_args.update(universal_ddi_find_argument_spec())
+    module_args.update(universal_ddi_write_argument_spec())
 
     module = IPSpaceModule(
         argument_spec=module_args,
@@ -0,0 +1,193 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Infoblox Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+module: ipam_ip_space_utilization_info
+short_description: Computes the free space and the utilization of the Address Blocks of an IP Space
+description:
+    - Computes the free space, the fragmentation of the free space and the utilization of every address block of an IP space.
+    - The address blocks, subnets, ranges and optionally the addresses of the IP space are read with only the fields needed, several result pages at the same time, and the computation is done locally on integer intervals.
+    - The space used in an address block is the space of the subnets and ranges in it, at any depth. Nested address blocks are not used space.
+    - The addresses are counted with NumPy if it is installed on the managed node, which is faster and uses less memory for IPv4 addresses.
+version_added: 1.3.0
+author: Infoblox Inc. (@infobloxopen)
+options:
+    space:
+        description:
+            - "The resource identifier of the IP space."
+        type: str
+        required: true
+    count_addresses:
+        description:
+            - "Whether to count the addresses in use in each address block."
+            - "Reading the addresses takes most of the time for large IP spaces."
+        type: bool
+        default: true
+    max_concurrency:
+        description:
+            - "The maximum number of result pages read at the same time."
+        type: int
+        default: 4
+
+extends_documentation_fragment:
+    - infoblox.universal_ddi.common
+"""  # noqa: E501
+
+EXAMPLES = r"""
+  - name: Get the utilization of the address blocks of an IP space
+    infoblox.universal_ddi.ipam_ip_space_utilization_info:
+      space: "{{ ip_space_id }}"
+    register: utilization
+
+  - name: Show the address blocks more than 80% used
+    ansible.builtin.debug:
+      msg: "{{ utilization.objects | selectattr('utilization', 'gt', 80) | map(attribute='address') | list }}"
+
+  - name: Get the utilization of the address blocks without counting the addresses
+    infoblox.universal_ddi.ipam_ip_space_utilization_info:
+      space: "{{ ip_space_id }}"
+      count_addresses: false
+"""  # noqa: E501
+
+RETURN = r"""
+objects:
+    description:
+        - The address blocks of the IP space with their utilization, IPv4 first, in ascending order of address
+        - An address block comes before the address blocks nested in it
+    type: list
+    elements: dict
+    returned: Always
+    contains:
+        id:
+            description:
+                - The resource identifier of the address block
+            type: str
+        address:
+            description:
+                - The address of the address block
+            type: str
+        cidr:
+            description:
+                - The CIDR of the address block
+            type: int
+        parent:
+            description:
+                - The resource identifier of the parent of the address block
+            type: str
+        total:
+            description:
+                - The number of addresses of the address block
+            type: int
+        used:
+            description:
+                - The number of addresses of the address block in subnets or ranges
+            type: int
+        free:
+            description:
+                - The number of addresses of the address block in no subnet or range
+            type: int
+        utilization:
+            description:
+                - The percentage of the addresses of the address block in subnets or ranges
+            type: float
+        free_ranges:
+            description:
+                - The number of free ranges of consecutive addresses in the address block
+            type: int
+        largest_free_cidr:
+            description:
+                - The CIDR of the largest network that fits in the free space of the address block, null if it is full
+            type: int
+        fragmentation:
+            description:
+                - The share of the free space that is not in the largest free network, from 0 to 1
+            type: float
+        addresses:
+            description:
+                - The number of addresses in use in the address block
+            type: int
+            returned: When O(count_addresses=true)
+summary:
+    description:
+        - The utilization of all the address blocks of the IP space, by IP version, as V(ipv4) and V(ipv6)
+    type: dict
+    returned: Always
+"""  # noqa: E501
+
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import UniversalDDIAnsibleModule
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.utilization import space_utilization
+
+try:
+    from ipam import AddressApi, AddressBlockApi, IpSpaceApi, RangeApi, SubnetApi
+    from universal_ddi_client import ApiException
+except ImportError:
+    pass  # Handled by UniversalDDIAnsibleModule
+
+# Fields of the address blocks returned with their utilization
+_BLOCK_FIELDS = ["id", "address", "cidr", "parent", "name"]
+
+
+class IPSpaceUtilizationInfoModule(UniversalDDIAnsibleModule):
+    def __init__(self, *args, **kwargs):
+        super(IPSpaceUtilizationInfoModule, self).__init__(*args, **kwargs)
+        self._existing = None
+        self._limit = 1000
+
+    @property
+    def space_filter(self):
+        return f"space=='{self.params['space']}'"
+
+    def find_networks(self):
+        for subnet in self.paginate(SubnetApi(self.client).list, filter=self.space_filter, fields=["address", "cidr"]):
+            yield f"{subnet['address']}/{subnet['cidr']}"
+        for r in self.paginate(RangeApi(self.client).list, filter=self.space_filter, fields=["start", "end"]):
+            yield (r["start"], r["end"])
+
+    def find_addresses(self):
+        for address in self.paginate(
+            AddressApi(self.client).list, filter=self.space_filter, fields=["address", "state"]
+        ):
+            if address.get("state") != "free":
+                yield address.get("address")
+
+    def run_command(self):
+        result = dict(objects=[], summary={})
+
+        try:
+            IpSpaceApi(self.client).read(self.params["space"])
+        except ApiException as e:
+            self.fail_json(msg=f"Failed to execute command: {e.status} {e.reason} {e.body}")
+
+        blocks = self.paginate(AddressBlockApi(self.client).list, filter=self.space_filter, fields=_BLOCK_FIELDS)
+        result["objects"], result["summary"] = space_utilization(
+            blocks,
+            self.find_networks(),
+            self.find_addresses() if self.params["count_addresses"] else None,
+        )
+        self.exit_json(**result)
+
+
+def main():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        space=dict(type="str", required=True),
+        count_addresses=dict(type="bool", required=False, default=True),
+        max_concurrency=dict(type="int", required=False, default=4),
+    )
+
+    module = IPSpaceUtilizationInfoModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+    module.run_command()
+
+
+if __name__ == "__main__":
+    main()
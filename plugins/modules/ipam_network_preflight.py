@@ -0,0 +1,272 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Infoblox Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+module: ipam_network_preflight
+short_description: Checks planned Address Blocks, Subnets and Ranges for conflicts before creating them
+description:
+    - Checks a batch of planned address blocks, subnets and ranges against the existing ones and against each other, before any of them is created, e.g. with M(infoblox.universal_ddi.ipam_address_block), M(infoblox.universal_ddi.ipam_subnet) and M(infoblox.universal_ddi.ipam_range) in a loop.
+    - The existing address blocks, subnets and ranges of the IP spaces of the planned networks are read once, with only their addresses, and the whole batch is checked locally in O(n log n), separately for each IP space and IP version.
+    - A planned network conflicts if it partially overlaps another network, if it is in a network it cannot be in (e.g. a subnet in a subnet, or an address block in a subnet), or if an existing network would be in it that cannot be (e.g. an address block in a planned subnet). A network planned twice is a duplicate. A network that already exists is reported as such, as creating it again is a no-op.
+    - Nothing is changed.
+version_added: 1.3.0
+author: Infoblox Inc. (@infobloxopen)
+options:
+    space:
+        description:
+            - "The resource identifier of the IP space of the planned networks that have no O(networks[].space)."
+        type: str
+        required: false
+    networks:
+        description:
+            - "The planned networks."
+            - "Mutually exclusive with O(src)."
+        type: list
+        elements: dict
+        suboptions:
+            type:
+                description:
+                    - "The type of the network."
+                type: str
+                required: true
+                choices:
+                    - address_block
+                    - subnet
+                    - range
+            address:
+                description:
+                    - "The address of an address block or a subnet, in the form \"a.b.c.d/n\", or \"a.b.c.d\" with O(networks[].cidr)."
+                type: str
+            cidr:
+                description:
+                    - "The CIDR of an address block or a subnet, if not in O(networks[].address)."
+                type: int
+            start:
+                description:
+                    - "The first address of a range."
+                type: str
+            end:
+                description:
+                    - "The last address of a range."
+                type: str
+            space:
+                description:
+                    - "The resource identifier of the IP space of the network. Defaults to O(space)."
+                type: str
+    src:
+        description:
+            - "The path of a file on the managed node holding the planned networks, with the fields documented for O(networks)."
+            - "Files ending with C(.csv) are read as CSV with a header row naming the fields. Other files are read as JSON Lines, one network per line. Files ending with C(.gz) are decompressed."
+            - "Mutually exclusive with O(networks)."
+        type: path
+    fail_on_conflict:
+        description:
+            - "Whether to fail if any planned network conflicts with another network or is a duplicate."
+        type: bool
+        default: true
+    max_concurrency:
+        description:
+            - "The maximum number of result pages read at the same time."
+        type: int
+        default: 4
+
+extends_documentation_fragment:
+    - infoblox.universal_ddi.common
+"""  # noqa: E501
+
+EXAMPLES = r"""
+    - name: "Check the planned networks before creating them"
+      infoblox.universal_ddi.ipam_network_preflight:
+        space: "{{ ip_space.id }}"
+        networks: "{{ planned_networks }}"
+
+    - name: "Create the planned subnets"
+      infoblox.universal_ddi.ipam_subnet:
+        address: "{{ item.address }}"
+        space: "{{ ip_space.id }}"
+        state: "present"
+      loop: "{{ planned_networks | selectattr('type', 'eq', 'subnet') }}"
+
+    - name: "Report the conflicts of networks listed in a CSV file, without failing"
+      infoblox.universal_ddi.ipam_network_preflight:
+        space: "{{ ip_space.id }}"
+        src: "/tmp/networks.csv"
+        fail_on_conflict: false
+      register: preflight
+"""  # noqa: E501
+
+RETURN = r"""
+results:
+    description:
+        - The outcome of the check of each planned network, in the order they were given
+    type: list
+    elements: dict
+    returned: Always
+    contains:
+        type:
+            description:
+                - The type of the network
+            type: str
+        network:
+            description:
+                - The network, as "a.b.c.d/n" for address blocks and subnets, and as "start-end" for ranges
+            type: str
+        status:
+            description:
+                - V(ok) if the network can be created, V(exists) if it already exists, V(duplicate) if it is planned more than once, or V(conflict)
+            type: str
+        msg:
+            description:
+                - The reason of the status, unless it is V(ok)
+            type: str
+conflicts:
+    description:
+        - Number of planned networks that conflict with another network or are duplicates
+    type: int
+    returned: Always
+existing:
+    description:
+        - Number of planned networks that already exist
+    type: int
+    returned: Always
+"""  # noqa: E501
+
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.bulk import (
+    ItemFileError,
+    read_items,
+    validate_items,
+)
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import UniversalDDIAnsibleModule
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.overlaps import (
+    NETWORK_TYPES,
+    find_conflicts,
+    network_of,
+)
+
+try:
+    from ipam import AddressBlockApi, RangeApi, SubnetApi
+except ImportError:
+    pass  # Handled by UniversalDDIAnsibleModule
+
+NETWORK_OPTIONS = dict(
+    type=dict(type="str", required=True, choices=list(NETWORK_TYPES)),
+    address=dict(type="str"),
+    cidr=dict(type="int"),
+    start=dict(type="str"),
+    end=dict(type="str"),
+    space=dict(type="str"),
+)
+
+
+class NetworkPreflightModule(UniversalDDIAnsibleModule):
+    def __init__(self, *args, **kwargs):
+        super(NetworkPreflightModule, self).__init__(*args, **kwargs)
+        self._limit = 1000
+
+    def planned(self):
+        """
+        Read the planned networks, with their addresses as integers.
+        """
+        if self.params["src"] is not None:
+            items = validate_items(read_items(self.params["src"]), NETWORK_OPTIONS, self.params["src"])
+        else:
+            items = self.params["networks"]
+
+        planned = []
+        for index, item in enumerate(items):
+            space = item.get("space") or self.params["space"]
+            if not space:
+                self.fail_json(msg=f"Network {index} has no space, and the space option is not set")
+            try:
+                version, first, last, description = network_of(
+                    item["type"], item.get("address"), item.get("cidr"), item.get("start"), item.get("end")
+                )
+            except ValueError as e:
+                self.fail_json(msg=f"Network {index} is not valid: {e}")
+            planned.append(
+                dict(space=space, type=item["type"], version=version, first=first, last=last, description=description)
+            )
+        return planned
+
+    def find(self, spaces):
+        """
+        Read the existing address blocks, subnets and ranges of the IP spaces, with only their addresses.
+        """
+        for space in spaces:
+            space_filter = f"space=='{space}'"
+            for network_type, api in (("address_block", AddressBlockApi), ("subnet", SubnetApi)):
+                for obj in self.paginate(api(self.client).list, filter=space_filter, fields=["id", "address", "cidr"]):
+                    version, first, last, description = network_of(network_type, obj["address"], obj["cidr"])
+                    yield dict(
+                        space=space,
+                        type=network_type,
+                        id=obj["id"],
+                        version=version,
+                        first=first,
+                        last=last,
+                        description=description,
+                    )
+            for obj in self.paginate(RangeApi(self.client).list, filter=space_filter, fields=["id", "start", "end"]):
+                version, first, last, description = network_of("range", start=obj["start"], end=obj["end"])
+                yield dict(
+                    space=space,
+                    type="range",
+                    id=obj["id"],
+                    version=version,
+                    first=first,
+                    last=last,
+                    description=description,
+                )
+
+    def run_command(self):
+        result = dict(changed=False, results=[], conflicts=0, existing=0)
+
+        try:
+            planned = self.planned()
+        except (ItemFileError, IOError, OSError) as e:
+            self.fail_json(msg=f"Failed to read networks: {e}")
+
+        spaces = sorted(set(p["space"] for p in planned))
+        problems = find_conflicts(self.find(spaces), planned)
+
+        for network, problem in zip(planned, problems):
+            outcome = dict(type=network["type"], network=network["description"], status="ok")
+            if problem is not None:
+                outcome.update(problem)
+                result["existing" if problem["status"] == "exists" else "conflicts"] += 1
+            result["results"].append(outcome)
+
+        if result["conflicts"] and self.params["fail_on_conflict"]:
+            self.fail_json(msg=f"{result['conflicts']} planned networks conflict with other networks", **result)
+
+        self.exit_json(**result)
+
+
+def main():
+    module_args = dict(
+        space=dict(type="str", required=False),
+        networks=dict(type="list", elements="dict", options=NETWORK_OPTIONS),
+        src=dict(type="path"),
+        fail_on_conflict=dict(type="bool", default=True),
+        max_concurrency=dict(type="int", default=4),
+    )
+
+    module = NetworkPreflightModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+        mutually_exclusive=[["networks", "src"]],
+        required_one_of=[["networks", "src"]],
+    )
+
+    module.run_command()
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,7 @@ short_description: Retrieves the next available IP addresses.
 description:
     - Retrieves the next available IP addresses in the specified resource.
     - The resource can be an address block, subnet or range.
+    - With O(tag_filters), the resources with the most free addresses are searched first, several at the same time, until O(count) addresses are found.
 version_added: 1.0.0
 author: Infoblox Inc. (@infobloxopen)
 options:
@@ -31,7 +32,9 @@ options:
     count:
         description:
             - "The number of IP addresses requested."
-            - "Value must be between 1 and 20."
+            - "The API returns at most 20 addresses at a time. More addresses are asked for in chunks of up to 20, without duplicates, until O(count) addresses are found or the resource returns no new address. The addresses of an address block are also searched in the subnets directly in it."
+            - "All the addresses come from the API. As the API may return the same first addresses to every request, a single subnet or range may not return more than 20 addresses."
+            - "Contiguous addresses are all taken from a single resource, and at most 20 contiguous addresses can be requested."
         type: int
         default: 1
         required: false
@@ -49,6 +52,14 @@ options:
             - address_block
             - subnet
             - range
+    max_concurrency:
+        description:
+            - "The maximum number of resources searched at the same time, when using tag_filters or when searching the subnets of an address block."
+            - "Also the maximum number of result pages read at the same time."
+        type: int
+        default: 4
+        required: false
+        version_added: 1.3.0
 
 extends_documentation_fragment:
     - infoblox.universal_ddi.common
@@ -152,7 +163,15 @@ objects:
     returned: Always
 """  # noqa: E501
 
-from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import UniversalDDIAnsibleModule
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import (
+    UniversalDDIAnsibleModule,
+    iter_objects,
+)
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.next_available import (
+    MAX_COUNT,
+    find_next_available,
+    rank,
+)
 
 try:
     from ipam import AddressBlockApi, RangeApi, SubnetApi
@@ -160,6 +179,37 @@ try:
 except ImportError:
     pass  # Handled by UniversalDDIAnsibleModule
 
+# Fields of the resources read to rank them by free addresses
+_RANK_FIELDS = ["id", "utilization", "utilization_v6"]
+
+
+def _free_addresses(resource):
+    """
+    The number of free addresses of a resource, as a dict with _RANK_FIELDS, or -1 if unknown.
+    """
+    for key in ("utilization_v6", "utilization"):
+        utilization = resource.get(key) or {}
+        try:
+            total = int(utilization.get("total") or 0)
+            if not total:
+                # utilization_v6 is empty for IPv4 resources
+                continue
+            if utilization.get("free") is not None:
+                return int(utilization["free"])
+            return max(0, total - int(utilization.get("used") or 0))
+        except (TypeError, ValueError):
+            continue
+    return -1
+
+
+def _resource_type(resource_id, resource_type=None):
+    """
+    The type of a resource, e.g. subnet for ipam/subnet/<uuid>.
+    """
+    if resource_type:
+        return resource_type
+    return resource_id.rsplit("/", 1)[0].rsplit("/", 1)[-1]
+
 
 class NextAvailableIPInfoModule(UniversalDDIAnsibleModule):
     def __init__(self, *args, **kwargs):
@@ -197,59 +247,122 @@ class NextAvailableIPInfoModule(UniversalDDIAnsibleModule):
         raise ValueError("Unable to determine resource type")
 
     def find(self):
-        all_results = []
-        offset = 0
-
-        while True:
-            try:
-                id = self.params["id"]
-                client = self._get_api_for_resource(resource_id=id)
-                resp = client.list_next_available_ip(
-                    id=id, contiguous=self.params["contiguous"], count=self.params["count"]
-                )
-                if resp.results:
-                    all_results.extend(resp.results)
-
-                if len(resp.results) < self._limit:
-                    break
-                offset += self._limit
-
-            except ApiException as e:
-                self.fail_json(msg=f"Failed to execute command: {e.status} {e.reason} {e.body}")
+        id = self.params["id"]
+        count = self.params["count"]
 
-        return all_results
+        try:
+            results = self.find_next_available_ips(id, count)
+        except ApiException as e:
+            self.fail_json(msg=f"Failed to execute command: {e.status} {e.reason} {e.body}")
+        if len(results or []) < count:
+            self.fail_json(msg=f"Requested {count} IPs but only {len(results or [])} were available in {id}.")
+        return results
 
     def find_next_available_ip(self, id=None, resource_type=None, count=None):
+        """
+        Ask the API for the next available IPs of a resource, at most MAX_COUNT.
+
+        :return: List of the IPs, or None if the resource does not have that many available IPs
+        :raises ApiException: Any other API error, e.g. the resource does not exist
+        """
+        client = self._get_api_for_resource(resource_id=id, resource_type=resource_type)
         try:
-            client = self._get_api_for_resource(resource_id=id, resource_type=resource_type)
             resp = client.list_next_available_ip(id=id, contiguous=self.params["contiguous"], count=count)
-            return resp.results
+        except ApiException as e:
+            if e.status == 400:
+                # Fewer available IPs than requested
+                return None
+            raise
+        return [r.address for r in resp.results or []]
+
+    def find_next_available_ips(self, id, count, resource_type=None):
+        """
+        Find any number of next available IPs in a resource, although the API returns at most MAX_COUNT at a time.
 
-        except (ApiException, ValueError):
-            return None
+        Every IP comes from the API. The resource is asked for chunks of up to MAX_COUNT IPs, dropping the IPs it
+        already returned, until count IPs are found or it returns no new IP. The next available IPs of an address
+        block are also searched in the subnets directly in it. Contiguous IPs are asked for in a single chunk.
 
-    def find_resources_by_tags(self, resource_type):
-        tag_filter_str = " and ".join([f"{k}=='{v}'" for k, v in self.params["tag_filters"].items()])
+        :param id: The ID of the resource
+        :param count: The number of IPs to find
+        :param resource_type: The type of the resource, if it cannot be told from the ID
+        :return: List of up to count IPs, or None if the resource does not have the IPs available
+        :raises ApiException: An API error other than too few available IPs
+        """
+        if self.params["contiguous"] or count <= MAX_COUNT:
+            return self.find_next_available_ip(id=id, resource_type=resource_type, count=min(count, MAX_COUNT))
+
+        found, seen = [], set()
+        while len(found) < count:
+            chunk = self.find_next_available_ip(
+                id=id, resource_type=resource_type, count=min(count - len(found), MAX_COUNT)
+            )
+            new = [address for address in chunk or [] if address not in seen]
+            if not new:
+                break
+            seen.update(new)
+            found.extend(new)
+
+        if len(found) < count and _resource_type(id, resource_type) == "address_block":
+            subnets = self.find_resources(SubnetApi(self.client), filter=f"parent=='{id}'")
+            for address in self.search_resources(subnets, count, "subnet"):
+                if address not in seen and len(found) < count:
+                    seen.add(address)
+                    found.append(address)
+        return found
+
+    def find_resources(self, api, **kwargs):
+        """
+        Find resources, with only the fields needed to rank them.
 
-        offset = 0
-        all_resources = []
+        :param api: The API of the type of the resources
+        :param kwargs: The filters of the resources
+        :return: List of the resources as dicts
+        """
+        try:
+            return list(
+                iter_objects(
+                    api.list,
+                    limit=self._limit,
+                    max_concurrency=self.params["max_concurrency"],
+                    fields=_RANK_FIELDS,
+                    **kwargs,
+                )
+            )
+        except ApiException as e:
+            self.fail_json(msg=f"Failed to execute command: {e.status} {e.reason} {e.body}")
 
-        while True:
-            try:
-                api = self._get_api_for_resource(resource_type=resource_type)
-                resp = api.list(offset=offset, limit=self._limit, tfilter=tag_filter_str, inherit="full")
+    def find_resources_by_tags(self, resource_type):
+        """
+        Find the resources matching the tag filters, with only the fields needed to rank them.
 
-                if resp.results:
-                    all_resources.extend(resp.results)
+        :return: List of the resources as dicts
+        """
+        tag_filter_str = " and ".join([f"{k}=='{v}'" for k, v in self.params["tag_filters"].items()])
+        return self.find_resources(self._get_api_for_resource(resource_type=resource_type), tfilter=tag_filter_str)
 
-                if len(resp.results) < self._limit:
-                    break
-                offset += self._limit
+    def search_resources(self, resources, count, resource_type):
+        """
+        Find next available IPs in several resources, searching the resources with the most free addresses first.
 
-            except ApiException as e:
-                self.fail_json(msg=f"Failed to execute command: {e.status} {e.reason} {e.body}")
+        The resources are searched in waves of up to max_concurrency resources at the same time, each wave with only as
+        many resources as their free addresses require, until count addresses are found. Resources known to be full are
+        not searched. Contiguous IPs are all taken from the same resource.
 
-        return all_resources
+        :param resources: The resources, as returned by find_resources
+        :param count: The number of addresses to find
+        :param resource_type: The type of the resources
+        :return: List of up to count next available IPs, from the resources in order of free addresses
+        """
+        return find_next_available(
+            lambda id, n: self.find_next_available_ips(id, n, resource_type),
+            rank([(_free_addresses(r), r["id"]) for r in resources if r.get("id")]),
+            count,
+            max_concurrency=self.params["max_concurrency"],
+            # Resources may be nested, e.g. address blocks
+            key=lambda address: address,
+            whole=self.params["contiguous"],
+        )
 
     def run_command(self):
         result = dict(objects=[])
@@ -259,9 +372,8 @@ class NextAvailableIPInfoModule(UniversalDDIAnsibleModule):
 
         count = self.params["count"]
 
-        # Validate count is within allowed range
-        if not 1 <= count <= 20:
-            self.fail_json(msg="count must be between 1 and 20.")
+        if count < 1:
+            self.fail_json(msg="count must be at least 1.")
 
         if self.params["tag_filters"]:
             if not self.params["resource_type"]:
@@ -273,38 +385,16 @@ class NextAvailableIPInfoModule(UniversalDDIAnsibleModule):
             if not resources:
                 self.fail_json(msg=f"No {resource_type}s found with the given tags.")
 
-            find_results = []
-            for resource in resources:
-
-                # Check if the resource has next available ip
-                if count > 1:
-                    check_result = self.find_next_available_ip(
-                        id=resource.id, resource_type=self.params["resource_type"], count=1
-                    )
-                    if not check_result:
-                        continue
-
-                remaining_count = count - len(find_results)
-
-                while len(find_results) < count:
-                    find_result = self.find_next_available_ip(
-                        id=resource.id, resource_type=self.params["resource_type"], count=remaining_count
-                    )
-
-                    if find_result:
-                        find_results.extend(find_result)
-                        break
-                    else:
-                        remaining_count -= 1
-                        if not remaining_count:
-                            break
-
+            try:
+                find_results = self.search_resources(resources, count, resource_type)
+            except ApiException as e:
+                self.fail_json(msg=f"Failed to execute command: {e.status} {e.reason} {e.body}")
             if len(find_results) < count:
                 self.fail_json(msg=f"Not enough available IPs found in {resource_type}s with the given tags.")
         else:
             find_results = self.find()
 
-        result["objects"] = [r.address for r in find_results]
+        result["objects"] = find_results
         self.exit_json(**result)
 
 
@@ -316,6 +406,7 @@ def main():
         count=dict(type="int", required=False, default=1),
         tag_filters=dict(type="dict", required=False),
         resource_type=dict(type="str", required=False, choices=["address_block", "subnet", "range"]),
+        max_concurrency=dict(type="int", required=False, default=4),
     )
 
     module = NextAvailableIPInfoModule(
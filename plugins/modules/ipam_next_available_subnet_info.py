@@ -13,6 +13,8 @@ module: ipam_next_available_subnet_info
 short_description: Retrieves the Next available subnet.
 description:
     - Retrieves the Next Available Subnet in the specified Address Block.
+    - The next available subnets are computed from the address blocks, subnets and ranges already in the address blocks, read at once, so any number of subnets can be requested.
+    - The first subnet is checked against the next available subnet returned by the API, and the module fails if they differ, e.g. if a network was created in the address block in the meantime.
 version_added: 1.0.0
 author: Infoblox Inc. (@infobloxopen)
 options:
@@ -28,7 +30,8 @@ options:
         required: true
     count:
         description:
-            - Number of address blocks to generate. Default 1 if not set. Maximum 20.
+            - Number of subnets to generate. Default 1 if not set.
+            - With O(tag_filters), the subnets are taken from the address blocks matching the tags, in the order returned by the API, until O(count) subnets are found.
         type: int
         required: false
         default: 1
@@ -37,6 +40,13 @@ options:
             - Filter dict to filter address blocks by tags
         type: dict
         required: false
+    max_concurrency:
+        description:
+            - The maximum number of result pages read at the same time, for the address blocks and their children.
+        type: int
+        default: 4
+        required: false
+        version_added: 1.3.0
 
 extends_documentation_fragment:
     - infoblox.universal_ddi.common
@@ -107,11 +117,9 @@ objects:
 """  # noqa: E501
 
 from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import UniversalDDIAnsibleModule
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.next_available import compute_next_available
 
 try:
-    import json
-    import re
-
     from ipam import AddressBlockApi
     from universal_ddi_client import ApiException
 except ImportError:
@@ -125,69 +133,28 @@ class NextAvailableSubnetInfoModule(UniversalDDIAnsibleModule):
         self._limit = 1000
 
         # Validate count parameter if provided
-        if (self.params["count"] is not None) and (self.params["count"] <= 0 or self.params["count"] > 20):
-            self.fail_json(msg="Parameter 'count' must be between 1 and 20")
+        if (self.params["count"] is not None) and self.params["count"] <= 0:
+            self.fail_json(msg="Parameter 'count' must be at least 1")
 
-    def find_subnet(self, id=None, count=None):
+    def find(self):
         try:
-            resp = AddressBlockApi(self.client).list_next_available_subnet(id=id, cidr=self.params["cidr"], count=count)
-            return resp.results
+            resp = AddressBlockApi(self.client).read(self.params["id"])
         except ApiException as e:
-            # If it's a "fewer than requested" error, extract available count
-            if e.status == 400:
-                available_count = self.extract_available_count_from_error(e.body)
-                return available_count
-            return None
+            self.fail_json(msg=f"Failed to execute command: {e.status} {e.reason} {e.body}")
 
-    def extract_available_count_from_error(self, error_body):
-        """
-        Extract the available count from an API error message.
+        return [resp.result]
 
-        This function parses the error response when the API returns an error about
-        having fewer available networks than requested.
-
-        :param error_body: The error response body from the API
-        :return: The number of available networks (int), or 0 if the count couldn't be extracted
+    def first_of(self, id):
+        """
+        Ask the API for the next available subnet of an address block, to check the computed ones.
         """
-        available_count = 0
         try:
-            # Parse the JSON error body
-            error_json = json.loads(error_body)
-            if "error" in error_json and len(error_json["error"]) > 0:
-                error_message = error_json["error"][0]["message"]
-
-                # Use regex to extract the number after "The available networks are: "
-                match = re.search(r"The available networks are: (\d+)", error_message)
-                if match:
-                    available_count = int(match.group(1))
-                else:
-                    # If regex fails send fail message
-                    self.fail_json(msg=f"{error_message}")
-
-        except (json.JSONDecodeError, KeyError, IndexError, ValueError) as parse_error:
-            self.fail_json(msg="Failed to parse error body: {parse_error}")
-
-        return available_count
-
-    def find(self):
-        all_results = []
-        offset = 0
-
-        while True:
-            try:
-                resp = AddressBlockApi(self.client).list_next_available_subnet(
-                    id=self.params["id"], cidr=self.params["cidr"], count=self.params["count"]
-                )
-                all_results.extend(resp.results)
-
-                if len(resp.results) < self._limit:
-                    break
-                offset += self._limit
-
-            except ApiException as e:
-                self.fail_json(msg=f"Failed to execute command: {e.status} {e.reason} {e.body}")
-
-        return all_results
+            resp = AddressBlockApi(self.client).list_next_available_subnet(id=id, cidr=self.params["cidr"], count=1)
+        except ApiException as e:
+            if e.status == 400:
+                return None
+            self.fail_json(msg=f"Failed to execute command: {e.status} {e.reason} {e.body}")
+        return resp.results[0].address if resp.results else None
 
     def run_command(self):
         result = dict(objects=[])
@@ -201,38 +168,26 @@ class NextAvailableSubnetInfoModule(UniversalDDIAnsibleModule):
             address_blocks = self.find_address_blocks_by_tags(self.params["tag_filters"])
             if not address_blocks:
                 self.fail_json(msg="No address block found with the given tags.")
-
-            find_results = []
-            for ab in address_blocks:
-                if len(find_results) >= count:
-                    break
-
-                remaining_count = count - len(find_results)
-                find_result = self.find_subnet(id=ab.id, count=remaining_count)
-
-                if isinstance(find_result, int):
-                    # We got back an available count from error parsing
-                    if find_result == 0:
-                        # No addresses available in this block
-                        continue
-                    elif find_result < remaining_count:
-                        # We got fewer than requested, so we need to adjust the count
-                        # and try to find more subnets
-                        find_results.extend(self.find_subnet(id=ab.id, count=find_result))
-
-                elif find_result:
-                    # We got the requested results
-                    find_results.extend(find_result)
-
-            if len(find_results) == 0:
-                self.fail_json(msg="No subnets available with the given tags and CIDR.")
-            # Add warning if we couldn't find all requested address blocks
-            if len(find_results) < count:
-                self.fail_json(msg=f"Requested {count} subnets but only {len(find_results)} were available")
         else:
-            find_results = self.find()
+            address_blocks = self.find()
 
-        result["objects"] = [r.address for r in find_results]
+        try:
+            find_results = compute_next_available(
+                address_blocks,
+                self.find_children,
+                self.params["cidr"],
+                count,
+                "The next available subnet cidr value must be greater than parent and between 1 and {bits}.",
+                first_of=self.first_of,
+            )
+        except ValueError as e:
+            self.fail_json(msg=str(e))
+        if len(find_results) == 0:
+            self.fail_json(msg="No subnets available with the given tags and CIDR.")
+        if len(find_results) < count:
+            self.fail_json(msg=f"Requested {count} subnets but only {len(find_results)} were available")
+
+        result["objects"] = find_results
         self.exit_json(**result)
 
 
@@ -243,6 +198,7 @@ def main():
         cidr=dict(type="int", required=True),
         count=dict(type="int", required=False, default=1),
         tag_filters=dict(type="dict", required=False),
+        max_concurrency=dict(type="int", required=False, default=4),
     )
 
     module = NextAvailableSubnetInfoModule(
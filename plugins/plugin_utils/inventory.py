@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Infoblox, Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.errors import AnsibleError
+from ansible_collections.infoblox.universal_ddi.plugins.module_utils.modules import (
+    HAS_UNIVERSAL_DDI_CLIENT,
+    get_client,
+    iter_objects,
+)
+
+try:
+    from universal_ddi_client import ApiException
+except ImportError:
+    pass  # Handled by HAS_UNIVERSAL_DDI_CLIENT
+
+
+def filter_query(filters, query):
+    """
+    Build a filter expression from a dict of values to match, as the info modules do.
+
+    :param filters: Dictionary of field names and values, or None
+    :param query: Filter expression used if filters is not set
+    """
+    if filters:
+        return " and ".join([f"{k}=='{v}'" for k, v in filters.items()])
+    return query
+
+
+def inventory_client(plugin):
+    """
+    Get the API client for the connection options of an inventory plugin.
+    """
+    if not HAS_UNIVERSAL_DDI_CLIENT:
+        raise AnsibleError(f"The {plugin.NAME} inventory plugin requires the universal_ddi_client library")
+
+    return get_client(
+        dict(
+            portal_url=plugin.get_option("portal_url"),
+            portal_key=plugin.get_option("portal_key"),
+            max_retries=plugin.get_option("max_retries"),
+            pool_size=max(10, 2 * plugin.get_option("max_concurrency")),
+        )
+    )
+
+
+def list_concurrently(requests, max_concurrency=1):
+    """
+    Read all objects of several list API calls at the same time, each with up to max_concurrency pages in flight.
+
+    :param requests: Dictionary of names and (list_func, kwargs) tuples, kwargs being passed to iter_objects
+    :param max_concurrency: Maximum number of pages fetched at the same time for each list API call
+    :return: Dictionary of the same names and the lists of objects
+    :raises AnsibleError: if any of the calls fails
+    """
+
+    def _list(request):
+        list_func, kwargs = request
+        return list(iter_objects(list_func, limit=1000, max_concurrency=max_concurrency, **kwargs))
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, len(requests))) as executor:
+            futures = {name: executor.submit(_list, request) for name, request in requests.items()}
+            return {name: future.result() for name, future in futures.items()}
+    except ApiException as e:
+        raise AnsibleError(f"Failed to execute command: {e.status} {e.reason} {e.body}")